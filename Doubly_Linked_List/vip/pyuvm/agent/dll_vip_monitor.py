@@ -7,8 +7,10 @@ Monitor for Doubly Linked List VIP - observes DUT signals
 
 from pyuvm import *
 import cocotb
-from cocotb.triggers import RisingEdge
-from ..common.dll_vip_seq_item import DllVipSeqItem
+from tbutils.snapshot import Snapshot
+from tbutils.tblog import lazy
+from tbutils.txn import BatchWriter, TxnPool
+from ..common.dll_vip_seq_item import DllVipTxn
 from ..common.dll_vip_types import DllOp
 from ..common.dll_vip_config import DllVipConfig
 
@@ -21,57 +23,65 @@ class DllVipMonitor(uvm_monitor):
         self.dut = None
         self.cfg = None
         self.ap = uvm_analysis_port("ap", self)
+        self.pool = TxnPool(DllVipTxn)  # records go back to the pool once the subscribers returned
+        self.out = None
 
     def build_phase(self):
         super().build_phase()
         self.cfg = ConfigDB().get(self, "", "dll_vip_cfg")
         if self.cfg is None:
             self.logger.error("No config object found")
+        self.out = BatchWriter(self.ap, self.cfg.batch_size, self.pool)
 
     async def run_phase(self):
         await self.get_dut()
 
+        # Edges without op_start (or op_done while waiting) are not sampled
+        issue = Snapshot(self.dut, ("op", "data_in", "addr_in"), self.dut.clk, qualifier="op_start",
+                         name="DllIssue")
+        result = Snapshot(self.dut, ("data_out", "pre_node_addr", "next_node_addr", "fault", "length", "head", "tail"),
+                          self.dut.clk, qualifier="op_done", name="DllResult")
         while True:
-            await RisingEdge(self.dut.clk)
+            s = await issue.next()
+            item = self.pool.acquire()
 
-            # Detect operation when op_start is asserted
-            if self.dut.op_start.value:
-                item = DllVipSeqItem("monitored_item")
+            # Capture operation type
+            op_val = s.op
+            op_map = {
+                0: DllOp.READ_ADDR,
+                1: DllOp.INSERT_AT_ADDR,
+                2: DllOp.DELETE_VALUE,
+                3: DllOp.DELETE_AT_ADDR,
+                4: DllOp.IDLE,
+                5: DllOp.INSERT_AT_INDEX,
+                7: DllOp.DELETE_AT_INDEX
+            }
+            item.op = op_map.get(op_val, DllOp.IDLE)
 
-                # Capture operation type
-                op_val = int(self.dut.op.value)
-                op_map = {
-                    0: DllOp.READ_ADDR,
-                    1: DllOp.INSERT_AT_ADDR,
-                    2: DllOp.DELETE_VALUE,
-                    3: DllOp.DELETE_AT_ADDR,
-                    4: DllOp.IDLE,
-                    5: DllOp.INSERT_AT_INDEX,
-                    7: DllOp.DELETE_AT_INDEX
-                }
-                item.op = op_map.get(op_val, DllOp.IDLE)
+            # Capture inputs
+            item.data = s.data_in
+            item.addr = s.addr_in
 
-                # Capture inputs
-                item.data = int(self.dut.data_in.value)
-                item.addr = int(self.dut.addr_in.value)
+            # Wait for operation to complete
+            r = await result.next()
 
-                # Wait for operation to complete
-                await RisingEdge(self.dut.clk)
-                while not self.dut.op_done.value:
-                    await RisingEdge(self.dut.clk)
+            # Capture outputs (both prev and next for doubly linked)
+            item.result_data = r.data_out
+            item.result_pre_addr = r.pre_node_addr
+            item.result_next_addr = r.next_node_addr
+            item.op_done = True
+            item.fault = bool(r.fault)
+            item.current_len = r.length
+            item.current_head = r.head
+            item.current_tail = r.tail
 
-                # Capture outputs (both prev and next for doubly linked)
-                item.result_data = int(self.dut.data_out.value)
-                item.result_pre_addr = int(self.dut.pre_node_addr.value)
-                item.result_next_addr = int(self.dut.next_node_addr.value)
-                item.op_done = bool(self.dut.op_done.value)
-                item.fault = bool(self.dut.fault.value)
-                item.current_len = int(self.dut.length.value)
-                item.current_head = int(self.dut.head.value)
-                item.current_tail = int(self.dut.tail.value)
+            self.logger.debug("Observed %s: %s", item.op.name, lazy(item.convert2string))
+            self.out.write(item, flush=item.fault)  # a faulted operation goes out without waiting for the block
 
-                self.ap.write(item)
-                self.logger.debug(f"Observed {item.op.name}: {item.convert2string()}")
+    def extract_phase(self):
+        """End of test: deliver the last block"""
+        super().extract_phase()
+        self.out.flush()
 
     async def get_dut(self):
         """Get DUT handle from ConfigDB"""
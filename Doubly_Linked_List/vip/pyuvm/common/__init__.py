@@ -5,10 +5,11 @@ Contains configuration, types, and sequence item definitions
 
 from .dll_vip_types import DllOp
 from .dll_vip_config import DllVipConfig
-from .dll_vip_seq_item import DllVipSeqItem
+from .dll_vip_seq_item import DllVipSeqItem, DllVipTxn
 
 __all__ = [
     'DllOp',
     'DllVipConfig',
     'DllVipSeqItem',
+    'DllVipTxn',
 ]
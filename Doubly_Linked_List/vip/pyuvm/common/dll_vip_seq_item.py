@@ -6,6 +6,7 @@ Transaction item for Doubly Linked List operations
 """
 
 from pyuvm import *
+from tbutils.txn import Txn
 import random
 from .dll_vip_types import DllOp
 
@@ -64,3 +65,13 @@ class DllVipSeqItem(uvm_sequence_item):
         return (f"Op:{self.op.name} Data:0x{self.data:x} Addr:{self.addr} "
                 f"Result:0x{self.result_data:x} Done:{self.op_done} "
                 f"Fault:{self.fault} Len:{self.current_len}")
+
+
+class DllVipTxn(Txn):
+    """Monitored Doubly Linked List transaction, pooled by the monitor, to_item() gives a DllVipSeqItem"""
+
+    __slots__ = ("op", "data", "addr", "result_data", "result_pre_addr", "result_next_addr", "op_done", "fault",
+                 "current_len", "current_head", "current_tail")
+    defaults = (DllOp.READ_ADDR, 0, 0, 0, 0, 0, False, False, 0, 0, 0)
+    item_type = DllVipSeqItem
+    convert2string = DllVipSeqItem.convert2string
@@ -7,6 +7,9 @@ Note: Tracks both prev and next pointers for doubly linked list
 """
 
 from pyuvm import *
+from tbutils.linked_list_model import LinkedListModel
+from tbutils.tblog import OpsLog, lazy
+from tbutils.txn import TxnBatch
 from ..common.dll_vip_seq_item import DllVipSeqItem
 from ..common.dll_vip_types import DllOp
 from ..common.dll_vip_config import DllVipConfig
@@ -20,19 +23,18 @@ class DllVipScoreboard(uvm_scoreboard):
         self.imp = uvm_analysis_export("imp", self)
         self.cfg = None
 
-        # Reference model: queues to track list data and addresses
-        self.list_data = []
-        self.list_addr = []
-        self.expected_length = 0
-        self.expected_head = 0
-        self.expected_tail = 0
+        # Reference model: node table shared with the cocotb TB (Utils/tb/tbutils),
+        # allocates addresses like the RTL, sized from the config in build_phase
+        self.model = None
         self.error_count = 0
+        self.ops = OpsLog(self.logger, "scoreboard")
 
     def build_phase(self):
         super().build_phase()
         self.cfg = ConfigDB().get(self, "", "dll_vip_cfg")
         if self.cfg is None:
             self.logger.error("No config object found")
+        self.model = LinkedListModel(self.cfg.MAX_NODE, doubly=True)
 
     def connect_phase(self):
         super().connect_phase()
@@ -40,7 +42,9 @@ class DllVipScoreboard(uvm_scoreboard):
 
     def write(self, item):
         """Analysis write method - called by monitor"""
-        self.logger.info(f"Checking: {item.convert2string()}")
+        if type(item) is TxnBatch:
+            return self.write_batch(item)
+        self.ops.info(item.op.name.lower(), "Checking: %s", lazy(item.convert2string))
 
         if item.op == DllOp.INSERT_AT_ADDR:
             self.check_insert_at_addr(item)
@@ -58,95 +62,74 @@ class DllVipScoreboard(uvm_scoreboard):
             self.logger.debug("IDLE operation, no checking")
 
         # Check list state
-        if item.current_len != self.expected_length:
-            self.logger.error(f"Length mismatch: expected={self.expected_length}, actual={item.current_len}")
+        if item.current_len != len(self.model):
+            self.logger.error(f"Length mismatch: expected={len(self.model)}, actual={item.current_len}")
             self.error_count += 1
 
+    def write_batch(self, batch):
+        """Block of transactions from a batching monitor (TB_BATCH), checked in order against the model"""
+        write = self.write
+        for item in batch:
+            write(item)
+
     def check_insert_at_addr(self, item):
         """Check INSERT_AT_ADDR operation"""
         if item.fault:
-            self.logger.info("Insert at addr faulted (expected for invalid addr)")
+            self.ops.info("fault", "Insert at addr faulted (expected for invalid addr)")
             return
 
-        idx = -1
-        for i, addr in enumerate(self.list_addr):
-            if addr == item.addr:
-                idx = i
-                break
-
-        if item.addr == 0 or idx == -1:
-            self.list_data.insert(0, item.data)
-            self.list_addr.insert(0, self.expected_length + 1 if item.addr == 0 else item.addr)
-            self.expected_head = self.list_addr[0]
+        # Insert in front of the node at addr, an out of range addr pushes back
+        if item.addr >= self.model.addr_null:
+            new_addr = self.model.insert_by_addr(-1, item.data)
+        elif item.addr in self.model:
+            new_addr = self.model.insert_by_addr(item.addr, item.data)
         else:
-            self.list_data.insert(idx + 1, item.data)
-            self.list_addr.insert(idx + 1, self.expected_length + 1)
-
-        if len(self.list_data) == 1:
-            self.expected_tail = self.list_addr[0]
-        else:
-            self.expected_tail = self.list_addr[-1]
+            self.logger.error(f"Insert accepted at addr={item.addr}, not allocated in the model")
+            self.error_count += 1
+            return
 
-        self.expected_length += 1
-        self.logger.debug(f"Inserted data=0x{item.data:x} at addr={item.addr}")
+        if new_addr is None:
+            self.logger.error(f"Insert accepted while list is full (MAX_NODE={self.model.max_node})")
+            self.error_count += 1
+            return
+        self.logger.debug("Inserted data=0x%x at addr=%s", item.data, new_addr)
 
     def check_insert_at_index(self, item):
         """Check INSERT_AT_INDEX operation"""
         if item.fault:
-            self.logger.info("Insert at index faulted (expected for invalid index)")
+            self.ops.info("fault", "Insert at index faulted (expected for invalid index)")
             return
 
-        if item.addr >= len(self.list_data):
-            self.list_data.append(item.data)
-            self.list_addr.append(self.expected_length + 1)
-            self.expected_tail = self.list_addr[-1]
-        else:
-            self.list_data.insert(item.addr, item.data)
-            self.list_addr.insert(item.addr, self.expected_length + 1)
-
-        if len(self.list_data) == 1:
-            self.expected_head = self.list_addr[0]
-            self.expected_tail = self.list_addr[0]
-
-        self.expected_length += 1
-        self.logger.debug(f"Inserted data=0x{item.data:x} at index={item.addr}")
+        new_addr = self.model.insert_by_index(item.addr, item.data)
+        if new_addr is None:
+            self.logger.error(f"Insert accepted while list is full (MAX_NODE={self.model.max_node})")
+            self.error_count += 1
+            return
+        self.logger.debug("Inserted data=0x%x at index=%s", item.data, item.addr)
 
     def check_read_addr(self, item):
         """Check READ_ADDR operation - verify both prev and next pointers"""
         if item.fault:
-            self.logger.info("Read faulted (expected for invalid addr)")
+            self.ops.info("fault", "Read faulted (expected for invalid addr)")
             return
 
-        idx = -1
-        for i, addr in enumerate(self.list_addr):
-            if addr == item.addr:
-                idx = i
-                break
-
-        if idx != -1:
-            if item.result_data != self.list_data[idx]:
-                self.logger.error(f"Read data mismatch at addr={item.addr}: expected=0x{self.list_data[idx]:x}, actual=0x{item.result_data:x}")
+        if item.addr in self.model:
+            expected = self.model.read_by_addr(item.addr)
+            if item.result_data != expected:
+                self.logger.error(f"Read data mismatch at addr={item.addr}: expected=0x{expected:x}, actual=0x{item.result_data:x}")
                 self.error_count += 1
 
             # Check prev pointer (doubly linked)
-            if idx > 0:
-                if item.result_pre_addr != self.list_addr[idx - 1]:
-                    self.logger.error(f"Prev addr mismatch: expected={self.list_addr[idx - 1]}, actual={item.result_pre_addr}")
-                    self.error_count += 1
-            else:
-                if item.result_pre_addr != 0:
-                    self.logger.error(f"Expected pre_addr=0 for head, got {item.result_pre_addr}")
-                    self.error_count += 1
+            exp_prev = self.model.prev_addr(item.addr)
+            if item.result_pre_addr != exp_prev:
+                self.logger.error(f"Prev addr mismatch: expected={exp_prev}, actual={item.result_pre_addr}")
+                self.error_count += 1
 
             # Check next pointer
-            if idx < len(self.list_addr) - 1:
-                if item.result_next_addr != self.list_addr[idx + 1]:
-                    self.logger.error(f"Next addr mismatch: expected={self.list_addr[idx + 1]}, actual={item.result_next_addr}")
-                    self.error_count += 1
-            else:
-                if item.result_next_addr != 0:
-                    self.logger.error(f"Expected next_addr=0 for tail, got {item.result_next_addr}")
-                    self.error_count += 1
+            exp_next = self.model.next_addr(item.addr)
+            if item.result_next_addr != exp_next:
+                self.logger.error(f"Next addr mismatch: expected={exp_next}, actual={item.result_next_addr}")
+                self.error_count += 1
         else:
             self.logger.error(f"Address {item.addr} not found in model")
             self.error_count += 1
@@ -154,78 +137,39 @@ class DllVipScoreboard(uvm_scoreboard):
     def check_delete_value(self, item):
         """Check DELETE_VALUE operation"""
         if item.fault:
-            self.logger.info("Delete value faulted (value not found)")
+            self.ops.info("fault", "Delete value faulted (value not found)")
             return
 
-        idx = -1
-        for i, data in enumerate(self.list_data):
-            if data == item.data:
-                idx = i
-                break
-
-        if idx != -1:
-            del self.list_data[idx]
-            del self.list_addr[idx]
-            self.expected_length -= 1
-
-            if len(self.list_data) == 0:
-                self.expected_head = 0
-                self.expected_tail = 0
-            else:
-                self.expected_head = self.list_addr[0]
-                self.expected_tail = self.list_addr[-1]
-            self.logger.debug(f"Deleted value=0x{item.data:x}")
+        if self.model.delete_by_value(item.data) is not None:
+            self.logger.debug("Deleted value=0x%x", item.data)
 
     def check_delete_at_addr(self, item):
         """Check DELETE_AT_ADDR operation"""
         if item.fault:
-            self.logger.info("Delete at addr faulted (invalid addr)")
+            self.ops.info("fault", "Delete at addr faulted (invalid addr)")
             return
 
-        idx = -1
-        for i, addr in enumerate(self.list_addr):
-            if addr == item.addr:
-                idx = i
-                break
-
-        if idx != -1:
-            del self.list_data[idx]
-            del self.list_addr[idx]
-            self.expected_length -= 1
-
-            if len(self.list_data) == 0:
-                self.expected_head = 0
-                self.expected_tail = 0
-            else:
-                self.expected_head = self.list_addr[0]
-                self.expected_tail = self.list_addr[-1]
-            self.logger.debug(f"Deleted at addr={item.addr}")
+        if item.addr in self.model:
+            self.model.delete_by_addr(item.addr)
+            self.logger.debug("Deleted at addr=%s", item.addr)
 
     def check_delete_at_index(self, item):
         """Check DELETE_AT_INDEX operation"""
         if item.fault:
-            self.logger.info("Delete at index faulted (invalid index)")
+            self.ops.info("fault", "Delete at index faulted (invalid index)")
             return
 
-        if item.addr < len(self.list_data):
-            del self.list_data[item.addr]
-            del self.list_addr[item.addr]
-            self.expected_length -= 1
-
-            if len(self.list_data) == 0:
-                self.expected_head = 0
-                self.expected_tail = 0
-            else:
-                self.expected_head = self.list_addr[0]
-                self.expected_tail = self.list_addr[-1]
-            self.logger.debug(f"Deleted at index={item.addr}")
+        if item.addr < len(self.model):
+            self.model.remove(item.addr)
+            self.logger.debug("Deleted at index=%s", item.addr)
 
     def report_phase(self):
         """Report statistics"""
         super().report_phase()
         self.logger.info("=" * 50)
         self.logger.info(f"Error Count: {self.error_count}")
-        self.logger.info(f"Final List Size: {len(self.list_data)}")
+        self.logger.info(f"Final List Size: {len(self.model)}")
+        self.ops.report()
         self.logger.info("=" * 50)
 
         if self.error_count > 0:
@@ -43,4 +43,4 @@ class DllVipDeleteSeq(DllVipBaseSeq):
             await self.start_item(item)
             await self.finish_item(item)
 
-            self.logger.info(f"Delete #{i}: {op.name} addr/data={item.addr}/{item.data}")
+            self.logger.info("Delete #%s: %s addr/data=%s/%s", i, op.name, item.addr, item.data)
@@ -33,4 +33,4 @@ class DllVipInsertSeq(DllVipBaseSeq):
             await self.start_item(item)
             await self.finish_item(item)
 
-            self.logger.info(f"Insert #{i}: data=0x{item.data:x} addr={item.addr}")
+            self.logger.info("Insert #%s: data=0x%x addr=%s", i, item.data, item.addr)
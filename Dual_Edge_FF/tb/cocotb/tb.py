@@ -7,6 +7,8 @@ from cocotb.clock import Clock
 from cocotb_bus.drivers import BusDriver
 from cocotb_bus.monitors import BusMonitor
 from cocotb.binary import BinaryValue
+from tbutils.tblog import OpsLog, get_logger
+from tbutils.clocked import ClockedIf
 
 #BIN string
 #BinaryValue(dut.data_wr.value, n_bits=8) ; BinaryValue.integar ; BinaryValue.hex ; BinaryValue.binstr; BinaryValue.signed_integer ; can represent x,z
@@ -18,6 +20,7 @@ TB_SIM_TIMEOUT = 30 # TB sim timeout 30ms
 TB_TEST_WEIGHT = 1
 
 err_cnt = 0
+ops = OpsLog(get_logger("dual_edge_ff"), "dual_edge_ff")
 
 #    dual_edge_ff #(
 #         .DATA_WIDTH(DUT_DATA_WIDTH),   
@@ -36,6 +39,7 @@ async def dut_init(dut):
     global DUT_RESET_VALUE # DUT parameter
     DUT_DATA_WIDTH = dut.DATA_WIDTH.value
     DUT_RESET_VALUE = dut.RESET_VALUE.value
+    ops.reset()
     await cocotb.start(Clock(dut.clk, TB_CLK_PERIOD, units="ns").start())
     dut.data_in.value = 0
     dut.pos_edge_latch_en.value = 0
@@ -51,6 +55,7 @@ async def direct_test(dut):
     global err_cnt
     await dut_init(dut)
     cocotb.log.info("SEED NUMBER = %d",cocotb.RANDOM_SEED)
+    clk_if = ClockedIf(dut.clk) # both edges, outputs checked once the edge has settled
 
     for j in range(TB_TEST_WEIGHT):
         for i in range(20):
@@ -58,42 +63,36 @@ async def direct_test(dut):
             match k:
                 case 0: # positive edge only 
                     input_data = random.randint(0, 2**DUT_DATA_WIDTH)
-                    await FallingEdge(dut.clk)
-                    await Timer(1, units='ns')
+                    await clk_if.fall()
                     dut.data_in.value = input_data
                     dut.pos_edge_latch_en.value = 2**DUT_DATA_WIDTH - 1
-                    await RisingEdge(dut.clk)
-                    await(Timer(1, units='ns'))
+                    await clk_if.cycle()
                     if(dut.data_out.value != input_data):
                         cocotb.log.error("Data out is incorrect at posedge, EXP: %0d, ACT: %0d", input_data, dut.data_out.value)
                         err_cnt += 1
                     else:
-                        cocotb.log.info("Data out is correct at posedge with value %0d", dut.data_out.value)
+                        ops.info("posedge", "Data out is correct at posedge with value %0d", dut.data_out.value)
                     
                     dut.data_in.value = input_data + 1
-                    await FallingEdge(dut.clk)
-                    await(Timer(1, units='ns'))
+                    await clk_if.fall()
                     if(dut.data_out.value != input_data):
                         cocotb.log.error("Data out is incorrect, should not be updated at negedge, EXP: %0d, ACT: %0d", input_data + 1, dut.data_out.value)
                         err_cnt += 1
                     dut.pos_edge_latch_en.value = 0
                 case 1: # negative edge only
                     input_data = random.randint(0, 2**DUT_DATA_WIDTH)
-                    await RisingEdge(dut.clk)
-                    await Timer(1, units='ns')
+                    await clk_if.cycle()
                     dut.data_in.value = input_data
                     dut.neg_edge_latch_en.value = 2**DUT_DATA_WIDTH - 1
-                    await FallingEdge(dut.clk)
-                    await(Timer(1, units='ns'))
+                    await clk_if.fall()
                     if(dut.data_out.value != input_data):
                         cocotb.log.error("Data out is incorrect at negedge, EXP: %0d, ACT: %0d", input_data, dut.data_out.value)
                         err_cnt += 1
                     else:
-                        cocotb.log.info("Data out is correct at negedge with value %0d", dut.data_out.value)
+                        ops.info("negedge", "Data out is correct at negedge with value %0d", dut.data_out.value)
 
                     dut.data_in.value = input_data + 1
-                    await RisingEdge(dut.clk)
-                    await(Timer(1, units='ns'))
+                    await clk_if.cycle()
                     if(dut.data_out.value != input_data):
                         cocotb.log.error("Data out is incorrect, should not be updated at posedge, EXP: %0d, ACT: %0d", input_data + 1, dut.data_out.value)
                         err_cnt += 1
@@ -101,32 +100,31 @@ async def direct_test(dut):
                 
                 case 2: # both edges
                     input_data = random.randint(0, 2**DUT_DATA_WIDTH)
-                    await FallingEdge(dut.clk)
-                    await Timer(1, units='ns')
+                    await clk_if.fall()
                     dut.data_in.value = input_data
                     dut.pos_edge_latch_en.value = 2**DUT_DATA_WIDTH - 1
                     dut.neg_edge_latch_en.value = 2**DUT_DATA_WIDTH - 1
-                    await RisingEdge(dut.clk)
-                    await(Timer(1, units='ns'))
+                    await clk_if.cycle()
                     if(dut.data_out.value != input_data):
                         cocotb.log.error("Data out is incorrect at posedge, EXP: %0d, ACT: %0d", input_data, dut.data_out.value)
                         err_cnt += 1
                     else:
-                        cocotb.log.info("Data out is correct at posedge with value %0d", dut.data_out.value)
+                        ops.info("posedge", "Data out is correct at posedge with value %0d", dut.data_out.value)
 
                     input_data = random.randint(0, 2**DUT_DATA_WIDTH)
                     dut.data_in.value = input_data 
-                    await FallingEdge(dut.clk)
-                    await(Timer(1, units='ns'))
+                    await clk_if.fall()
                     if(dut.data_out.value != input_data):
                         cocotb.log.error("Data out is incorrect at negedge, EXP: %0d, ACT: %0d", input_data, dut.data_out.value)
                         err_cnt += 1
                     else:
-                        cocotb.log.info("Data out is correct at negedge with value %0d", dut.data_out.value)
+                        ops.info("negedge", "Data out is correct at negedge with value %0d", dut.data_out.value)
 
                     dut.pos_edge_latch_en.value = 0
                     dut.neg_edge_latch_en.value = 0
     
+    ops.report()
+    
     if (err_cnt > 0):
         cocotb.log.error("Errors count = %d",err_cnt)
         #cocotb.result.test_fail()
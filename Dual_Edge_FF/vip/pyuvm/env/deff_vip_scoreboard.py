@@ -1,5 +1,6 @@
 """Dual Edge FF VIP Scoreboard - tracks FF state"""
 from pyuvm import *
+from tbutils.tblog import OpsLog, lazy
 
 class DeffVipScoreboard(uvm_scoreboard):
     def __init__(self, name, parent):
@@ -7,6 +8,7 @@ class DeffVipScoreboard(uvm_scoreboard):
         self.imp = uvm_analysis_export("imp", self)
         self.ff_state = 0  # Current FF state
         self.error_count = 0
+        self.ops = OpsLog(self.logger, "scoreboard")
 
     def connect_phase(self):
         super().connect_phase()
@@ -16,7 +18,7 @@ class DeffVipScoreboard(uvm_scoreboard):
         """Check dual-edge FF behavior"""
         # Simple scoreboard: just log transactions
         # Full model would track pos/neg edge latching per bit
-        self.logger.info(f"Transaction: {item.convert2string()}")
+        self.ops.info("transaction", "Transaction: %s", lazy(item.convert2string))
 
         # Could implement detailed per-bit checking here
         # For now, just verify data was captured
@@ -28,6 +30,7 @@ class DeffVipScoreboard(uvm_scoreboard):
         self.logger.info("="*50)
         self.logger.info(f"Final FF State: 0x{self.ff_state:x}")
         self.logger.info(f"Error Count: {self.error_count}")
+        self.ops.report()
         if self.error_count == 0:
             self.logger.info("Test PASSED")
         else:
@@ -1,5 +1,6 @@
 """Dual Edge FF VIP Random Sequence"""
 from pyuvm import *
+from tbutils.tblog import lazy
 from .deff_vip_base_seq import DeffVipBaseSeq
 from ..common.deff_vip_seq_item import DeffVipSeqItem
 
@@ -16,4 +17,4 @@ class DeffVipRandomSeq(DeffVipBaseSeq):
             item.randomize()
             await self.start_item(item)
             await self.finish_item(item)
-            self.logger.info(f"Trans #{i}: {item.convert2string()}")
+            self.logger.info("Trans #%s: %s", i, lazy(item.convert2string))
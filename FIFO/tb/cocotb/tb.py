@@ -1,21 +1,35 @@
+import os
 import random
+from bisect import bisect_left
 #import asyncio
 import cocotb
-from cocotb.triggers import Timer, RisingEdge
-from cocotb.clock import Clock
+from cocotb.triggers import Timer, RisingEdge, with_timeout
+from cocotb.utils import get_sim_time
 from cocotb.result import TestFailure
+from tbutils.waves import WaveControl
+from tbutils.tblog import OpsLog, get_logger
+from tbutils.bench import percentiles, write_result
+from tbutils.clocks import ClockStress, PhaseCoverage
+from tbutils.clocked import ClockedIf
+from fifo_model import FifoModel
 
 DEPTH = 12 # DUT parameter
 DATA_WIDTH = 8 # DUT paramter
 ASYNC = 1 # DUT parameter
 RD_BUFFER = 1 # DUT parameter
 TEST_WEIGHT = 1 # TB multiplier for stimulus injected
-WR_CLK_PERIOD = 20 # TB wr_clk generator
-RD_CLK_PERIOD = 32 # TB rd_clk generator
+WR_CLK_PERIOD = int(os.environ.get("WR_CLK_PERIOD", 20)) # TB wr_clk generator, make WR_CLK_PERIOD=10
+RD_CLK_PERIOD = int(os.environ.get("RD_CLK_PERIOD", 32)) # TB rd_clk generator, make RD_CLK_PERIOD=16
+BENCH_WORDS = int(os.environ.get("BENCH_WORDS", 2000)) # words streamed by fifo_bench_test
+BENCH_SUSTAIN = float(os.environ.get("BENCH_SUSTAIN", 0.98)) # fraction of the slower clock rate counted as sustained
 #SIM_TIMEOUT = 100000; // TB simulation time out
 BURST_LENGHT = DEPTH
 MAX_DATA = 2**DATA_WIDTH - 1
 err_cnt = 0
+waves = WaveControl() # WAVES_TRIGGER=1 dumps from the first error on
+ops = OpsLog(get_logger("fifo"), "fifo")
+stress = ClockStress.from_env() # make CDC_STRESS=1: random period/phase, jitter and drift on both clocks
+wr_if = rd_if = None # ClockedIf of wr_clk/rd_clk, drive and check points of the burst helpers
 
 # fifo #(
 # .DEPTH(DEPTH), 
@@ -39,14 +53,21 @@ async def dut_init(dut):
     global RD_BUFFER
     global MAX_DATA
     global BURST_LENGHT
+    global wr_if
+    global rd_if
     DEPTH = dut.DEPTH.value 
     DATA_WIDTH = dut.DATA_WIDTH.value
     ASYNC = dut.ASYNC.value
     RD_BUFFER = dut.RD_BUFFER.value
     MAX_DATA = 2**DATA_WIDTH - 1
     BURST_LENGHT = DEPTH
-    await cocotb.start(Clock(dut.wr_clk, WR_CLK_PERIOD, units="ns").start())
-    await cocotb.start(Clock(dut.rd_clk, RD_CLK_PERIOD, units="ns").start())
+    ops.reset()
+    if(stress.enabled):
+        dut._log.info("%s, rerun with CDC_SEED=%d", stress, stress.seed)
+    await cocotb.start(stress.clock(dut.wr_clk, WR_CLK_PERIOD, "ns", "wr_clk").start())
+    await cocotb.start(stress.clock(dut.rd_clk, RD_CLK_PERIOD, "ns", "rd_clk").start())
+    wr_if = ClockedIf(dut.wr_clk, None if stress.enabled else WR_CLK_PERIOD)
+    rd_if = ClockedIf(dut.rd_clk, None if stress.enabled else RD_CLK_PERIOD)
     dut.rst.value = 1
     await(Timer(1000,'ns'))
     dut.rst.value = 0
@@ -55,113 +76,111 @@ async def dut_init(dut):
 async def fifo_write_burst_rand(count,dut,fifo_expected):
     global err_cnt
     for i in range(count):
-        await RisingEdge(dut.wr_clk)
-        await(Timer(1,'ns'))
-        if(len(fifo_expected) < DEPTH and dut.fifo_full.value == 1):
+        await wr_if.cycle()
+        if(not fifo_expected.full and dut.fifo_full.value == 1):
             dut._log.error("FIFO is not full but fifo_full flag is asserted")
         dut.wr_en.value = 1
         data_wr_rand = random.randint(0,MAX_DATA)
         dut.data_wr.value = data_wr_rand
-        if(len(fifo_expected) < DEPTH):
-            fifo_expected.append(data_wr_rand)
-            dut._log.info("Data written = %d, FIFO entry = %d", data_wr_rand, len(fifo_expected))
+        if(fifo_expected.write(data_wr_rand)):
+            ops.info("write", "Data written = %d, FIFO entry = %d", data_wr_rand, len(fifo_expected))
         else:
-            await(Timer(1,'ns'))
+            await wr_if.settle()
             if(dut.fifo_full.value == 1):
-                dut._log.info("FIFO is full, fifo_full flag is asserted correctly")
+                ops.info("full", "FIFO is full, fifo_full flag is asserted correctly")
             else:
                 dut._log.error("FIFO is full but fifo_full flag is not asserted")
                 err_cnt += 1
-    await RisingEdge(dut.wr_clk)
-    await(Timer(1,'ns'))
+                waves.trigger("first error")
+    await wr_if.cycle()
     dut.wr_en.value = 0
 
 
 async def fifo_read_burst(count,dut,fifo_expected):
     global err_cnt
     rd_init = 0
-    await RisingEdge(dut.rd_clk)
-    await Timer(1,'ns')
+    await rd_if.cycle()
     dut.rd_en.value = 1
     if(RD_BUFFER == 0):
-        await Timer(1,'ns')
+        await rd_if.settle() # data_rd follows rd_en combinationally
         if(len(fifo_expected)>0):
             if(dut.fifo_empty.value == 1):
                 dut._log.error("FIFO is not empty but fifo_empty flag is asserted")
                 err_cnt += 1
-            data_rd_exp = fifo_expected.pop(0)
+                waves.trigger("first error")
+            data_rd_exp = fifo_expected.read()
             data_rd_act = dut.data_rd.value.integer
             if(data_rd_exp == data_rd_act):
-                dut._log.info("Data read = %d, FIFO entry = %d", data_rd_act, len(fifo_expected))
+                ops.info("read", "Data read = %d, FIFO entry = %d", data_rd_act, len(fifo_expected))
             else:
                 dut._log.error("Data read mismatch, ACT = %d, EXP = %d", data_rd_act, data_rd_exp)
                 err_cnt += 1
+                waves.trigger("first error")
         else:
             if(dut.fifo_empty.value == 1):
-                dut._log.info("FIFO is empty, fifo_empty flag is asserted correctly")
+                ops.info("empty", "FIFO is empty, fifo_empty flag is asserted correctly")
             else:
                 dut._log.error("FIFO is empty but fifo_empty flag is not asserted")
                 err_cnt += 1
+                waves.trigger("first error")
     for i in range(count):
-        await RisingEdge(dut.rd_clk)
-        await Timer(1,'ns')
+        await rd_if.cycle()
         if(len(fifo_expected)>0):
             if(dut.fifo_empty.value == 1):
                 if(len(fifo_expected) == 1):
-                    dut._log.info("FIFO is empty, fifo_empty flag is asserted correctly")
+                    ops.info("empty", "FIFO is empty, fifo_empty flag is asserted correctly")
                 else:
                     dut._log.error("FIFO is not empty but fifo_empty flag is asserted")
                     err_cnt += 1
-            data_rd_exp = fifo_expected.pop(0)
+                    waves.trigger("first error")
+            data_rd_exp = fifo_expected.read()
             data_rd_act = dut.data_rd.value.integer
             if(data_rd_exp == data_rd_act):
-                dut._log.info("Data read = %d, FIFO entry = %d", data_rd_act, len(fifo_expected))
+                ops.info("read", "Data read = %d, FIFO entry = %d", data_rd_act, len(fifo_expected))
             else:
                 dut._log.error("Data read mismatch, ACT = %d, EXP = %d", data_rd_act, data_rd_exp)
                 err_cnt += 1
+                waves.trigger("first error")
         else:
             if(dut.fifo_empty.value == 1):
-                dut._log.info("FIFO is empty, fifo_empty flag is asserted correctly")
+                ops.info("empty", "FIFO is empty, fifo_empty flag is asserted correctly")
             else:
                 dut._log.error("FIFO is empty but fifo_empty flag is not asserted")
                 err_cnt += 1
+                waves.trigger("first error")
     dut.rd_en.value = 0
 
 async def fifo_burst_write(dut,fifo_wr_stream,fifo_expected):
     for data_wr in fifo_wr_stream:
-        await RisingEdge(dut.wr_clk)
-        await Timer(1,'ns')
+        await wr_if.cycle()
         dut.wr_en.value = 1
         dut.data_wr.value = data_wr
-        fifo_expected.append(data_wr)
-        dut._log.info("Data written = %d, FIFO entry = %d", data_wr, len(fifo_expected))
-    await RisingEdge(dut.wr_clk)
-    await Timer(1,'ns')
+        fifo_expected.write(data_wr)
+        ops.info("write", "Data written = %d, FIFO entry = %d", data_wr, len(fifo_expected))
+    await wr_if.cycle()
     dut.wr_en.value = 0
 
 async def fifo_burst_read_return_stream(dut,count,fifo_expected):
     fifo_rd_stream = []
     rd_init = 0
     while (rd_init == 0):
-        await RisingEdge(dut.rd_clk)
+        await rd_if.cycle()
         if(dut.fifo_empty.value != 1):
             if(rd_init == 0):
-                await Timer(1,'ns')
                 dut.rd_en.value = 1
                 if(RD_BUFFER == 0):
-                    await Timer(1,'ns')
+                    await rd_if.settle()
                     data_rd = dut.data_rd.value.integer
                     fifo_rd_stream.append(data_rd)
-                    fifo_expected.pop(0)
-                    dut._log.info("Data read = %d, FIFO entry = %d", data_rd,len(fifo_expected))
+                    fifo_expected.read()
+                    ops.info("read", "Data read = %d, FIFO entry = %d", data_rd,len(fifo_expected))
                 rd_init = 1
     while (len(fifo_rd_stream) < count):
-        await RisingEdge(dut.rd_clk)
-        await Timer(1,'ns')    
+        await rd_if.cycle()
         data_rd = dut.data_rd.value.integer
         fifo_rd_stream.append(data_rd)
-        fifo_expected.pop(0)
-        dut._log.info("Data read = %d, FIFO entry = %d", data_rd,len(fifo_expected))
+        fifo_expected.read()
+        ops.info("read", "Data read = %d, FIFO entry = %d", data_rd,len(fifo_expected))
     dut.rd_en.value = 0
     return fifo_rd_stream
 
@@ -172,24 +191,26 @@ async def fifo_read_write_rand_simul(count,dut):
     for i in range(BURST_LENGHT):
         data_wr_rand = random.randint(0,MAX_DATA)
         fifo_wr_stream.append(data_wr_rand)
-    fifo_expected = []
+    fifo_expected = FifoModel(DEPTH, DATA_WIDTH)
     await cocotb.start(fifo_burst_write(dut,fifo_wr_stream,fifo_expected))
     fifo_rd_stream = await fifo_burst_read_return_stream(dut,BURST_LENGHT,fifo_expected)
     for i in range(len(fifo_wr_stream)):
         if(fifo_wr_stream[i] != fifo_rd_stream[i]):
             dut._log.error("Data rd %d does not match data wr %d", fifo_rd_stream[i],fifo_wr_stream[i])
             err_cnt += 1
+            waves.trigger("first error")
 
 @cocotb.test()
 async def fifo_rand_write_then_read_test(dut):
     await dut_init(dut)
     dut._log.info("\nFIFO WRITE BURST SEQ")
-    fifo_expected = []
+    fifo_expected = FifoModel(DEPTH, DATA_WIDTH)
     await fifo_write_burst_rand(DEPTH+3,dut,fifo_expected)
     await(Timer(1000,'ns'))
     dut._log.info("\nFIFO READ BURST SEQ")
     await fifo_read_burst(DEPTH+3,dut,fifo_expected)
     await(Timer(1000,'ns'))
+    ops.report()
     if (err_cnt > 0):
         cocotb.log.error("Errors count = %d",err_cnt)
         cocotb.result.test_fail()
@@ -199,7 +220,7 @@ async def fifo_rand_write_then_read_test(dut):
 async def fifo_rand_read_write_test(dut):
     await dut_init(dut)
     dut._log.info("\nFIFO RANDOM READ WRITE SEQ")
-    fifo_expected = []
+    fifo_expected = FifoModel(DEPTH, DATA_WIDTH)
     i = DEPTH
     while(i >= 0):
         op_sel = random.randint(0,1)
@@ -214,6 +235,7 @@ async def fifo_rand_read_write_test(dut):
                 await fifo_write_burst_rand(op_count,dut,fifo_expected)
                 await Timer(WR_CLK_PERIOD,'ns')
                 await Timer(3*RD_CLK_PERIOD,'ns')
+    ops.report()
     if (err_cnt > 0):
         cocotb.log.error("Errors count = %d",err_cnt)
         cocotb.result.test_fail()    
@@ -224,6 +246,165 @@ async def fifo_rand_read_write_simul_test(dut):
     await dut_init(dut)
     dut._log.info("\nFIFO SIMULTANEOUS RANDOM READ WRITE SEQ")
     await fifo_read_write_rand_simul(1,dut)
+    ops.report()
+    if (err_cnt > 0):
+        cocotb.log.error("Errors count = %d",err_cnt)
+        cocotb.result.test_fail()
+
+
+# Benchmark: saturating writer and reader, wr_en/rd_en held high for the whole stream
+# (idle > 0 drops them for random cycles, seeded by rng, for the CDC soak test).
+# Signals sampled right after RisingEdge are the values the DUT saw at that edge.
+async def bench_writer(dut,count,push_times,pop_times,full_release,idle=0.0,rng=random):
+    word = 0
+    wr_en = 1
+    full_since = None
+    last_edge = get_sim_time('ns')
+    dut.data_wr.value = 0
+    dut.wr_en.value = 1
+    while(word < count):
+        await RisingEdge(dut.wr_clk)
+        now = get_sim_time('ns')
+        if(not wr_en):
+            pass
+        elif(dut.fifo_full.value == 1):
+            if(full_since is None):
+                full_since = last_edge
+        else:
+            if(full_since is not None):
+                # first read after the FIFO filled up to fifo_full deassertion
+                i = bisect_left(pop_times, full_since)
+                if(i < len(pop_times)):
+                    full_release.append((now - pop_times[i])/WR_CLK_PERIOD)
+                full_since = None
+            push_times.append(now)
+            word += 1
+            dut.data_wr.value = word & MAX_DATA
+        last_edge = now
+        if(idle):
+            wr_en = int(rng.random() >= idle)
+            dut.wr_en.value = wr_en
+    dut.wr_en.value = 0
+
+async def bench_reader(dut,count,push_times,pop_times,rd_times,rd_data,empty_release,idle=0.0,rng=random):
+    pending = 0
+    rd_en = 1
+    empty_since = None
+    last_edge = get_sim_time('ns')
+    dut.rd_en.value = 1
+    while(len(rd_data) < count):
+        await RisingEdge(dut.rd_clk)
+        now = get_sim_time('ns')
+        if(pending):
+            # RD_BUFFER=1, data_rd was registered at the previous edge
+            rd_data.append(dut.data_rd.value.integer)
+            rd_times.append(now)
+            pending = 0
+        if(len(pop_times) >= count):
+            continue
+        if(not rd_en):
+            pass
+        elif(dut.fifo_empty.value == 1):
+            if(empty_since is None):
+                empty_since = last_edge
+        else:
+            if(empty_since is not None):
+                # first write into the empty FIFO to fifo_empty deassertion
+                i = bisect_left(push_times, empty_since)
+                if(i < len(push_times)):
+                    empty_release.append((now - push_times[i])/RD_CLK_PERIOD)
+                empty_since = None
+            pop_times.append(now)
+            if(RD_BUFFER == 1):
+                pending = 1
+            else:
+                rd_data.append(dut.data_rd.value.integer)
+                rd_times.append(now)
+        last_edge = now
+        if(idle):
+            rd_en = int(rng.random() >= idle)
+            dut.rd_en.value = rd_en
+    dut.rd_en.value = 0
+
+@cocotb.test()
+async def fifo_bench_test(dut):
+    global err_cnt
+    await dut_init(dut)
+    dut._log.info("\nFIFO BENCHMARK: %d words, DEPTH=%d ASYNC=%d RD_BUFFER=%d WR_CLK=%dns RD_CLK=%dns",
+                  BENCH_WORDS, DEPTH, ASYNC, RD_BUFFER, WR_CLK_PERIOD, RD_CLK_PERIOD)
+    push_times, pop_times, rd_times, rd_data = [], [], [], []
+    full_release, empty_release = [], []
+    await cocotb.start(bench_writer(dut,BENCH_WORDS,push_times,pop_times,full_release))
+    bound_ns = 4*BENCH_WORDS*max(WR_CLK_PERIOD,RD_CLK_PERIOD) + 100*(WR_CLK_PERIOD+RD_CLK_PERIOD)*DEPTH
+    await with_timeout(bench_reader(dut,BENCH_WORDS,push_times,pop_times,rd_times,rd_data,empty_release),
+                       bound_ns, 'ns')
+
+    errors = sum(1 for i, data in enumerate(rd_data) if data != (i & MAX_DATA))
+    if(errors > 0):
+        dut._log.error("%d of %d words read out of order", errors, len(rd_data))
+        err_cnt += errors
+        waves.trigger("first error")
+
+    # Steady state throughput: skip the fill up (first 10% of the words)
+    skip = len(rd_times)//10
+    window = rd_times[-1] - rd_times[skip]
+    rate = (len(rd_times) - 1 - skip)/window if window > 0 else 0.0 # words/ns
+    peak = 1.0/max(WR_CLK_PERIOD,RD_CLK_PERIOD) # the slower side bounds the stream
+    latency = [rd - wr for wr, rd in zip(push_times, rd_times)]
+    metrics = {
+        "params": {"DEPTH": DEPTH, "DATA_WIDTH": DATA_WIDTH, "ASYNC": ASYNC, "RD_BUFFER": RD_BUFFER,
+                   "WR_CLK_PERIOD": WR_CLK_PERIOD, "RD_CLK_PERIOD": RD_CLK_PERIOD},
+        "words": len(rd_data),
+        "words_per_ns": round(rate, 6),
+        "words_per_wr_cycle": round(rate*WR_CLK_PERIOD, 4),
+        "words_per_rd_cycle": round(rate*RD_CLK_PERIOD, 4),
+        "efficiency": round(rate/peak, 4),
+        "sustained": rate >= BENCH_SUSTAIN*peak,
+        "latency_ns": percentiles(latency),
+        "latency_rd_cycles": percentiles([round(t/RD_CLK_PERIOD, 2) for t in latency]),
+        "full_release_wr_cycles": percentiles(full_release),
+        "empty_release_rd_cycles": percentiles(empty_release),
+        "errors": errors,
+    }
+    dut._log.info("Throughput: %.4f words/wr cycle, %.4f words/rd cycle, %.1f%% of the slower clock (%s)",
+                  metrics["words_per_wr_cycle"], metrics["words_per_rd_cycle"], 100*metrics["efficiency"],
+                  "sustained" if metrics["sustained"] else "not sustained")
+    dut._log.info("Write to read latency (rd cycles): %s", metrics["latency_rd_cycles"])
+    dut._log.info("fifo_full release (wr cycles): %s", metrics["full_release_wr_cycles"])
+    dut._log.info("fifo_empty release (rd cycles): %s", metrics["empty_release_rd_cycles"])
+    path = write_result("fifo", metrics)
+    if(path):
+        dut._log.info("Benchmark results written to %s", path)
+    if (err_cnt > 0):
+        cocotb.log.error("Errors count = %d",err_cnt)
+        cocotb.result.test_fail()
+
+@cocotb.test()
+async def fifo_cdc_soak_test(dut):
+    global err_cnt
+    await dut_init(dut)
+    dut._log.info("\nFIFO CDC SOAK: %d words, idle %.2f, %s", stress.words, stress.idle, stress)
+    cov = PhaseCoverage(dut.wr_clk, dut.rd_clk).start()
+    push_times, pop_times, rd_times, rd_data = [], [], [], []
+    await cocotb.start(bench_writer(dut,stress.words,push_times,pop_times,[],
+                                    stress.idle,random.Random(f"{stress.seed}:wr_en")))
+    # periods may stretch by spread + drift + jitter under stress, allow twice the nominal
+    bound_ns = int(8*stress.words*max(WR_CLK_PERIOD,RD_CLK_PERIOD)/(1 - min(stress.idle,0.9))) + 1000*(WR_CLK_PERIOD+RD_CLK_PERIOD)
+    await with_timeout(bench_reader(dut,stress.words,push_times,pop_times,rd_times,rd_data,[],
+                                    stress.idle,random.Random(f"{stress.seed}:rd_en")), bound_ns, 'ns')
+    cov.stop()
+
+    errors = 0
+    for i, data in enumerate(rd_data):
+        if(data != (i & MAX_DATA)):
+            if(errors < 10):
+                dut._log.error("Word %d read as %d, expected %d", i, data, i & MAX_DATA)
+            errors += 1
+    if(errors > 0):
+        dut._log.error("%d of %d words corrupted, lost or duplicated (CDC_SEED=%d)", errors, len(rd_data), stress.seed)
+        err_cnt += errors
+        waves.trigger("first error")
+    dut._log.info("Streamed %d words, rd_clk edges vs wr_clk phase: %s", len(rd_data), cov)
     if (err_cnt > 0):
         cocotb.log.error("Errors count = %d",err_cnt)
         cocotb.result.test_fail()
@@ -0,0 +1,103 @@
+"""
+FIFO Reference Model
+Create Date: 18/10/2026
+
+Bounded FIFO mirroring fifo.sv: DEPTH entries, fifo_full/fifo_empty flags,
+writes to a full FIFO and reads from an empty FIFO are dropped like the RTL does.
+Backed by a deque so every write/read is O(1) regardless of DEPTH.
+
+Shared by FIFO/tb/cocotb/tb.py and the pyuvm FifoVipScoreboard; the Makefiles
+put this folder on PYTHONPATH:
+
+    from fifo_model import FifoModel
+    model = FifoModel(DEPTH)
+    model.write(0x12)          # False if full
+    exp = model.read()         # None if empty
+    model.write_many(values)   # block of writes, all or nothing
+    exp = model.read_many(n)   # list of up to n oldest entries
+"""
+
+from collections import deque
+from itertools import islice
+
+
+class FifoModel:
+    """Bounded FIFO reference model"""
+
+    def __init__(self, depth, data_width=None):
+        self.depth = int(depth)
+        self.data_width = int(data_width) if data_width else None
+        self.mask = (1 << self.data_width) - 1 if self.data_width else None
+        self.queue = deque()
+        self.wr_count = 0
+        self.rd_count = 0
+        self.overflow_count = 0   # writes dropped because the FIFO was full
+        self.underflow_count = 0  # reads from an empty FIFO
+        self.max_level = 0
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __iter__(self):
+        return iter(self.queue)
+
+    def __repr__(self):
+        return f"FifoModel(depth={self.depth}, level={len(self.queue)})"
+
+    @property
+    def full(self):
+        return len(self.queue) >= self.depth
+
+    @property
+    def empty(self):
+        return not self.queue
+
+    def write(self, data):
+        """Push data, returns False (data dropped) when full"""
+        if self.full:
+            self.overflow_count += 1
+            return False
+        self.queue.append(data & self.mask if self.mask is not None else data)
+        self.wr_count += 1
+        if len(self.queue) > self.max_level:
+            self.max_level = len(self.queue)
+        return True
+
+    def read(self):
+        """Pop the oldest entry, None when empty"""
+        if not self.queue:
+            self.underflow_count += 1
+            return None
+        self.rd_count += 1
+        return self.queue.popleft()
+
+    def write_many(self, values):
+        """Push a block of writes if they all fit, returns False (nothing written) otherwise"""
+        if len(self.queue) + len(values) > self.depth:
+            return False
+        if self.mask is not None:
+            values = [v & self.mask for v in values]
+        self.queue.extend(values)
+        self.wr_count += len(values)
+        if len(self.queue) > self.max_level:
+            self.max_level = len(self.queue)
+        return True
+
+    def read_many(self, n):
+        """Pop up to n oldest entries"""
+        n = min(n, len(self.queue))
+        self.rd_count += n
+        popleft = self.queue.popleft
+        return [popleft() for _ in range(n)]
+
+    def head(self, n):
+        """Up to n oldest entries without popping them"""
+        return list(islice(self.queue, n))
+
+    def peek(self):
+        """Oldest entry without popping it, None when empty"""
+        return self.queue[0] if self.queue else None
+
+    def clear(self):
+        """Reset: drop the content, keep the statistics"""
+        self.queue.clear()
@@ -31,7 +31,7 @@ class FifoVipAgent(uvm_agent):
         )
 
         # Create driver and sequencer if active
-        if self.is_active == UVM_ACTIVE:
+        if self.is_active == uvm_active_passive_enum.UVM_ACTIVE:
             self.driver = FifoVipDriver(
                 f"{self.agent_type.lower()}_driver",
                 self,
@@ -49,5 +49,5 @@ class FifoVipAgent(uvm_agent):
         self.ap = self.monitor.ap
 
         # Connect driver to sequencer if active
-        if self.is_active == UVM_ACTIVE:
+        if self.is_active == uvm_active_passive_enum.UVM_ACTIVE:
             self.driver.seq_item_port.connect(self.sequencer.seq_item_export)
@@ -5,7 +5,11 @@ Create Date: 01/05/2026
 
 from pyuvm import *
 import cocotb
-from cocotb.triggers import RisingEdge, FallingEdge
+from cocotb.triggers import RisingEdge, FallingEdge, First, NextTimeStep
+from cocotb.utils import get_sim_time
+from collections import deque
+from tbutils.clocked import ClockedIf
+from tbutils.tblog import lazy
 from ..common.fifo_vip_types import FifoOp
 
 
@@ -17,6 +21,9 @@ class FifoVipDriver(uvm_driver):
         self.driver_type = driver_type  # "WR" or "RD"
         self.dut = None
         self.cfg = None
+        self.rng = None  # idle gaps, seeded from the CDC stress seed
+        self.rd_pending = deque()  # (issue time, item) of buffered reads waiting for data_rd
+        self.clk_if = None  # ClockedIf of the driven clock, idle gaps
 
     def build_phase(self):
         super().build_phase()
@@ -26,22 +33,31 @@ class FifoVipDriver(uvm_driver):
         self.cfg = ConfigDB().get(self, "", "fifo_vip_cfg")
         if self.cfg is None:
             self.logger.critical("No config found")
+        else:
+            self.rng = self.cfg.stress.rng(f"{self.driver_type}_drv")
 
     async def run_phase(self):
         """Main driver run phase"""
         # Initialize signals
+        self.clk_if = ClockedIf(self.dut.wr_clk if self.driver_type == "WR" else self.dut.rd_clk)
         if self.driver_type == "WR":
             self.dut.wr_en.value = 0
             self.dut.data_wr.value = 0
-            # Wait for reset
-            await FallingEdge(self.dut.rst)
+            # Wait for reset, the test may start after it was released
+            if self.dut.rst.value == 1:
+                await FallingEdge(self.dut.rst)
             await RisingEdge(self.dut.wr_clk)
         else:  # RD
             self.dut.rd_en.value = 0
-            # Wait for reset
-            await FallingEdge(self.dut.rst)
+            # Wait for reset, the test may start after it was released
+            if self.dut.rst.value == 1:
+                await FallingEdge(self.dut.rst)
             await RisingEdge(self.dut.rd_clk)
 
+        if self.cfg.pipelined:
+            await self.run_pipelined()
+            return
+
         # Main loop
         while True:
             item = await self.seq_item_port.get_next_item()
@@ -52,6 +68,7 @@ class FifoVipDriver(uvm_driver):
         """Drive a single transaction"""
         # Set config on item
         item.set_config(self.cfg)
+        await self.idle_gap()
 
         if item.op == FifoOp.WRITE and self.driver_type == "WR":
             await self.drive_write(item)
@@ -59,12 +76,82 @@ class FifoVipDriver(uvm_driver):
             await self.drive_read(item)
         elif item.op == FifoOp.IDLE:
             # Just wait 2 clocks
-            if self.driver_type == "WR":
-                await RisingEdge(self.dut.wr_clk)
-                await RisingEdge(self.dut.wr_clk)
+            await self.clk_if.idle(2)
+
+    async def idle_gap(self):
+        """Random idle cycles before an item (cfg.idle_prob), shifts traffic against the other clock"""
+        if not self.cfg.idle_prob:
+            return
+        await self.clk_if.idle(self.idle_cycles())
+
+    def idle_cycles(self):
+        """Number of idle cycles before the next item, drawn like idle_gap()"""
+        n = 0
+        while self.cfg.idle_prob and self.rng.random() < self.cfg.idle_prob:
+            n += 1
+        return n
+
+    async def run_pipelined(self):
+        """Streaming mode: one transfer per clock, the enable stays high across consecutive items
+
+        The next item is fetched in the time step of the accepting edge; only when the
+        sequence has none ready by then is the enable dropped. Buffered read data arrives
+        one edge after the pop and is filled in from the rd_pending queue.
+        """
+        if self.driver_type == "WR":
+            clk, en = self.dut.wr_clk, self.dut.wr_en
+            data_mask = (1 << self.cfg.DATA_WIDTH) - 1
+        else:
+            clk, en = self.dut.rd_clk, self.dut.rd_en
+            if self.cfg.RD_BUFFER:
+                cocotb.start_soon(self.read_responses())
+
+        item = await self.seq_item_port.get_next_item()
+        while True:
+            item.set_config(self.cfg)
+            idle = self.idle_cycles()
+            if idle or item.op == FifoOp.IDLE:
+                en.value = 0
+                await self.clk_if.idle(idle + (2 if item.op == FifoOp.IDLE else 0))
+
+            if item.op == FifoOp.WRITE and self.driver_type == "WR":
+                self.dut.data_wr.value = item.data & data_mask
+                en.value = 1
+                await RisingEdge(clk)
+                item.full = bool(self.dut.fifo_full.value)
+                item.success = not item.full
+                self.logger.debug("WR_DRV: Write: %s", lazy(item.convert2string))
+            elif item.op == FifoOp.READ and self.driver_type == "RD":
+                en.value = 1
+                await RisingEdge(clk)
+                item.empty = bool(self.dut.fifo_empty.value)
+                item.success = not item.empty
+                if self.cfg.RD_BUFFER:
+                    # data_rd is registered at this edge, read_responses() fills it in at the next one
+                    self.rd_pending.append((get_sim_time(), item))
+                else:
+                    item.read_data = int(self.dut.data_rd.value)
+                    self.logger.debug("RD_DRV: Read: %s", lazy(item.convert2string))
             else:
-                await RisingEdge(self.dut.rd_clk)
-                await RisingEdge(self.dut.rd_clk)
+                en.value = 0
+            self.seq_item_port.item_done()
+
+            # Keep the enable up if the sequence hands over the next item in this time step
+            fetch = cocotb.start_soon(self.seq_item_port.get_next_item())
+            await First(fetch, NextTimeStep())
+            if not fetch.done():
+                en.value = 0
+            item = await fetch
+
+    async def read_responses(self):
+        """Fill in the data of buffered reads popped at an earlier edge"""
+        while True:
+            await RisingEdge(self.dut.rd_clk)
+            now = get_sim_time()
+            while self.rd_pending and self.rd_pending[0][0] < now:
+                _, item = self.rd_pending.popleft()
+                item.read_data = int(self.dut.data_rd.value)
+                self.logger.debug("RD_DRV: Read: %s", lazy(item.convert2string))
 
     async def drive_write(self, item):
         """Drive write transaction"""
@@ -79,7 +166,7 @@ class FifoVipDriver(uvm_driver):
         item.success = not item.full
         self.dut.wr_en.value = 0
 
-        self.logger.debug(f"WR_DRV: Write: {item.convert2string()}")
+        self.logger.debug("WR_DRV: Write: %s", lazy(item.convert2string))
 
     async def drive_read(self, item):
         """Drive read transaction"""
@@ -89,12 +176,13 @@ class FifoVipDriver(uvm_driver):
         await RisingEdge(self.dut.rd_clk)
         item.empty = bool(self.dut.fifo_empty.value)
         item.success = not item.empty
+        # Release rd_en before the next edge, a buffered read would pop twice otherwise
+        self.dut.rd_en.value = 0
 
         # Wait extra cycle for buffered read
         if self.cfg.RD_BUFFER:
             await RisingEdge(self.dut.rd_clk)
 
         item.read_data = int(self.dut.data_rd.value)
-        self.dut.rd_en.value = 0
 
-        self.logger.debug(f"RD_DRV: Read: {item.convert2string()}")
+        self.logger.debug("RD_DRV: Read: %s", lazy(item.convert2string))
@@ -5,8 +5,11 @@ Create Date: 01/05/2026
 
 from pyuvm import *
 import cocotb
-from cocotb.triggers import RisingEdge, FallingEdge
-from ..common.fifo_vip_seq_item import FifoVipSeqItem
+from cocotb.triggers import FallingEdge
+from tbutils.snapshot import Snapshot
+from tbutils.tblog import lazy
+from tbutils.txn import BatchWriter, TxnPool
+from ..common.fifo_vip_seq_item import FifoVipTxn
 from ..common.fifo_vip_types import FifoOp
 
 
@@ -19,6 +22,8 @@ class FifoVipMonitor(uvm_monitor):
         self.dut = None
         self.cfg = None
         self.ap = uvm_analysis_port("ap", self)
+        self.pool = TxnPool(FifoVipTxn)  # records go back to the pool once the subscribers returned
+        self.out = None
 
     def build_phase(self):
         super().build_phase()
@@ -28,11 +33,13 @@ class FifoVipMonitor(uvm_monitor):
         self.cfg = ConfigDB().get(self, "", "fifo_vip_cfg")
         if self.cfg is None:
             self.logger.critical("No config found")
+        self.out = BatchWriter(self.ap, self.cfg.batch_size, self.pool)
 
     async def run_phase(self):
         """Main monitor run phase"""
-        # Wait for reset
-        await FallingEdge(self.dut.rst)
+        # Wait for reset, the test may start after it was released
+        if self.dut.rst.value == 1:
+            await FallingEdge(self.dut.rst)
 
         if self.monitor_type == "WR":
             await self.monitor_writes()
@@ -40,32 +47,47 @@ class FifoVipMonitor(uvm_monitor):
             await self.monitor_reads()
 
     async def monitor_writes(self):
-        """Monitor write transactions"""
+        """Monitor write transactions, edges with wr_en low are not sampled"""
+        wr = Snapshot(self.dut, ("rst", "data_wr", "fifo_full"), self.dut.wr_clk, qualifier="wr_en", name="WrSample")
         while True:
-            await RisingEdge(self.dut.wr_clk)
-            if self.dut.wr_en.value == 1 and self.dut.rst.value == 0:
-                item = FifoVipSeqItem("wr_item")
+            s = await wr.next()
+            if not s.rst:
+                item = self.pool.acquire()
                 item.op = FifoOp.WRITE
-                item.data = int(self.dut.data_wr.value)
-                item.full = bool(self.dut.fifo_full.value)
+                item.data = s.data_wr
+                item.full = bool(s.fifo_full)
                 item.success = not item.full
-                self.ap.write(item)
-                self.logger.debug(f"WR_MON: Monitored: {item.convert2string()}")
+                self.logger.debug("WR_MON: Monitored: %s", lazy(item.convert2string))
+                self.out.write(item)
 
     async def monitor_reads(self):
-        """Monitor read transactions"""
+        """Monitor read transactions, edges with rd_en low are not sampled unless read data is due"""
+        rd = Snapshot(self.dut, ("rd_en", "rst", "fifo_empty", "data_rd"), self.dut.rd_clk, qualifier="rd_en",
+                      name="RdSample")
+        pending = None  # buffered read waiting for data_rd, back-to-back reads stay in order
         while True:
-            await RisingEdge(self.dut.rd_clk)
-            if self.dut.rd_en.value == 1 and self.dut.rst.value == 0:
-                item = FifoVipSeqItem("rd_item")
+            s = await (rd.next() if pending is None else rd.edge())
+            if pending is not None:
+                pending.read_data = s.data_rd
+                self.logger.debug("RD_MON: Monitored: %s", lazy(pending.convert2string))
+                self.out.write(pending)
+                pending = None
+            if s.rd_en and not s.rst:
+                item = self.pool.acquire()
                 item.op = FifoOp.READ
-                item.empty = bool(self.dut.fifo_empty.value)
+                item.empty = bool(s.fifo_empty)
                 item.success = not item.empty
 
-                # Wait for buffered read
+                # data_rd of a buffered read is registered at this edge
                 if self.cfg.RD_BUFFER:
-                    await RisingEdge(self.dut.rd_clk)
+                    pending = item
+                    continue
 
-                item.read_data = int(self.dut.data_rd.value)
-                self.ap.write(item)
-                self.logger.debug(f"RD_MON: Monitored: {item.convert2string()}")
+                item.read_data = s.data_rd
+                self.logger.debug("RD_MON: Monitored: %s", lazy(item.convert2string))
+                self.out.write(item)
+
+    def extract_phase(self):
+        """End of test: deliver the last block"""
+        super().extract_phase()
+        self.out.flush()
@@ -4,6 +4,8 @@ Create Date: 01/05/2026
 """
 
 from pyuvm import *
+from tbutils.clocks import ClockStress
+from tbutils.txn import batch_size_from_env
 from .fifo_vip_types import FifoAgentMode
 
 
@@ -17,6 +19,21 @@ class FifoVipConfig(uvm_object):
         self.DATA_WIDTH = 8
         self.ASYNC = 1  # 1=async clocks, 0=sync
         self.RD_BUFFER = 1  # 1=buffered read, 0=combinational
+        self.WR_CLK_PERIOD = 20  # ns
+        self.RD_CLK_PERIOD = 32  # ns
+
+        # CDC stress (CDC_* environment, see Utils/tb/tbutils/clocks.py): clock
+        # randomization plus random idle cycles before each driven item
+        self.stress = ClockStress.from_env()
+        self.idle_prob = 0.0
+
+        # Driver mode: False pulses the enable for every item (2-3 clocks each),
+        # True streams one transfer per clock with the enable held across items
+        self.pipelined = False
+
+        # Monitor to scoreboard blocks of batch_size transactions (TB_BATCH, see
+        # Utils/tb/tbutils/txn.py), 0 delivers every transaction on its own
+        self.batch_size = batch_size_from_env()
 
         # VIP control
         self.has_wr_agent = True
@@ -33,6 +50,7 @@ class FifoVipConfig(uvm_object):
             f"DEPTH={self.DEPTH}, DATA_WIDTH={self.DATA_WIDTH}, "
             f"ASYNC={self.ASYNC}, RD_BUFFER={self.RD_BUFFER}"
         )
+        self.logger.info(f"{self.stress}, idle_prob={self.idle_prob}, pipelined={self.pipelined}")
 
     def __str__(self):
         return (f"FifoVipConfig: DEPTH={self.DEPTH}, DATA_WIDTH={self.DATA_WIDTH}, "
@@ -4,6 +4,7 @@ Create Date: 01/05/2026
 """
 
 from pyuvm import *
+from tbutils.txn import Txn
 from .fifo_vip_types import FifoOp
 import random
 
@@ -61,3 +62,12 @@ class FifoVipSeqItem(uvm_sequence_item):
 
     def __str__(self):
         return self.convert2string()
+
+
+class FifoVipTxn(Txn):
+    """Monitored FIFO transaction, pooled by the monitor, to_item() gives a FifoVipSeqItem"""
+
+    __slots__ = ("op", "data", "read_data", "full", "empty", "success")
+    defaults = (FifoOp.WRITE, 0, 0, False, False, True)
+    item_type = FifoVipSeqItem
+    convert2string = FifoVipSeqItem.convert2string
@@ -47,13 +47,13 @@ class FifoVipEnv(uvm_env):
         if self.cfg.enable_scoreboard and self.sb is not None:
             if self.wr_agent is not None:
                 self.wr_agent.ap.connect(self.sb.wr_export)
-                # Connect write callback
-                self.sb.wr_export.connect_transaction_handler(self.sb.write_wr)
 
             if self.rd_agent is not None:
                 self.rd_agent.ap.connect(self.sb.rd_export)
-                # Connect read callback
-                self.sb.rd_export.connect_transaction_handler(self.sb.write_rd)
+
+            # Both sides update one FIFO model, the merge puts batched blocks back in simulation order
+            if self.wr_agent is not None and self.rd_agent is not None:
+                self.sb.merge.attach(self.wr_agent.monitor.out, self.rd_agent.monitor.out)
 
     def get_wr_sequencer(self):
         """Get write sequencer"""
@@ -4,6 +4,10 @@ Create Date: 01/05/2026
 """
 
 from pyuvm import *
+from tbutils.tblog import OpsLog
+from tbutils.txn import TxnBatch, TxnMerge
+from tbutils.waves import WaveControl
+from fifo_model import FifoModel
 from ..common.fifo_vip_types import FifoOp
 
 
@@ -12,49 +16,106 @@ class FifoVipScoreboard(uvm_scoreboard):
 
     def __init__(self, name, parent):
         super().__init__(name, parent)
-        # Simple queue model
-        self.fifo_model = []
+        # Bounded reference model (FIFO/tb/model), sized from the config in build_phase
+        self.cfg = None
+        self.fifo_model = None
         self.errors = 0
         self.wr_count = 0
         self.rd_count = 0
+        # Waveform dump from the first mismatch on (WAVES_TRIGGER=1)
+        self.waves = WaveControl()
+        self.ops = OpsLog(self.logger, "scoreboard")
+        # Batched blocks of both sides back in simulation order (env attaches the monitor writers)
+        self.merge = TxnMerge(self.write_wr_batch, self.write_rd_batch)
 
-        # Create analysis exports
-        self.wr_export = uvm_analysis_export("wr_export", self)
-        self.rd_export = uvm_analysis_export("rd_export", self)
+        # Analysis exports, each write() goes to the callback of its side
+        self.wr_export = uvm_subscriber.uvm_AnalysisImp("wr_export", self, self.write_wr)
+        self.rd_export = uvm_subscriber.uvm_AnalysisImp("rd_export", self, self.write_rd)
 
     def build_phase(self):
         super().build_phase()
+        self.cfg = ConfigDB().get(self, "", "fifo_vip_cfg")
+        self.fifo_model = FifoModel(self.cfg.DEPTH, self.cfg.DATA_WIDTH)
 
     def connect_phase(self):
         super().connect_phase()
 
     def write_wr(self, item):
         """Write port callback for write transactions"""
+        if type(item) is TxnBatch:
+            return self.merge.push(0, item)
         if item.op == FifoOp.WRITE and item.success:
-            self.fifo_model.append(item.data)
             self.wr_count += 1
-            self.logger.info(
-                f"SB: Write: data=0x{item.data:x}, queue_size={len(self.fifo_model)}"
+            if not self.fifo_model.write(item.data):
+                self.logger.error(f"SB: Write accepted while FIFO model is full (DEPTH={self.fifo_model.depth})")
+                self.errors += 1
+                self.waves.trigger("SB write to full FIFO model")
+                return
+            self.ops.info(
+                "write", "SB: Write: data=0x%x, queue_size=%d", item.data, len(self.fifo_model)
             )
 
     def write_rd(self, item):
         """Write port callback for read transactions"""
+        if type(item) is TxnBatch:
+            return self.merge.push(1, item)
         if item.op == FifoOp.READ and item.success:
-            if len(self.fifo_model) > 0:
-                expected = self.fifo_model.pop(0)
+            if not self.fifo_model.empty:
+                expected = self.fifo_model.read()
                 self.rd_count += 1
                 if item.read_data == expected:
-                    self.logger.info(
-                        f"SB: Read OK: data=0x{item.read_data:x}, queue_size={len(self.fifo_model)}"
+                    self.ops.info(
+                        "read", "SB: Read OK: data=0x%x, queue_size=%d", item.read_data, len(self.fifo_model)
                     )
                 else:
                     self.logger.error(
                         f"SB: Data mismatch! Expected:0x{expected:x} Got:0x{item.read_data:x}"
                     )
                     self.errors += 1
+                    self.waves.trigger("SB data mismatch")
             else:
                 self.logger.error("SB: Read from empty FIFO model")
                 self.errors += 1
+                self.waves.trigger("SB read from empty FIFO model")
+
+    def write_wr_batch(self, batch):
+        """Block of write transactions, pushed into the model at once when they all fit"""
+        data = [item.data for item in batch if item.op == FifoOp.WRITE and item.success]
+        if not self.fifo_model.write_many(data):
+            # an overflow, reported at its transaction
+            for item in batch:
+                self.write_wr(item)
+            return
+        self.wr_count += len(data)
+        if not self.ops.enabled():
+            self.ops.count("write", len(data))
+            return
+        queue_size = len(self.fifo_model) - len(data)
+        for value in data:
+            queue_size += 1
+            self.ops.info("write", "SB: Write: data=0x%x, queue_size=%d", value, queue_size)
+
+    def write_rd_batch(self, batch):
+        """Block of read transactions, compared with the model head as one list"""
+        data = [item.read_data for item in batch if item.op == FifoOp.READ and item.success]
+        if self.fifo_model.head(len(data)) != data:
+            # a mismatch or underflow, reported at its transaction
+            for item in batch:
+                self.write_rd(item)
+            return
+        self.fifo_model.read_many(len(data))
+        self.rd_count += len(data)
+        if not self.ops.enabled():
+            self.ops.count("read", len(data))
+            return
+        queue_size = len(self.fifo_model) + len(data)
+        for value in data:
+            queue_size -= 1
+            self.ops.info("read", "SB: Read OK: data=0x%x, queue_size=%d", value, queue_size)
+
+    def check_phase(self):
+        """Check phase - fail run_test on any mismatch"""
+        assert self.errors == 0, f"FIFO VIP scoreboard: {self.errors} errors"
 
     def report_phase(self):
         """Report phase - print results"""
@@ -65,6 +126,7 @@ class FifoVipScoreboard(uvm_scoreboard):
         self.logger.info(f"Total Reads: {self.rd_count}")
         self.logger.info(f"Errors: {self.errors}")
         self.logger.info(f"Final Queue Size: {len(self.fifo_model)}")
+        self.ops.report()
 
         if self.errors == 0:
             self.logger.info("*** TEST PASSED ***")
@@ -6,3 +6,4 @@ Create Date: 01/05/2026
 from .fifo_vip_base_seq import *
 from .fifo_vip_write_req_seq import *
 from .fifo_vip_read_req_seq import *
+from .fifo_vip_stream_seq import *
@@ -16,6 +16,7 @@ class FifoVipReadReqSeq(FifoVipBaseSeq):
     def __init__(self, name="fifo_vip_read_req_seq"):
         super().__init__(name)
         self.num_reads = random.randint(1, 20)
+        self.accepted = 0  # items the FIFO took, empty FIFO rejects the rest
 
     async def body(self):
         """Sequence body"""
@@ -26,3 +27,5 @@ class FifoVipReadReqSeq(FifoVipBaseSeq):
             await self.start_item(item)
             item.randomize_with_op(FifoOp.READ)
             await self.finish_item(item)
+            if item.success:
+                self.accepted += 1
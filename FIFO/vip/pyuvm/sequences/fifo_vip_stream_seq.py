@@ -0,0 +1,42 @@
+"""
+FIFO VIP Stream Sequence
+Create Date: 18/10/2026
+"""
+
+from pyuvm import *
+import cocotb
+from .fifo_vip_base_seq import FifoVipBaseSeq
+from .fifo_vip_write_req_seq import FifoVipWriteReqSeq
+from .fifo_vip_read_req_seq import FifoVipReadReqSeq
+
+
+class FifoVipStreamSeq(FifoVipBaseSeq):
+    """Virtual sequence: write stream and read bursts running concurrently on both agents"""
+
+    def __init__(self, name="fifo_vip_stream_seq"):
+        super().__init__(name)
+        self.num_words = 100
+        self.read_burst = 16
+        self.wr_sequencer = None
+        self.rd_sequencer = None
+        self.written = 0
+        self.read = 0
+
+    async def body(self):
+        """Sequence body"""
+        self.logger.info("STREAM_SEQ: Streaming %d words", self.num_words)
+
+        wr_seq = FifoVipWriteReqSeq(f"{self.get_name()}_wr")
+        wr_seq.num_writes = self.num_words
+        writer = cocotb.start_soon(wr_seq.start(self.wr_sequencer))
+
+        # Read in bursts until every accepted write has been read back
+        i = 0
+        while not writer.done() or self.read < wr_seq.accepted:
+            rd_seq = FifoVipReadReqSeq(f"{self.get_name()}_rd_{i}")
+            rd_seq.num_reads = self.read_burst
+            await rd_seq.start(self.rd_sequencer)
+            self.read += rd_seq.accepted
+            i += 1
+
+        self.written = wr_seq.accepted
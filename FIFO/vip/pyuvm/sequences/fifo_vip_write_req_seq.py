@@ -16,6 +16,7 @@ class FifoVipWriteReqSeq(FifoVipBaseSeq):
     def __init__(self, name="fifo_vip_write_req_seq"):
         super().__init__(name)
         self.num_writes = random.randint(1, 20)
+        self.accepted = 0  # items the FIFO took, full FIFO rejects the rest
 
     async def body(self):
         """Sequence body"""
@@ -26,3 +27,5 @@ class FifoVipWriteReqSeq(FifoVipBaseSeq):
             await self.start_item(item)
             item.randomize_with_op(FifoOp.WRITE)
             await self.finish_item(item)
+            if item.success:
+                self.accepted += 1
@@ -5,3 +5,4 @@ Create Date: 01/05/2026
 
 from .fifo_vip_base_test import *
 from .fifo_vip_simple_test import *
+from .fifo_vip_cdc_test import *
@@ -27,6 +27,17 @@ class BaseTest(uvm_test):
         self.cfg.DATA_WIDTH = 8
         self.cfg.ASYNC = 1
         self.cfg.RD_BUFFER = 1
+
+        # Get DUT parameters from cocotb
+        dut = ConfigDB().get(None, "", "fifo_vip_dut")
+        if dut:
+            try:
+                self.cfg.DEPTH = int(dut.DEPTH.value)
+                self.cfg.DATA_WIDTH = int(dut.DATA_WIDTH.value)
+                self.cfg.ASYNC = int(dut.ASYNC.value)
+                self.cfg.RD_BUFFER = int(dut.RD_BUFFER.value)
+            except (AttributeError, ValueError):
+                self.logger.warning("Could not read DUT parameters, using defaults")
         self.cfg.has_wr_agent = True
         self.cfg.has_rd_agent = True
         self.cfg.enable_scoreboard = True
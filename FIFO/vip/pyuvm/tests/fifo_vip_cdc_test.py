@@ -0,0 +1,40 @@
+"""
+FIFO VIP CDC Soak Test
+Create Date: 18/10/2026
+"""
+
+from pyuvm import *
+import cocotb
+from cocotb.triggers import Timer
+from .fifo_vip_base_test import BaseTest
+from ..sequences.fifo_vip_stream_seq import FifoVipStreamSeq
+
+
+class CdcSoakTest(BaseTest):
+    """Concurrent write and read streams with random idle gaps, run with make CDC_STRESS=1"""
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.num_words = 0
+
+    def build_phase(self):
+        super().build_phase()
+        # CDC_WORDS / CDC_IDLE, defaults shared with the cocotb soak test
+        self.num_words = self.cfg.stress.words
+        self.cfg.idle_prob = self.cfg.stress.idle
+
+    async def run_phase(self):
+        """Run phase - stream writes and drain them from the other clock domain"""
+        self.raise_objection()
+
+        seq = FifoVipStreamSeq("soak_seq")
+        seq.num_words = self.num_words
+        seq.wr_sequencer = self.env.get_wr_sequencer()
+        seq.rd_sequencer = self.env.get_rd_sequencer()
+        await seq.start()
+
+        await Timer(200, units="ns")
+        sb = self.env.sb
+        self.logger.info(f"CDC soak: {sb.wr_count} words written, {sb.rd_count} read, {self.cfg.stress}")
+
+        self.drop_objection()
@@ -6,9 +6,11 @@ Create Date: 01/05/2026
 from pyuvm import *
 import cocotb
 from cocotb.triggers import Timer
+from cocotb.utils import get_sim_time
 from .fifo_vip_base_test import BaseTest
 from ..sequences.fifo_vip_write_req_seq import FifoVipWriteReqSeq
 from ..sequences.fifo_vip_read_req_seq import FifoVipReadReqSeq
+from ..sequences.fifo_vip_stream_seq import FifoVipStreamSeq
 
 
 class SimpleTest(BaseTest):
@@ -81,3 +83,73 @@ class RandomTest(BaseTest):
         await Timer(200, units="ns")
 
         self.drop_objection()
+
+
+class FullEmptyTest(BaseTest):
+    """Fill the FIFO past DEPTH, then drain it past empty"""
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+
+    async def run_phase(self):
+        """Run phase - execute test"""
+        self.raise_objection()
+
+        # Overfill, the writes beyond DEPTH must be rejected
+        wr_seq = FifoVipWriteReqSeq("fill_wr_seq")
+        wr_seq.num_writes = self.cfg.DEPTH + 3
+        await wr_seq.start(self.env.get_wr_sequencer())
+        if wr_seq.accepted != self.cfg.DEPTH:
+            self.logger.error(f"Full: {wr_seq.accepted} of {wr_seq.num_writes} writes accepted, "
+                              f"expected DEPTH={self.cfg.DEPTH}")
+            self.env.sb.errors += 1
+
+        await Timer(200, units="ns")
+
+        # Drain until the scoreboard model is empty, then read once more on empty
+        for i in range(4):
+            rd_seq = FifoVipReadReqSeq(f"drain_rd_seq_{i}")
+            rd_seq.num_reads = self.cfg.DEPTH + 3
+            await rd_seq.start(self.env.get_rd_sequencer())
+            if self.env.sb.fifo_model.empty:
+                break
+        if not self.env.sb.fifo_model.empty:
+            self.logger.error(f"Empty: {len(self.env.sb.fifo_model)} words left after draining")
+            self.env.sb.errors += 1
+
+        await Timer(200, units="ns")
+
+        self.drop_objection()
+
+
+class StreamTest(BaseTest):
+    """Write and read agents streaming concurrently, reports words per write clock cycle"""
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.num_words = 200
+
+    def build_phase(self):
+        super().build_phase()
+        # One transfer per clock, enables held across items
+        self.cfg.pipelined = True
+
+    async def run_phase(self):
+        """Run phase - execute test"""
+        self.raise_objection()
+
+        seq = FifoVipStreamSeq("stream_seq")
+        seq.num_words = self.num_words
+        seq.wr_sequencer = self.env.get_wr_sequencer()
+        seq.rd_sequencer = self.env.get_rd_sequencer()
+
+        start = get_sim_time("ns")
+        await seq.start()
+        elapsed = get_sim_time("ns") - start
+        cycles = elapsed / self.cfg.WR_CLK_PERIOD
+        self.logger.info(f"Stream: {seq.written} words in {cycles:.0f} wr_clk cycles, "
+                         f"{seq.written / cycles if cycles else 0:.3f} words/cycle")
+
+        await Timer(200, units="ns")
+
+        self.drop_objection()
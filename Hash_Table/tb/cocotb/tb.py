@@ -1,3 +1,4 @@
+import os
 import random
 import asyncio
 import math
@@ -8,6 +9,10 @@ from cocotb.clock import Clock
 from cocotb_bus.drivers import BusDriver
 from cocotb_bus.monitors import BusMonitor
 from cocotb.binary import BinaryValue
+from tbutils.tblog import OpsLog, get_logger
+from tbutils.bench import histogram, percentiles, write_result
+from tbutils.clocked import ClockedIf
+from hash_table_model import HashTableModel
 
 #BIN string
 #BinaryValue(dut.data_wr.value, n_bits=8) ; BinaryValue.integar ; BinaryValue.hex ; BinaryValue.binstr; BinaryValue.signed_integer ; can represent x,z
@@ -30,7 +35,13 @@ OP_SEARCH = 0b10
 TB_CLK_PERIOD = 30 # TB clk generator
 TB_SIM_TIMEOUT = 30 # TB sim timeout 30ms
 TB_TEST_WEIGHT = 1
+BENCH_LOADS = [float(x) for x in os.environ.get("BENCH_LOADS", "0.25,0.5,0.75,1.0,1.25").split(",")] # load factors of ht_bench_test
+BENCH_KEYS = os.environ.get("BENCH_KEYS", "uniform") # uniform, sequential, strided or adversarial
+BENCH_STRIDE = int(os.environ.get("BENCH_STRIDE", 2)) # key step of the strided distribution
+BENCH_SEARCHES = int(os.environ.get("BENCH_SEARCHES", 64)) # hits and misses searched per load factor
+clk_if = None # ClockedIf of dut.clk, drive point of every op
 err_cnt = 1
+ops = OpsLog(get_logger("hash_table"), "hash_table")
 
     # hash_table #(
     #           .KEY_WIDTH(DUT_KEY_WIDTH),
@@ -51,73 +62,74 @@ err_cnt = 1
     # /*output reg*/                   .op_error(op_error), // FULL when insert FAIL, KEY_NOT_FOUND when delete or search FAIL
     # /*output reg [CHAIN_WIDTH-1:0]*/ .collision_count(collision_count));
 
-# Below is not a good way to define "hash_table" in python, but for the sake of simplicity, we define it like this.
+# Reference model: bucketed HashTableModel (Hash_Table/tb/model), predicts op_error and collision_count
 class hash_table:
     def __init__(self, dut):
         self.dut = dut
-        self.key_value_pair = [{} for j in range(DUT_TOTAL_INDEX)]
+        self.model = HashTableModel(DUT_TOTAL_INDEX, DUT_CHAINING_SIZE, DUT_KEY_WIDTH, DUT_VALUE_WIDTH, DUT_HASH_ALGORITHM)
+        self.expect = None # HtExpect of the last op
 
     def hash(self, key):
-        if DUT_HASH_ALGORITHM == "MODULUS":
-            return key % DUT_TOTAL_INDEX
-        elif DUT_HASH_ALGORITHM == "SHA1":
-            # Implement SHA1 hash function here
-            pass
-        elif DUT_HASH_ALGORITHM == "FNV1A":
-            # Implement FNV1A hash function here
-            pass
+        return self.model.hash.index(key)
 
     def insert(self, key, value):
-        index = self.hash(key)
-        if len(self.key_value_pair[index]) < DUT_CHAINING_SIZE:
-            self.key_value_pair[index][key] = value
-            cocotb.log.info("Inserted key: %d, value: %d at index: %d", key, value, index)
+        self.expect = self.model.insert(key, value)
+        if not self.expect.op_error:
+            ops.info("insert", "Inserted key: %d, value: %d at index: %d", key, value, self.hash(key))
             return True
         else:
-            cocotb.log.info("Collision occurred at index: %d", index)
+            ops.info("collision", "Collision occurred at index: %d", self.hash(key))
             return False
 
     def delete(self, key):
-        index = self.hash(key)
-        if key in self.key_value_pair[index]:
-            del self.key_value_pair[index][key]
-            cocotb.log.info("Deleted key: %d at index: %d", key, index)
+        self.expect = self.model.delete(key)
+        if not self.expect.op_error:
+            ops.info("delete", "Deleted key: %d at index: %d", key, self.hash(key))
             return True
         else:
-            cocotb.log.info("Key not found: %d at index: %d", key, index)
+            ops.info("delete_miss", "Key not found: %d at index: %d", key, self.hash(key))
             return False
 
     def search(self, key):
-        index = self.hash(key)
-        if key in self.key_value_pair[index]:
-            cocotb.log.info("Found key: %d, value: %d at index: %d", key, self.key_value_pair[index][key], index)
-            return self.key_value_pair[index][key]
+        self.expect = self.model.search(key)
+        if not self.expect.op_error:
+            ops.info("search_hit", "Found key: %d, value: %d at index: %d", key, self.expect.value_out, self.hash(key))
+            return self.expect.value_out
         else:
-            cocotb.log.info("Key not found: %d at index: %d", key, index)
+            ops.info("search_miss", "Key not found: %d at index: %d", key, self.hash(key))
             return -1
-        
+
+    def check_collision_count(self, dut):
+        # collision_count of the last op against the model
+        global err_cnt
+        if int(dut.collision_count.value) != self.expect.collision_count:
+            cocotb.log.error("collision_count = %d, expected %d", int(dut.collision_count.value), self.expect.collision_count)
+            err_cnt += 1
+
     def print_content(self):
-        cocotb.log.info("Hash Table Content:")
+        # Runs after every op, skip the table dump unless it is printed
+        if not ops.enabled():
+            return
+        ops.log.info("Hash Table Content:")
         for i in range(DUT_TOTAL_INDEX):
-            info = "index " + str(i) + " : " + str(self.key_value_pair[i])
-            cocotb.log.info(info)
-        cocotb.log.info("End of Hash Table Content")
-        
+            ops.log.info("index %d : %s", i, self.model.bucket(i))
+        ops.log.info("End of Hash Table Content")
+
 async def hash_table_insert(dut, hash_table, key, value):
     global err_cnt
-    cocotb.log.info("OP_Insert key: %0d, value: %0d", key, value)
-    await RisingEdge(dut.clk)
-    await Timer (1, units = 'ns')
+    ops.info("op_insert", "OP_Insert key: %0d, value: %0d", key, value)
+    await clk_if.cycle()
     dut.key_in.value = key
     dut.value_in.value = value
     dut.op_sel.value = OP_INSERT
     dut.op_en.value = 1
     await RisingEdge(dut.op_done)
-    await Timer (1, units = 'ns')
+    await clk_if.settle()
     result = hash_table.insert(key, value)
+    hash_table.check_collision_count(dut)
     if (result == False):
         if(dut.op_error.value == 1):
-            cocotb.log.info("Collision occurred, error flag is asserted correctly")
+            ops.info("full_flag", "Collision occurred, error flag is asserted correctly")
         else:
             cocotb.log.error("Collision occurred, error flag is not asserted")
             err_cnt += 1
@@ -127,18 +139,18 @@ async def hash_table_insert(dut, hash_table, key, value):
 
 async def hash_table_delete(dut, hash_table, key):
     global err_cnt
-    cocotb.log.info("OP_Delete key: %0d", key)
-    await RisingEdge(dut.clk)
-    await Timer (1, units = 'ns')
+    ops.info("op_delete", "OP_Delete key: %0d", key)
+    await clk_if.cycle()
     dut.key_in.value = key
     dut.op_sel.value = OP_DELTE
     dut.op_en.value = 1
     await RisingEdge(dut.op_done)
-    await Timer (1, units = 'ns')
+    await clk_if.settle()
     result = hash_table.delete(key)
+    hash_table.check_collision_count(dut)
     if (result == False):
         if(dut.op_error.value == 1):
-            cocotb.log.info("Key not found, error flag is asserted correctly")
+            ops.info("not_found_flag", "Key not found, error flag is asserted correctly")
         else:
             cocotb.log.error("Key not found, error flag is not asserted")
             err_cnt += 1
@@ -148,27 +160,24 @@ async def hash_table_delete(dut, hash_table, key):
 
 async def hash_table_search(dut, hash_table, key):
     global err_cnt
-    cocotb.log.info("OP_Search key: %0d", key)
-    await RisingEdge(dut.clk)
-    await Timer (1, units = 'ns')
+    ops.info("op_search", "OP_Search key: %0d", key)
+    await clk_if.cycle()
     dut.key_in.value = key
     dut.op_sel.value = OP_SEARCH
     dut.op_en.value = 1
-    cocotb.log.info("hello")
     await RisingEdge(dut.op_done)
-    cocotb.log.info("hello2")
-    await Timer (1, units = 'ns')
-    await ReadOnly()
+    await clk_if.settle()
     result = hash_table.search(key)
+    hash_table.check_collision_count(dut)
     if (result == -1):
         if(dut.op_error.value == 1):
-            cocotb.log.info("Key not found, error flag is asserted correctly")
+            ops.info("not_found_flag", "Key not found, error flag is asserted correctly")
         else:
             cocotb.log.error("Key not found, error flag is not asserted")
             err_cnt += 1
     else:
         if(dut.value_out.value == result):
-            cocotb.log.info("Key found, value: %0d", result)
+            ops.info("found", "Key found, value: %0d", result)
         else:
             cocotb.log.error("Key found, but value is not correct")
             err_cnt += 1
@@ -187,6 +196,7 @@ async def dut_init(dut):
     global MAX_VALUE 
     global INDEX_WIDTH
     global ADDR_WIDTH
+    global clk_if
 
     DUT_KEY_WIDTH = dut.KEY_WIDTH.value
     DUT_VALUE_WIDTH = dut.VALUE_WIDTH.value
@@ -198,7 +208,9 @@ async def dut_init(dut):
     INDEX_WIDTH = int(math.log2(DUT_TOTAL_INDEX))
     ADDR_WIDTH = int(math.log2(DUT_TOTAL_INDEX*DUT_CHAINING_SIZE))
 
+    ops.reset()
     await cocotb.start(Clock(dut.clk, TB_CLK_PERIOD, units="ns").start())
+    clk_if = ClockedIf(dut.clk, TB_CLK_PERIOD)
     dut.rst.value = 0
     dut.key_in.value = 0
     dut.value_in.value = 0
@@ -237,6 +249,139 @@ async def direct_basic_op_test(dut):
     #timeout_task.cancel()
     #task.kill()
 
+    ops.report()
+    for line in exp_hash_table.model.report():
+        cocotb.log.info(line)
     if (err_cnt > 0):
         cocotb.log.error("Errors count = %d",err_cnt)
         raise cocotb.result.TestFailure() 
+
+
+def bench_keys(dist, count, rng):
+    # distinct non zero keys, the RTL hash only sees key % TOTAL_INDEX
+    max_key = min(2**int(DUT_KEY_WIDTH) - 1, 2**62)
+    if dist == "uniform":
+        return rng.sample(range(1, max_key + 1), count)
+    if dist == "sequential":
+        return [1 + i for i in range(count)]
+    if dist == "strided":
+        return [1 + i*BENCH_STRIDE for i in range(count)]
+    if dist == "adversarial":
+        return [1 + i*int(DUT_TOTAL_INDEX) for i in range(count)] # every key on index 1
+    raise ValueError(f"Unknown BENCH_KEYS distribution {dist}")
+
+async def hash_table_timed_op(dut, op, key, value=0):
+    # one op back to back, returns cycles from the edge taking op_en to the edge seeing op_done
+    dut.key_in.value = key
+    dut.value_in.value = value
+    dut.op_sel.value = op
+    dut.op_en.value = 1
+    await RisingEdge(dut.clk)
+    dut.op_en.value = 0
+    cycles = 0
+    while True:
+        await RisingEdge(dut.clk)
+        cycles += 1
+        if dut.op_done.value:
+            break
+    return cycles, int(dut.op_error.value), int(dut.value_out.value), int(dut.collision_count.value)
+
+@cocotb.test()
+async def ht_bench_test(dut):
+    global err_cnt
+    err_cnt = 0
+    await dut_init(dut)
+    model = hash_table(dut)
+    rng = random.Random(cocotb.RANDOM_SEED)
+    capacity = int(DUT_TOTAL_INDEX)*int(DUT_CHAINING_SIZE)
+    loads = sorted(BENCH_LOADS)
+    dut._log.info("\nHASH TABLE BENCHMARK: TOTAL_INDEX=%d CHAINING_SIZE=%d keys=%s loads=%s",
+                  DUT_TOTAL_INDEX, DUT_CHAINING_SIZE, BENCH_KEYS, loads)
+    targets = [round(load*capacity) for load in loads]
+    keys = bench_keys(BENCH_KEYS, targets[-1] + BENCH_SEARCHES, rng)
+    miss_keys = keys[targets[-1]:] # never inserted
+    await RisingEdge(dut.clk)
+
+    inserted, attempts, levels = [], 0, []
+    for load, target in zip(loads, targets):
+        insert_cycles, failures = [], 0
+        for key in keys[attempts:target]:
+            value = rng.randint(0, MAX_VALUE)
+            cycles, error, _, _ = await hash_table_timed_op(dut, OP_INSERT, key, value)
+            insert_cycles.append(cycles)
+            expected_ok = model.insert(key, value)
+            if(expected_ok):
+                inserted.append(key)
+            else:
+                failures += 1
+            if(error != (not expected_ok)):
+                dut._log.error("Insert key %d: op_error=%d, model expects %d", key, error, int(not expected_ok))
+                err_cnt += 1
+        attempts = target
+
+        hit_cycles, miss_cycles, depth_cycles = [], [], {}
+        for key in (rng.sample(inserted, min(BENCH_SEARCHES, len(inserted))) if inserted else []):
+            cycles, error, value_out, collisions = await hash_table_timed_op(dut, OP_SEARCH, key)
+            hit_cycles.append(cycles)
+            depth_cycles.setdefault(collisions, []).append(cycles)
+            expected = model.search(key)
+            if(error or value_out != expected or collisions != model.expect.collision_count):
+                dut._log.error("Search key %d: op_error=%d value=%d collision_count=%d, expected %d, %d", key, error,
+                               value_out, collisions, expected, model.expect.collision_count)
+                err_cnt += 1
+        for key in miss_keys:
+            cycles, error, _, _ = await hash_table_timed_op(dut, OP_SEARCH, key)
+            miss_cycles.append(cycles)
+            if(not error):
+                dut._log.error("Search of absent key %d did not assert op_error", key)
+                err_cnt += 1
+
+        occupancy = len(model.model)
+        level = {
+            "load": load,
+            "occupancy": round(occupancy/capacity, 4),
+            "max_chain": model.model.stats()["max_chain"],
+            "insert_failure_rate": round(failures/len(insert_cycles), 4) if insert_cycles else 0.0,
+            "insert_cycles": percentiles(insert_cycles),
+            "insert_hist": histogram(insert_cycles),
+            "search_hit_cycles": percentiles(hit_cycles),
+            "search_hit_hist": histogram(hit_cycles),
+            "search_hit_cycles_by_collision_count": {str(k): percentiles(v) for k, v in sorted(depth_cycles.items())},
+            "search_miss_cycles": percentiles(miss_cycles),
+            "search_miss_hist": histogram(miss_cycles),
+        }
+        levels.append(level)
+        dut._log.info("load %.2f: occupancy %.2f, max chain %d, insert failures %.1f%%, insert %s, hit %s, miss %s",
+                      load, level["occupancy"], level["max_chain"], 100*level["insert_failure_rate"],
+                      level["insert_cycles"], level["search_hit_cycles"], level["search_miss_cycles"])
+
+    # Deletes tear the table down from the highest load, in random order
+    delete_cycles, delete_not_found = [], 0
+    for key in rng.sample(inserted, len(inserted)):
+        cycles, error, _, _ = await hash_table_timed_op(dut, OP_DELTE, key)
+        delete_cycles.append(cycles)
+        model.delete(key)
+        delete_not_found += error
+    if(delete_not_found):
+        dut._log.warning("%d of %d inserted keys not found on delete", delete_not_found, len(inserted))
+
+    metrics = {
+        "params": {"TOTAL_INDEX": int(DUT_TOTAL_INDEX), "CHAINING_SIZE": int(DUT_CHAINING_SIZE), "KEY_WIDTH": int(DUT_KEY_WIDTH),
+                   "keys": BENCH_KEYS, "stride": BENCH_STRIDE},
+        "clk_period_ns": TB_CLK_PERIOD,
+        "loads": levels,
+        "delete_cycles": percentiles(delete_cycles),
+        "delete_hist": histogram(delete_cycles),
+        "delete_not_found": delete_not_found,
+        "errors": err_cnt,
+    }
+    dut._log.info("delete from load %.2f: %s", loads[-1], metrics["delete_cycles"])
+    for line in model.model.report():
+        dut._log.info(line)
+    path = write_result("hash_table", metrics)
+    if(path):
+        dut._log.info("Benchmark results written to %s", path)
+    ops.report()
+    if (err_cnt > 0):
+        cocotb.log.error("Errors count = %d",err_cnt)
+        raise cocotb.result.TestFailure()
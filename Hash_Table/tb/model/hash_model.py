@@ -0,0 +1,242 @@
+"""
+Hash Table Hash Model
+Create Date: 18/10/2026
+
+Bit-accurate index functions for the HASH_ALGORITHM choices of hash_table.sv and a
+NumPy batch mode that predicts the bucket distribution of millions of keys, so an
+algorithm and table geometry can be chosen before the RTL implements it.
+
+    MODULUS   what get_hash_index() does today: key_in passes through an "integer"
+              argument, i.e. it is truncated to 32 bits and signed, "%" truncates
+              toward zero and the index is hash_value[INDEX_WIDTH-1:0]. Equal to
+              key % TOTAL_INDEX for a power of 2 TOTAL_INDEX.
+    FNV1A     32-bit FNV-1a over the KEY_WIDTH/8 key bytes (rounded up, zero padded),
+              most significant byte first, index = hash % TOTAL_INDEX.
+    SHA1      SHA-1 of the same key bytes, truncated to the first 32 bits of the
+              digest (h0), index = h0 % TOTAL_INDEX.
+
+The FNV1A and SHA1 definitions are the reference for the planned RTL: the key is
+hashed at its full KEY_WIDTH, not through the 32-bit integer argument.
+
+    from hash_model import HashModel
+    model = HashModel(TOTAL_INDEX, KEY_WIDTH, "FNV1A")
+    index = model.index(key)
+    stats = model.distribution(keys, CHAINING_SIZE)    # NumPy array of up to 64-bit keys
+
+    python hash_model.py -n 1000000 -t 64 -c 4 --keys strided    # compare the algorithms
+"""
+
+import argparse
+import hashlib
+
+try:
+    import numpy as np
+except ImportError:  # scalar functions only, distribution() loops in Python
+    np = None
+
+ALGORITHMS = ("MODULUS", "FNV1A", "SHA1")
+FNV_OFFSET = 0x811C9DC5
+FNV_PRIME = 0x01000193
+SHA1_INIT = (0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0)
+SHA1_K = (0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xCA62C1D6)
+MASK32 = 0xFFFFFFFF
+
+
+def clog2(n):
+    """$clog2"""
+    return max(0, (int(n) - 1).bit_length())
+
+
+def key_bytes(key, key_width):
+    """KEY_WIDTH key as bytes, most significant first, width rounded up to a byte"""
+    n = (key_width + 7) // 8
+    return (key & ((1 << key_width) - 1)).to_bytes(n, "big")
+
+
+# ---------------------------------------------------------------- scalar
+def modulus_hash(key, total_index):
+    """hash_value of get_hash_index(): 32-bit signed integer key, Verilog % (toward zero)"""
+    key &= MASK32
+    if key >> 31:
+        key -= 1 << 32
+    rem = abs(key) % total_index
+    return (-rem if key < 0 else rem) & MASK32
+
+
+def fnv1a32(data):
+    h = FNV_OFFSET
+    for byte in data:
+        h = ((h ^ byte) * FNV_PRIME) & MASK32
+    return h
+
+
+def sha1_32(data):
+    """First 32 bits of the SHA-1 digest"""
+    return int.from_bytes(hashlib.sha1(data).digest()[:4], "big")
+
+
+class HashModel:
+    """Index function of one TOTAL_INDEX / KEY_WIDTH / HASH_ALGORITHM configuration"""
+
+    def __init__(self, total_index, key_width=32, algorithm="MODULUS"):
+        self.total_index = int(total_index)
+        self.key_width = int(key_width)
+        self.algorithm = str(algorithm).upper()
+        if self.algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown HASH_ALGORITHM {algorithm}, expected one of {ALGORITHMS}")
+        if self.total_index < 2:
+            raise ValueError("TOTAL_INDEX must be at least 2")
+        self.index_width = clog2(self.total_index)
+        self.index_mask = (1 << self.index_width) - 1
+
+    def hash(self, key):
+        """32-bit hash_value before the index is taken"""
+        if self.algorithm == "MODULUS":
+            return modulus_hash(key & ((1 << self.key_width) - 1), self.total_index)
+        data = key_bytes(key, self.key_width)
+        return fnv1a32(data) if self.algorithm == "FNV1A" else sha1_32(data)
+
+    def index(self, key):
+        h = self.hash(key)
+        if self.algorithm != "MODULUS":
+            h %= self.total_index
+        return h & self.index_mask
+
+    # ------------------------------------------------------------- batch
+    def indices(self, keys):
+        """Index of every key, NumPy uint64 keys (KEY_WIDTH <= 64) are hashed vectorized"""
+        if np is None or self.key_width > 64:
+            return [self.index(int(k)) for k in keys]
+        keys = np.asarray(keys, dtype=np.uint64) & np.uint64((1 << self.key_width) - 1)
+        if self.algorithm == "MODULUS":
+            key = (keys & np.uint64(MASK32)).astype(np.int64)
+            key = np.where(key >= 1 << 31, key - (1 << 32), key)
+            h = np.fmod(key, self.total_index) & MASK32
+        else:
+            data = self._key_byte_columns(keys)
+            h = _fnv1a32_np(data) if self.algorithm == "FNV1A" else _sha1_32_np(data)
+            h = h.astype(np.int64) % self.total_index
+        return (h & self.index_mask).astype(np.int64)
+
+    def _key_byte_columns(self, keys):
+        n = (self.key_width + 7) // 8
+        return [((keys >> np.uint64(8 * (n - 1 - i))) & np.uint64(0xFF)).astype(np.uint8) for i in range(n)]
+
+    def distribution(self, keys, chaining_size=None):
+        """Bucket occupancy of inserting keys, see bucket_stats()"""
+        return bucket_stats(self.indices(keys), self.total_index, chaining_size)
+
+
+# ------------------------------------------------------------ vectorized
+def _fnv1a32_np(data):
+    h = np.full(len(data[0]), FNV_OFFSET, dtype=np.uint32)
+    prime = np.uint32(FNV_PRIME)
+    for byte in data:
+        h = (h ^ byte.astype(np.uint32)) * prime
+    return h
+
+
+def _rotl(x, n):
+    return (x << np.uint32(n)) | (x >> np.uint32(32 - n))
+
+
+def _sha1_32_np(data):
+    """h0 of SHA-1 over single-block messages (up to 55 bytes), one message per row"""
+    n, count = len(data), len(data[0])
+    if n > 55:
+        raise ValueError("vectorized SHA1 handles keys up to 440 bits")
+    block = np.zeros((count, 64), dtype=np.uint8)
+    for i, byte in enumerate(data):
+        block[:, i] = byte
+    block[:, n] = 0x80
+    block[:, 56:] = np.frombuffer((8 * n).to_bytes(8, "big"), dtype=np.uint8)
+    w = [col.astype(np.uint32) for col in block.view(">u4").T]
+
+    a, b, c, d, e = (np.full(count, v, dtype=np.uint32) for v in SHA1_INIT)
+    for t in range(80):
+        if t >= 16:
+            w[t % 16] = _rotl(w[(t - 3) % 16] ^ w[(t - 8) % 16] ^ w[(t - 14) % 16] ^ w[t % 16], 1)
+        if t < 20:
+            f = (b & c) | (~b & d)
+        elif t < 40 or t >= 60:
+            f = b ^ c ^ d
+        else:
+            f = (b & c) | (b & d) | (c & d)
+        temp = _rotl(a, 5) + f + e + np.uint32(SHA1_K[t // 20]) + w[t % 16]
+        a, b, c, d, e = temp, a, _rotl(b, 30), c, d
+    return a + np.uint32(SHA1_INIT[0])
+
+
+def bucket_stats(indices, total_index, chaining_size=None):
+    """Chain lengths of a batch of bucket indices
+
+    hit_probes is the mean chain position + 1 of the stored keys, miss_probes the
+    mean stored chain length + 1 (a miss walks the whole chain). With chaining_size
+    keys beyond it are counted as insert failures like the RTL reports them.
+    """
+    if np is not None:
+        counts = np.bincount(np.asarray(indices, dtype=np.int64), minlength=total_index)
+    else:
+        counts = [0] * total_index
+        for i in indices:
+            counts[i] += 1
+    counts = [int(c) for c in counts]
+    keys = sum(counts)
+    stored = [min(c, chaining_size) for c in counts] if chaining_size else counts
+    n_stored = sum(stored)
+    chain_hist = {}
+    for c in stored:
+        chain_hist[c] = chain_hist.get(c, 0) + 1
+    stats = {
+        "keys": keys,
+        "buckets_used": sum(1 for c in counts if c),
+        "max_chain": max(counts),
+        "mean_chain": round(keys / total_index, 4),
+        "colliding_keys": keys - sum(1 for c in counts if c),
+        "chain_hist": {str(k): chain_hist[k] for k in sorted(chain_hist)},
+        "hit_probes": round(sum(c * (c + 1) / 2 for c in stored) / n_stored, 4) if n_stored else 0.0,
+        "miss_probes": round(n_stored / total_index + 1, 4),
+    }
+    if chaining_size:
+        stats["insert_failures"] = keys - n_stored
+        stats["insert_failure_rate"] = round((keys - n_stored) / keys, 6) if keys else 0.0
+    return stats
+
+
+def make_keys(dist, count, key_width=32, total_index=8, stride=2, seed=None):
+    """Benchmark key sets: uniform, sequential, strided or adversarial (all on one MODULUS index)"""
+    top = min((1 << key_width) - 1, (1 << 63) - 1)
+    if dist == "uniform":
+        rng = np.random.default_rng(seed)
+        return rng.integers(1, top, size=count, dtype=np.uint64, endpoint=True)
+    step = {"sequential": 1, "strided": stride, "adversarial": total_index}.get(dist)
+    if step is None:
+        raise ValueError(f"Unknown key distribution {dist}")
+    return (np.arange(count, dtype=np.uint64) * np.uint64(step) + np.uint64(1)) & np.uint64(top)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Predict the bucket distribution of the hash algorithms")
+    parser.add_argument("-n", "--count", type=int, default=1000000, help="number of keys (default: 1000000)")
+    parser.add_argument("-t", "--total-index", type=int, default=8, help="TOTAL_INDEX (default: 8)")
+    parser.add_argument("-c", "--chaining-size", type=int, help="CHAINING_SIZE, counts insert failures")
+    parser.add_argument("-w", "--key-width", type=int, default=32, help="KEY_WIDTH (default: 32)")
+    parser.add_argument("-a", "--algorithm", nargs="*", default=list(ALGORITHMS), help="algorithms (default: all)")
+    parser.add_argument("--keys", default="uniform", help="uniform, sequential, strided or adversarial")
+    parser.add_argument("--stride", type=int, default=2, help="key step of the strided keys (default: 2)")
+    parser.add_argument("--seed", type=int, help="seed of the uniform keys")
+    args = parser.parse_args(argv)
+    if np is None:
+        parser.error("the batch mode needs NumPy")
+
+    keys = make_keys(args.keys, args.count, args.key_width, args.total_index, args.stride, args.seed)
+    for algorithm in args.algorithm:
+        stats = HashModel(args.total_index, args.key_width, algorithm).distribution(keys, args.chaining_size)
+        print(f"{algorithm:<8} used {stats['buckets_used']}/{args.total_index} max chain {stats['max_chain']} "
+              f"hit probes {stats['hit_probes']} miss probes {stats['miss_probes']}"
+              + (f" insert failures {100 * stats['insert_failure_rate']:.2f}%" if args.chaining_size else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
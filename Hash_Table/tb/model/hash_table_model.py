@@ -0,0 +1,145 @@
+"""
+Hash Table Reference Model
+Create Date: 18/10/2026
+
+Bucketed model of hash_table.sv with MULTI_STAGE_CHAINING: TOTAL_INDEX buckets of
+at most CHAINING_SIZE entries, indexed through hash_model.HashModel. Every op
+returns the outputs the RTL should show with op_done:
+
+    insert   op_error=1 when the chain is full, collision_count = CHAINING_SIZE then
+    delete   op_error=1 for a missing key, collision_count = 0 on an empty chain,
+             CHAINING_SIZE after walking a non-empty one
+    search   as delete when missing; a hit returns the value and the chain length
+             as collision_count
+
+collision_count is truncated to the $clog2(CHAINING_SIZE-1) bits of the port. An
+insert of a key already in the chain updates its value in place. Deletes shift the
+rest of the chain down, so chain order (and the probe count of a hit) follows
+insertion order.
+
+Per-bucket counters (inserts, full-chain rejects, peak length, probes) point at
+the chain-depth hot spots. Shared by Hash_Table/tb/cocotb/tb.py and the pyuvm
+HtVipScoreboard; the Makefiles put this folder on PYTHONPATH:
+
+    from hash_table_model import HashTableModel
+    model = HashTableModel(TOTAL_INDEX, CHAINING_SIZE, KEY_WIDTH)
+    exp = model.insert(key, value)      # HtExpect(op_error, value_out, collision_count)
+    exp = model.search(key)
+    for line in model.report(): log.info(line)
+"""
+
+from collections import namedtuple
+
+from hash_model import HashModel, clog2
+
+HtExpect = namedtuple("HtExpect", "op_error value_out collision_count")
+
+
+class HashTableModel:
+    """Chained hash table reference model with per-bucket occupancy statistics"""
+
+    def __init__(self, total_index, chaining_size, key_width=32, value_width=32, algorithm="MODULUS"):
+        self.total_index = int(total_index)
+        self.chaining_size = int(chaining_size)
+        self.hash = HashModel(self.total_index, key_width, algorithm)
+        self.value_mask = (1 << int(value_width)) - 1
+        # collision_count is [$clog2(CHAINING_SIZE-1)-1:0], a [-1:0] range is 2 bits wide
+        self.count_mask = (1 << (clog2(self.chaining_size - 1) or 2)) - 1
+        self.buckets = [[] for _ in range(self.total_index)]  # [key, value] in chain order
+        self.inserts = [0] * self.total_index
+        self.rejects = [0] * self.total_index  # inserts refused on a full chain
+        self.peak = [0] * self.total_index
+        self.probes = [0] * self.total_index  # chain entries compared by searches and deletes
+        self.lookups = [0] * self.total_index
+
+    def __len__(self):
+        return sum(len(b) for b in self.buckets)
+
+    def __contains__(self, key):
+        return self._find(key)[1] is not None
+
+    def get(self, key, default=None):
+        chain, pos = self._find(key)
+        return chain[pos][1] if pos is not None else default
+
+    def bucket(self, index):
+        return [tuple(entry) for entry in self.buckets[index]]
+
+    def _find(self, key):
+        chain = self.buckets[self.hash.index(key)]
+        for pos, entry in enumerate(chain):
+            if entry[0] == key:
+                return chain, pos
+        return chain, None
+
+    def _miss(self, chain):
+        return HtExpect(1, 0, 0 if not chain else self.chaining_size & self.count_mask)
+
+    def _lookup(self, index, chain, pos):
+        self.lookups[index] += 1
+        self.probes[index] += pos + 1 if pos is not None else len(chain) + 1
+
+    # ---------------------------------------------------------------- ops
+    def insert(self, key, value):
+        index = self.hash.index(key)
+        chain, pos = self._find(key)
+        value &= self.value_mask
+        if pos is not None:
+            chain[pos][1] = value
+        elif len(chain) >= self.chaining_size:
+            self.rejects[index] += 1
+            return self._miss(chain)
+        else:
+            chain.append([key, value])
+            self.inserts[index] += 1
+            self.peak[index] = max(self.peak[index], len(chain))
+        return HtExpect(0, 0, 0)
+
+    def delete(self, key):
+        index = self.hash.index(key)
+        chain, pos = self._find(key)
+        self._lookup(index, chain, pos)
+        if pos is None:
+            return self._miss(chain)
+        del chain[pos]
+        return HtExpect(0, 0, 0)
+
+    def search(self, key):
+        index = self.hash.index(key)
+        chain, pos = self._find(key)
+        self._lookup(index, chain, pos)
+        if pos is None:
+            return self._miss(chain)
+        return HtExpect(0, chain[pos][1], len(chain) & self.count_mask)
+
+    # --------------------------------------------------------------- stats
+    def stats(self):
+        """Occupancy summary over all buckets"""
+        lengths = [len(b) for b in self.buckets]
+        lookups = sum(self.lookups)
+        return {
+            "entries": sum(lengths),
+            "load": round(sum(lengths) / (self.total_index * self.chaining_size), 4),
+            "max_chain": max(lengths),
+            "peak_chain": max(self.peak),
+            "full_buckets": sum(1 for n in lengths if n >= self.chaining_size),
+            "rejects": sum(self.rejects),
+            "mean_probes": round(sum(self.probes) / lookups, 3) if lookups else 0.0,
+        }
+
+    def hot_spots(self, top=4):
+        """Buckets with the most rejects, then the deepest peak chain"""
+        order = sorted(range(self.total_index), key=lambda i: (self.rejects[i], self.peak[i], self.inserts[i]),
+                       reverse=True)
+        return [i for i in order[:top] if self.inserts[i] or self.rejects[i]]
+
+    def report(self, top=4):
+        """Log lines: summary, then the hot spot buckets"""
+        s = self.stats()
+        lines = [f"Buckets: {s['entries']} entries, load {s['load']}, max chain {s['max_chain']}/{self.chaining_size} "
+                 f"(peak {s['peak_chain']}), {s['full_buckets']} full, {s['rejects']} full-chain rejects, "
+                 f"{s['mean_probes']} probes per lookup"]
+        for i in self.hot_spots(top):
+            lines.append(f"  index {i}: {len(self.buckets[i])} entries, peak {self.peak[i]}, "
+                         f"{self.inserts[i]} inserts, {self.rejects[i]} rejects, {self.lookups[i]} lookups")
+        return lines
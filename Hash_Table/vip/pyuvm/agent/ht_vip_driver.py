@@ -1,27 +1,37 @@
 """Hash Table VIP Driver"""
 from pyuvm import *
 import cocotb
-from cocotb.triggers import RisingEdge
+import random
+from cocotb.triggers import RisingEdge, First, NextTimeStep
+from tbutils.clocked import ClockedIf
 from ..common.ht_vip_seq_item import HtVipSeqItem
-from ..common.ht_vip_types import HtOp
+from ..common.ht_vip_types import HtOp, HtIssuePolicy
 
 class HtVipDriver(uvm_driver):
     def __init__(self, name, parent):
         super().__init__(name, parent)
         self.dut = None
         self.cfg = None
+        self.rng = None
 
     def build_phase(self):
         super().build_phase()
         self.cfg = ConfigDB().get(self, "", "ht_vip_cfg")
+        # RANDOM_GAP issue timing, reproducible from the logged seed
+        self.rng = random.Random(f"{cocotb.RANDOM_SEED}:ht_drv")
 
     async def run_phase(self):
         self.dut = ConfigDB().get(self, "", "ht_vip_dut")
+        self.clk_if = ClockedIf(self.dut.clk, self.cfg.CLK_PERIOD)  # RANDOM_GAP idle cycles
         self.dut.op_sel.value = 3
         self.dut.op_en.value = 0
         self.dut.key_in.value = 0
         self.dut.value_in.value = 0
 
+        if self.cfg.issue_policy != HtIssuePolicy.SERIAL:
+            await self.run_pipelined()
+            return
+
         while True:
             item = await self.seq_item_port.get_next_item()
             await self.drive_item(item)
@@ -37,12 +47,49 @@ class HtVipDriver(uvm_driver):
         await RisingEdge(self.dut.clk)
         self.dut.op_en.value = 0
 
+        item.latency = 0
         while not self.dut.op_done.value:
             await RisingEdge(self.dut.clk)
+            item.latency += 1
+
+        self.sample_result(item)
 
+        await RisingEdge(self.dut.clk)
+
+    def sample_result(self, item):
         item.result_value = int(self.dut.value_out.value)
         item.op_done = bool(self.dut.op_done.value)
         item.op_error = bool(self.dut.op_error.value)
         item.collision_count = int(self.dut.collision_count.value)
 
-        await RisingEdge(self.dut.clk)
+    async def run_pipelined(self):
+        """BACK_TO_BACK / RANDOM_GAP: the FSM is back in IDLE on the edge op_done is seen,
+        so the next op is driven right there and op_en stays high between ops"""
+        item = await self.seq_item_port.get_next_item()
+        while True:
+            gap = self.rng.randint(0, self.cfg.issue_gap) if self.cfg.issue_policy == HtIssuePolicy.RANDOM_GAP else 0
+            if gap:
+                self.dut.op_en.value = 0
+                await self.clk_if.idle(gap)
+
+            self.dut.op_sel.value = item.op.value
+            self.dut.op_en.value = 1
+            self.dut.key_in.value = item.key
+            self.dut.value_in.value = item.value
+
+            await RisingEdge(self.dut.clk)  # op_en taken in IDLE
+            item.latency = 0
+            while True:
+                await RisingEdge(self.dut.clk)
+                item.latency += 1
+                if self.dut.op_done.value:
+                    break
+            self.sample_result(item)
+            self.seq_item_port.item_done()
+
+            # Without a next item in this time step op_en must drop, IDLE would repeat the op
+            fetch = cocotb.start_soon(self.seq_item_port.get_next_item())
+            await First(fetch, NextTimeStep())
+            if not fetch.done():
+                self.dut.op_en.value = 0
+            item = await fetch
@@ -1,33 +1,44 @@
 """Hash Table VIP Monitor"""
 from pyuvm import *
 import cocotb
-from cocotb.triggers import RisingEdge
-from ..common.ht_vip_seq_item import HtVipSeqItem
+from cocotb.utils import get_sim_time
+from tbutils.snapshot import Snapshot
+from tbutils.txn import TxnPool
+from ..common.ht_vip_seq_item import HtVipTxn
 from ..common.ht_vip_types import HtOp
 
 class HtVipMonitor(uvm_monitor):
     def __init__(self, name, parent):
         super().__init__(name, parent)
         self.dut = None
+        self.cfg = None
         self.ap = uvm_analysis_port("ap", self)
+        self.pool = TxnPool(HtVipTxn)  # records go back to the pool once the subscribers returned
+
+    def build_phase(self):
+        super().build_phase()
+        self.cfg = ConfigDB().get(self, "", "ht_vip_cfg")
 
     async def run_phase(self):
         self.dut = ConfigDB().get(self, "", "ht_vip_dut")
+        # only the issue edges and the op_done edges are sampled, latency comes from the sim time
+        issue = Snapshot(self.dut, ("op_sel", "key_in", "value_in"), self.dut.clk, qualifier="op_en", name="HtIssue")
+        result = Snapshot(self.dut, ("value_out", "op_error", "collision_count"), self.dut.clk, qualifier="op_done",
+                          name="HtResult")
+        op_map = {0: HtOp.INSERT, 1: HtOp.DELETE, 2: HtOp.SEARCH, 3: HtOp.IDLE}
         while True:
-            await RisingEdge(self.dut.clk)
-            if self.dut.op_en.value:
-                item = HtVipSeqItem("mon")
-                op_map = {0: HtOp.INSERT, 1: HtOp.DELETE, 2: HtOp.SEARCH, 3: HtOp.IDLE}
-                item.op = op_map.get(int(self.dut.op_sel.value), HtOp.IDLE)
-                item.key = int(self.dut.key_in.value)
-                item.value = int(self.dut.value_in.value)
-
-                await RisingEdge(self.dut.clk)
-                while not self.dut.op_done.value:
-                    await RisingEdge(self.dut.clk)
+            s = await issue.next()
+            issued = get_sim_time("ns")
+            item = self.pool.acquire()
+            item.op = op_map.get(s.op_sel, HtOp.IDLE)
+            item.key = s.key_in
+            item.value = s.value_in
 
-                item.result_value = int(self.dut.value_out.value)
-                item.op_done = bool(self.dut.op_done.value)
-                item.op_error = bool(self.dut.op_error.value)
-                item.collision_count = int(self.dut.collision_count.value)
-                self.ap.write(item)
+            r = await result.next()
+            item.latency = round((get_sim_time("ns") - issued) / self.cfg.CLK_PERIOD)
+            item.result_value = r.value_out
+            item.op_done = True
+            item.op_error = bool(r.op_error)
+            item.collision_count = r.collision_count
+            self.ap.write(item)
+            self.pool.release(item)
@@ -5,10 +5,11 @@ Contains configuration, types, and sequence item definitions
 
 from .ht_vip_types import HtOp
 from .ht_vip_config import HtVipConfig
-from .ht_vip_seq_item import HtVipSeqItem
+from .ht_vip_seq_item import HtVipSeqItem, HtVipTxn
 
 __all__ = [
     'HtOp',
     'HtVipConfig',
     'HtVipSeqItem',
+    'HtVipTxn',
 ]
@@ -5,7 +5,9 @@ Create Date: 01/05/2026
 Configuration class for Hash Table VIP
 """
 
+import os
 from pyuvm import *
+from .ht_vip_types import HtIssuePolicy
 
 
 class HtVipConfig(uvm_object):
@@ -21,12 +23,17 @@ class HtVipConfig(uvm_object):
         self.CHAINING_SIZE = 4
         self.COLLISION_METHOD = "MULTI_STAGE_CHAINING"
         self.HASH_ALGORITHM = "MODULUS"
+        self.CLK_PERIOD = 10  # ns
 
         # VIP configuration
         self.has_agent = True
         self.enable_scoreboard = True
         self.is_active = True
 
+        # Driver issue policy, HT_ISSUE_POLICY=BACK_TO_BACK / HT_ISSUE_GAP=4 from make
+        self.issue_policy = HtIssuePolicy[os.environ.get("HT_ISSUE_POLICY", "SERIAL").upper()]
+        self.issue_gap = int(os.environ.get("HT_ISSUE_GAP", 2))
+
     def do_print(self, printer=None):
         """Print configuration"""
         self.logger.info(f"KEY_WIDTH: {self.KEY_WIDTH}")
@@ -35,3 +42,4 @@ class HtVipConfig(uvm_object):
         self.logger.info(f"CHAINING_SIZE: {self.CHAINING_SIZE}")
         self.logger.info(f"COLLISION_METHOD: {self.COLLISION_METHOD}")
         self.logger.info(f"HASH_ALGORITHM: {self.HASH_ALGORITHM}")
+        self.logger.info(f"ISSUE_POLICY: {self.issue_policy.name} (gap {self.issue_gap})")
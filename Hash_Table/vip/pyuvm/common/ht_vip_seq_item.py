@@ -6,6 +6,7 @@ Transaction item for Hash Table operations (key-value pairs)
 """
 
 from pyuvm import *
+from tbutils.txn import Txn
 import random
 from .ht_vip_types import HtOp
 
@@ -26,6 +27,7 @@ class HtVipSeqItem(uvm_sequence_item):
         self.op_done = False
         self.op_error = False
         self.collision_count = 0
+        self.latency = 0  # clocks from the edge taking op_en to the edge seeing op_done
 
         # Config reference
         self.cfg = None
@@ -59,4 +61,13 @@ class HtVipSeqItem(uvm_sequence_item):
         """Convert to string for printing"""
         return (f"Op:{self.op.name} Key:0x{self.key:x} Value:0x{self.value:x} "
                 f"Result:0x{self.result_value:x} Done:{self.op_done} "
-                f"Error:{self.op_error} Collisions:{self.collision_count}")
+                f"Error:{self.op_error} Collisions:{self.collision_count} Latency:{self.latency}")
+
+
+class HtVipTxn(Txn):
+    """Monitored Hash Table transaction, pooled by the monitor, to_item() gives a HtVipSeqItem"""
+
+    __slots__ = ("op", "key", "value", "result_value", "op_done", "op_error", "collision_count", "latency")
+    defaults = (HtOp.INSERT, 0, 0, 0, False, False, 0, 0)
+    item_type = HtVipSeqItem
+    convert2string = HtVipSeqItem.convert2string
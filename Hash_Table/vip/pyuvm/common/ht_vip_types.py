@@ -14,3 +14,10 @@ class HtOp(Enum):
     DELETE = 1  # Delete by key
     SEARCH = 2  # Search by key
     IDLE = 3    # No operation
+
+
+class HtIssuePolicy(Enum):
+    """When the driver issues the next operation"""
+    SERIAL = 0        # op_en for one clock, wait op_done, then an idle clock
+    BACK_TO_BACK = 1  # next op driven on the cycle op_done is seen
+    RANDOM_GAP = 2    # back to back plus 0..issue_gap random idle cycles
@@ -1,41 +1,73 @@
 """Hash Table VIP Scoreboard - tracks key-value pairs"""
 from pyuvm import *
+from tbutils.bench import percentiles
+from tbutils.tblog import OpsLog
+from hash_table_model import HashTableModel
 from ..common.ht_vip_types import HtOp
 
 class HtVipScoreboard(uvm_scoreboard):
     def __init__(self, name, parent):
         super().__init__(name, parent)
         self.imp = uvm_analysis_export("imp", self)
-        self.hash_model = {}  # Python dict as reference model
+        self.hash_model = None  # bucketed reference model (Hash_Table/tb/model), built from the config
         self.error_count = 0
+        self.ops = OpsLog(self.logger, "scoreboard")
+        self.latency = {}  # (op name, collision_count) -> latencies in clocks
+
+    def build_phase(self):
+        super().build_phase()
+        cfg = ConfigDB().get(self, "", "ht_vip_cfg")
+        self.hash_model = HashTableModel(cfg.TOTAL_INDEX, cfg.CHAINING_SIZE, cfg.KEY_WIDTH, cfg.VALUE_WIDTH,
+                                         cfg.HASH_ALGORITHM)
 
     def connect_phase(self):
         super().connect_phase()
         self.imp.connect(self)
 
     def write(self, item):
+        self.latency.setdefault((item.op.name, item.collision_count), []).append(item.latency)
         if item.op == HtOp.INSERT:
-            if not item.op_error:
-                self.hash_model[item.key] = item.value
-                self.logger.info(f"INSERT key=0x{item.key:x} value=0x{item.value:x}")
+            exp = self.hash_model.insert(item.key, item.value)
         elif item.op == HtOp.DELETE:
-            if not item.op_error:
-                if item.key in self.hash_model:
-                    del self.hash_model[item.key]
-                    self.logger.info(f"DELETE key=0x{item.key:x}")
+            exp = self.hash_model.delete(item.key)
         elif item.op == HtOp.SEARCH:
-            if item.key in self.hash_model:
-                if item.result_value != self.hash_model[item.key]:
-                    self.logger.error(f"SEARCH mismatch! Expected=0x{self.hash_model[item.key]:x} Actual=0x{item.result_value:x}")
-                    self.error_count += 1
-                else:
-                    self.logger.info(f"SEARCH key=0x{item.key:x} MATCH")
+            exp = self.hash_model.search(item.key)
+        else:
+            return
+
+        actual = (int(item.op_error), item.result_value, item.collision_count)
+        if actual != tuple(exp):
+            self.logger.error(f"{item.op.name} key=0x{item.key:x} mismatch! Expected op_error={exp.op_error} "
+                              f"value=0x{exp.value_out:x} collision_count={exp.collision_count}, Actual "
+                              f"op_error={actual[0]} value=0x{actual[1]:x} collision_count={actual[2]}")
+            self.error_count += 1
+        elif item.op == HtOp.SEARCH and not exp.op_error:
+            self.ops.info("search", "SEARCH key=0x%x MATCH", item.key)
+        else:
+            self.ops.info(item.op.name.lower() + ("_error" if exp.op_error else ""),
+                          "%s key=0x%x value=0x%x op_error=%d", item.op.name, item.key, item.value, exp.op_error)
+
+    def latency_profile(self):
+        """{(op, collision_count): percentiles of the latency in clocks}"""
+        return {key: percentiles(values) for key, values in sorted(self.latency.items())}
+
+    def latency_report(self):
+        lines = []
+        for (op, collisions), stats in self.latency_profile().items():
+            lines.append(f"Latency {op:<6} collision_count={collisions}: n={len(self.latency[(op, collisions)])} "
+                         f"min={stats['min']} mean={stats['mean']} p90={stats['p90']} max={stats['max']} clk")
+        return lines
 
     def report_phase(self):
         super().report_phase()
         self.logger.info("="*50)
         self.logger.info(f"Hash Table Size: {len(self.hash_model)}")
+        for line in self.hash_model.report():
+            self.logger.info(line)
         self.logger.info(f"Error Count: {self.error_count}")
+        self.ops.report()
+        for line in self.latency_report():
+            self.logger.info(line)
         if self.error_count > 0:
             self.logger.error(f"Test FAILED with {self.error_count} errors")
         else:
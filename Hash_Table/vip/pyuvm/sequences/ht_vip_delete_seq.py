@@ -17,4 +17,4 @@ class HtVipDeleteSeq(HtVipBaseSeq):
             item.randomize_with_op(HtOp.DELETE)
             await self.start_item(item)
             await self.finish_item(item)
-            self.logger.info(f"Delete #{i}: key=0x{item.key:x}")
+            self.logger.info("Delete #%s: key=0x%x", i, item.key)
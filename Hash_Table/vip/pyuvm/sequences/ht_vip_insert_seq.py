@@ -8,6 +8,7 @@ class HtVipInsertSeq(HtVipBaseSeq):
     def __init__(self, name):
         super().__init__(name)
         self.num_inserts = 5
+        self.keys = []  # inserted keys, op_error ones included
 
     async def body(self):
         for i in range(self.num_inserts):
@@ -17,4 +18,5 @@ class HtVipInsertSeq(HtVipBaseSeq):
             item.randomize_with_op(HtOp.INSERT)
             await self.start_item(item)
             await self.finish_item(item)
-            self.logger.info(f"Insert #{i}: key=0x{item.key:x} value=0x{item.value:x}")
+            self.keys.append(item.key)
+            self.logger.info("Insert #%s: key=0x%x value=0x%x", i, item.key, item.value)
@@ -8,6 +8,7 @@ class HtVipSearchSeq(HtVipBaseSeq):
     def __init__(self, name):
         super().__init__(name)
         self.num_searches = 5
+        self.keys = None  # keys to search in order, random keys when None
 
     async def body(self):
         for i in range(self.num_searches):
@@ -15,6 +16,8 @@ class HtVipSearchSeq(HtVipBaseSeq):
             if self.cfg:
                 item.cfg = self.cfg
             item.randomize_with_op(HtOp.SEARCH)
+            if self.keys:
+                item.key = self.keys[i % len(self.keys)]
             await self.start_item(item)
             await self.finish_item(item)
-            self.logger.info(f"Search #{i}: key=0x{item.key:x}")
+            self.logger.info("Search #%s: key=0x%x", i, item.key)
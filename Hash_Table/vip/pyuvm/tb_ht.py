@@ -3,7 +3,7 @@ import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import Timer
 from pyuvm import *
-from tests.ht_vip_simple_test import SimpleTest, RandomTest
+from tests.ht_vip_simple_test import SimpleTest, RandomTest, ThroughputTest
 
 async def dut_init(dut):
     """Initialize DUT"""
@@ -43,3 +43,11 @@ async def ht_random_test(dut):
     cocotb.log.info("Starting Hash Table Random Test (pyUVM)")
     await uvm_root().run_test("RandomTest")
     cocotb.log.info("Hash Table Random Test Complete")
+
+@cocotb.test()
+async def ht_throughput_test(dut):
+    """Back-to-back ops, latency per collision_count (make HT_ISSUE_POLICY=RANDOM_GAP HT_OPS=256)"""
+    await dut_init(dut)
+    cocotb.log.info("Starting Hash Table Throughput Test (pyUVM)")
+    await uvm_root().run_test("ThroughputTest")
+    cocotb.log.info("Hash Table Throughput Test Complete")
@@ -1,4 +1,4 @@
 """Hash Table VIP Tests Package"""
 from .ht_vip_base_test import BaseTest
-from .ht_vip_simple_test import SimpleTest, RandomTest
-__all__ = ['BaseTest', 'SimpleTest', 'RandomTest']
+from .ht_vip_simple_test import SimpleTest, RandomTest, ThroughputTest
+__all__ = ['BaseTest', 'SimpleTest', 'RandomTest', 'ThroughputTest']
@@ -1,10 +1,13 @@
 """Hash Table VIP Simple Test"""
+import os
 from pyuvm import *
 from cocotb.triggers import Timer
+from cocotb.utils import get_sim_time
 from .ht_vip_base_test import BaseTest
 from ..sequences.ht_vip_insert_seq import HtVipInsertSeq
 from ..sequences.ht_vip_search_seq import HtVipSearchSeq
 from ..sequences.ht_vip_delete_seq import HtVipDeleteSeq
+from ..common.ht_vip_types import HtIssuePolicy
 
 class SimpleTest(BaseTest):
     def __init__(self, name, parent):
@@ -65,3 +68,40 @@ class RandomTest(BaseTest):
 
         await Timer(200, units="ns")
         self.drop_objection()
+
+class ThroughputTest(BaseTest):
+    """Back-to-back inserts and searches, reports ops/clock and latency per collision_count"""
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.num_ops = int(os.environ.get("HT_OPS", 64))
+
+    def build_phase(self):
+        super().build_phase()
+        if "HT_ISSUE_POLICY" not in os.environ:
+            self.cfg.issue_policy = HtIssuePolicy.BACK_TO_BACK
+
+    async def run_phase(self):
+        self.raise_objection()
+        start = get_sim_time("ns")
+
+        # Fill the chains, then look up inserted keys (hits) and random keys (misses)
+        insert_seq = HtVipInsertSeq("tput_insert")
+        insert_seq.num_inserts = self.num_ops
+        await insert_seq.start(self.env.get_sequencer())
+
+        search_seq = HtVipSearchSeq("tput_search_hit")
+        search_seq.num_searches = self.num_ops
+        search_seq.keys = insert_seq.keys
+        await search_seq.start(self.env.get_sequencer())
+
+        search_seq = HtVipSearchSeq("tput_search_miss")
+        search_seq.num_searches = self.num_ops
+        await search_seq.start(self.env.get_sequencer())
+
+        cycles = (get_sim_time("ns") - start) / self.cfg.CLK_PERIOD
+        ops = 3 * self.num_ops
+        self.logger.info(f"Throughput ({self.cfg.issue_policy.name}): {ops} ops in {cycles:.0f} clk, "
+                         f"{ops / cycles if cycles else 0:.3f} ops/clk")
+
+        await Timer(100, units="ns")
+        self.drop_objection()
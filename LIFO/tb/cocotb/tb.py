@@ -5,6 +5,7 @@ from cocotb.triggers import Timer, RisingEdge, ReadOnly
 from cocotb.clock import Clock
 from cocotb_bus.drivers import BusDriver
 from cocotb_bus.monitors import BusMonitor
+from tbutils.tblog import OpsLog, get_logger
 
 DEPTH = 12 # DUT parameter
 DATA_WIDTH = 8 # DUT paramter
@@ -13,6 +14,7 @@ CLK_PERIOD = 20 # TB clk generator
 #SIM_TIMEOUT = 100000; // TB simulation time out
 MAX_DATA = 2**DATA_WIDTH - 1
 err_cnt = 0
+ops = OpsLog(get_logger("lifo"), "lifo")
 
 # lifo #(
 # .DEPTH(DEPTH), 
@@ -59,7 +61,7 @@ class OutputDriver(BusDriver):
             self.bus.wr_en.value = 1
             data_w = wr_data_array.pop()
             self.bus.data_wr.value = data_w
-            self.dut._log.info("Driver: Writting Data = %d",data_w)
+            ops.line("Driver: Writting Data = %d",data_w)
         await RisingEdge(self.clk)
         self.bus.wr_en.value = 0
         
@@ -67,7 +69,7 @@ class OutputDriver(BusDriver):
         for i in range(op_count):
             await RisingEdge(self.clk)
             self.bus.rd_en.value = 1
-            self.dut._log.info("Driver: Reading Data = %d",)
+            ops.line("Driver: Reading Data")
         await RisingEdge(self.clk)
         await Timer (1, units='ns')
         self.bus.rd_en.value = 0
@@ -81,7 +83,7 @@ class OutputDriver(BusDriver):
             self.bus.wr_en.value = 1
             data_w = wr_data_array.pop()
             self.bus.data_wr.value = data_w    
-            self.dut._log.info("Driver: Simultanenous read write, data = %d",data_w)
+            ops.line("Driver: Simultanenous read write, data = %d",data_w)
         await RisingEdge(self.clk)
         await Timer (1, units='ns')      
         self.bus.rd_en.value = 0
@@ -115,17 +117,17 @@ class InputMonitor(BusMonitor):
 
              if(rd_en_buf == 1 and wr_en_buf == 1):
                 if(self.bus.data_rd.value == data_wr_buf):
-                    self.dut._log.info("Monitor: Simultaneous Data read/write, ACT = %d, EXP = %d, FIFO entry = %d", self.bus.data_rd.value, data_wr_buf, len(lifo_expected))
+                    ops.info("simultaneous", "Monitor: Simultaneous Data read/write, ACT = %d, EXP = %d, FIFO entry = %d", self.bus.data_rd.value, data_wr_buf, len(lifo_expected))
              elif(wr_en_buf and len(lifo_expected) != DEPTH): 
                 lifo_expected.append(data_wr_buf)
-                self.dut._log.info("Monitor: Data write = %d, FIFO entry = %d", data_wr_buf, len(lifo_expected))
+                ops.info("write", "Monitor: Data write = %d, FIFO entry = %d", data_wr_buf, len(lifo_expected))
              elif(rd_en_buf == 1 and len(lifo_expected) != 0):
                 lifo_expected.pop()
-                self.dut._log.info("Monitor: Data read = %d, FIFO entry = %d", self.bus.data_rd.value, len(lifo_expected))
+                ops.info("read", "Monitor: Data read = %d, FIFO entry = %d", self.bus.data_rd.value, len(lifo_expected))
 
              if(len(lifo_expected) == 0):
                 if(self.bus.lifo_empty.value):
-                    self.dut._log.info("Monitor: LIFO is empty, lifo_full flag is asserted correctly")
+                    ops.line("Monitor: LIFO is empty, lifo_full flag is asserted correctly")
                 else:
                     self.dut._log.error("Monitor: LIFO is empty, but lifo_full flag is not asserted")
                     err_cnt += 1
@@ -134,7 +136,7 @@ class InputMonitor(BusMonitor):
              
              if(len(lifo_expected) == DEPTH):
                 if(self.bus.lifo_full.value):
-                    self.dut._log.info("Monitor: LIFO is full, lifo_full flag is asserted correctly")
+                    ops.line("Monitor: LIFO is full, lifo_full flag is asserted correctly")
                 else:
                     self.dut._log.error("Monitor: LIFO is full, but lifo_full flag is not asserted")
                     err_cnt += 1
@@ -153,6 +155,7 @@ async def dut_init(dut):
     DEPTH = dut.DEPTH.value 
     DATA_WIDTH = dut.DATA_WIDTH.value
     MAX_DATA = 2**DATA_WIDTH - 1
+    ops.reset()
     await cocotb.start(Clock(dut.clk, CLK_PERIOD, units="ns").start())
     dut.data_wr.value = 0
     dut.rd_en.value = 0
@@ -180,3 +183,4 @@ async def lifo_rand_op_test(dut):
         if (err_cnt > 0):
             cocotb.log.error("Errors count = %d",err_cnt)
             cocotb.result.test_fail()
+    ops.report()
@@ -54,7 +54,7 @@ class LifoVipDriver(uvm_driver):
 
         self.dut.wr_en.value = 0
 
-        self.logger.debug(f"PUSH: data=0x{item.data:x} full={item.full}")
+        self.logger.debug("PUSH: data=0x%x full=%s", item.data, item.full)
 
     async def drive_pop(self, item):
         """Drive POP operation"""
@@ -69,7 +69,7 @@ class LifoVipDriver(uvm_driver):
 
         self.dut.rd_en.value = 0
 
-        self.logger.debug(f"POP: data=0x{item.read_data:x} empty={item.empty}")
+        self.logger.debug("POP: data=0x%x empty=%s", item.read_data, item.empty)
 
     async def drive_idle(self):
         """Drive IDLE cycle"""
@@ -42,7 +42,7 @@ class LifoVipMonitor(uvm_monitor):
                 item.full = bool(self.dut.lifo_full.value)
                 item.success = not item.full
                 self.ap.write(item)
-                self.logger.debug(f"Observed PUSH: data=0x{item.data:x} full={item.full}")
+                self.logger.debug("Observed PUSH: data=0x%x full=%s", item.data, item.full)
 
             # Detect pop operation
             elif rd_en and not wr_en:
@@ -53,7 +53,7 @@ class LifoVipMonitor(uvm_monitor):
                 item.empty = bool(self.dut.lifo_empty.value)
                 item.success = not item.empty
                 self.ap.write(item)
-                self.logger.debug(f"Observed POP: data=0x{item.read_data:x} empty={item.empty}")
+                self.logger.debug("Observed POP: data=0x%x empty=%s", item.read_data, item.empty)
 
             # Detect simultaneous push/pop (bypass)
             elif wr_en and rd_en:
@@ -65,4 +65,4 @@ class LifoVipMonitor(uvm_monitor):
                 item.full = bool(self.dut.lifo_full.value)
                 item.empty = bool(self.dut.lifo_empty.value)
                 self.ap.write(item)
-                self.logger.debug(f"Observed BYPASS: wr=0x{item.data:x} rd=0x{item.read_data:x}")
+                self.logger.debug("Observed BYPASS: wr=0x%x rd=0x%x", item.data, item.read_data)
@@ -1,5 +1,6 @@
 """LIFO VIP Scoreboard"""
 from pyuvm import uvm_scoreboard, uvm_analysis_imp
+from tbutils.tblog import OpsLog
 from ..common import LifoOp
 
 class LifoVipScoreboard(uvm_scoreboard):
@@ -12,6 +13,7 @@ class LifoVipScoreboard(uvm_scoreboard):
         self.pop_count = 0
         self.error_count = 0
         self.bypass_count = 0
+        self.ops = OpsLog(self.logger, "scoreboard")
 
     def build_phase(self):
         super().build_phase()
@@ -35,7 +37,7 @@ class LifoVipScoreboard(uvm_scoreboard):
             # Successful push - add to model
             self.expected_queue.append(item.data)
             self.push_count += 1
-            self.logger.info(f"PUSH: data=0x{item.data:x} depth={len(self.expected_queue)}")
+            self.ops.info("push", "PUSH: data=0x%x depth=%s", item.data, len(self.expected_queue))
 
             # Check full flag
             if len(self.expected_queue) == self.cfg.DEPTH and not item.full:
@@ -46,7 +48,7 @@ class LifoVipScoreboard(uvm_scoreboard):
             if not item.full:
                 self.logger.error("Push failed but full flag not set")
                 self.error_count += 1
-            self.logger.info("PUSH failed - LIFO full")
+            self.ops.info("push_full", "PUSH failed - LIFO full")
 
     def check_pop(self, item):
         """Check POP operation"""
@@ -64,7 +66,7 @@ class LifoVipScoreboard(uvm_scoreboard):
                 self.logger.error(f"Data mismatch! Expected=0x{expected_data:x} Actual=0x{item.read_data:x}")
                 self.error_count += 1
             else:
-                self.logger.info(f"POP: data=0x{item.read_data:x} depth={len(self.expected_queue)} MATCH")
+                self.ops.info("pop", "POP: data=0x%x depth=%s MATCH", item.read_data, len(self.expected_queue))
 
             # Check empty flag
             if len(self.expected_queue) == 0 and not item.empty:
@@ -75,7 +77,7 @@ class LifoVipScoreboard(uvm_scoreboard):
             if not item.empty:
                 self.logger.error("Pop failed but empty flag not set")
                 self.error_count += 1
-            self.logger.info("POP failed - LIFO empty")
+            self.ops.info("pop_empty", "POP failed - LIFO empty")
 
     def report_phase(self):
         super().report_phase()
@@ -84,6 +86,7 @@ class LifoVipScoreboard(uvm_scoreboard):
         self.logger.info(f"Pop Count: {self.pop_count}")
         self.logger.info(f"Error Count: {self.error_count}")
         self.logger.info(f"Final Queue Depth: {len(self.expected_queue)}")
+        self.ops.report()
         self.logger.info("=" * 50)
 
         if self.error_count > 0:
@@ -8,6 +8,8 @@ from cocotb.clock import Clock
 from cocotb_bus.drivers import BusDriver
 from cocotb_bus.monitors import BusMonitor
 from cocotb.binary import BinaryValue
+from tbutils.tblog import OpsLog, get_logger
+from tbutils.clocked import ClockedIf
 
 #BIN string
 #BinaryValue(dut.data_wr.value, n_bits=8) ; BinaryValue.integar ; BinaryValue.hex ; BinaryValue.binstr; BinaryValue.signed_integer ; can represent x,z
@@ -34,6 +36,8 @@ OP_SORT_DES = 0b110
 OP_DELETE = 0b111
 
 err_cnt = 0
+ops = OpsLog(get_logger("list"), "list")
+clk_if = None # ClockedIf of dut.clk, drive and check point of every op
 
 #    list #(
 #       .DATA_WIDTH(DUT_DATA_WIDTH),
@@ -59,19 +63,17 @@ list_exp = []
 async def list_read(dut, index):
     global list_exp
     global err_cnt
-    cocotb.log.info("OP_READ at index %0d", index)
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    ops.info("list_read", "OP_READ at index %0d", index)
+    await clk_if.cycle()
     dut.op_sel.value = OP_READ
     dut.op_en.value = 1
     dut.index_in.value = index
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     if(dut.op_done.value == 0):
         await RisingEdge(dut.op_done)
     if (index >= len(list_exp)):
         if(dut.op_error.value == 1):
-            cocotb.log.info("Data read out of bound, fault flag is asserted correctly")
+            ops.line("Data read out of bound, fault flag is asserted correctly")
         else:
             cocotb.log.error("Data read out of bound, fault flag is not asserted")
             err_cnt += 1
@@ -81,31 +83,28 @@ async def list_read(dut, index):
             err_cnt += 1
         else:
             if (dut.data_out.value == list_exp[index]):
-                cocotb.log.info("Data read: %0d", dut.data_out.value)
+                ops.line("Data read: %0d", dut.data_out.value)
             else:
                 cocotb.log.error("Data read: %0d, Data Exp: %0d", dut.data_out.value, list_exp[index])
                 err_cnt += 1
-    await RisingEdge(dut.clk)
-    await Timer(1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     dut.op_en.value = 0
 
 async def list_read_n_burst(dut, n):
     global list_exp
     global err_cnt
-    cocotb.log.info("OP_READ_N_BURST for %d elements", n)
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    ops.info("list_read_n_burst", "OP_READ_N_BURST for %d elements", n)
+    await clk_if.cycle()
     dut.op_sel.value = OP_READ
     dut.op_en.value = 1
     dut.index_in.value = 0  # Start reading from index 0
     for i in range(n-1):
-        await RisingEdge(dut.clk)
-        await Timer(1, units='ns')  # Wait for the clock to stabilize
+        await clk_if.cycle()
         if(dut.op_done.value == 0):
             await RisingEdge(dut.op_done)
         if (i >= len(list_exp)):
             if(dut.op_error.value == 1):
-                cocotb.log.info("Data read out of bound, fault flag is asserted correctly")
+                ops.line("Data read out of bound, fault flag is asserted correctly")
             else:
                 cocotb.log.error("Data read out of bound, fault flag is not asserted")
                 err_cnt += 1
@@ -115,34 +114,31 @@ async def list_read_n_burst(dut, n):
                 err_cnt += 1
             else:
                 if (dut.data_out.value == list_exp[i]):
-                    cocotb.log.info("Data read: %0d", dut.data_out.value)
+                    ops.line("Data read: %0d", dut.data_out.value)
                 else:
                     cocotb.log.error("Data read: %0d, Data Exp: %0d", dut.data_out.value, list_exp[i])
                     err_cnt += 1
         dut.index_in.value = i + 1  # Update index for the next read
         
-    await RisingEdge(dut.clk)
-    await Timer(1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     dut.op_en.value = 0
 
 async def list_insert(dut, index, value):
     global list_exp
     global err_cnt
-    cocotb.log.info("OP_INSERT at index %0d, value %0d", index, value)
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    ops.info("list_insert", "OP_INSERT at index %0d, value %0d", index, value)
+    await clk_if.cycle()
     dut.op_sel.value = OP_INSERT
     dut.op_en.value = 1
     dut.data_in.value = value
     dut.index_in.value = index
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     if(dut.op_done.value == 0):
         await RisingEdge(dut.op_done)
     
     if (len(list_exp) >= DUT_LENGTH):
         if(dut.op_error.value == 1):
-            cocotb.log.info("Data insert out of bound, fault flag is asserted correctly")
+            ops.line("Data insert out of bound, fault flag is asserted correctly")
         else:
             cocotb.log.error("Data insert out of bound, fault flag is not asserted")
             err_cnt += 1
@@ -155,29 +151,26 @@ async def list_insert(dut, index, value):
         else:
             list_exp.insert(index, value)  # Insert the value at the specified inde
             
-    await RisingEdge(dut.clk)
-    await Timer(1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     dut.op_en.value = 0
 
-    cocotb.log.info("List content after insert: %s", list_exp)
+    ops.line("List content after insert: %s", list_exp)
 
 async def list_delete(dut, index):
     global list_exp
     global err_cnt
-    cocotb.log.info("OP_DELETE at index %0d", index)
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    ops.info("list_delete", "OP_DELETE at index %0d", index)
+    await clk_if.cycle()
     dut.op_sel.value = OP_DELETE
     dut.op_en.value = 1
     dut.index_in.value = index
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     if(dut.op_done.value == 0):
         await RisingEdge(dut.op_done)
     
     if (index >= len(list_exp)):
         if(dut.op_error.value == 1):
-            cocotb.log.info("Data delete out of bound, fault flag is asserted correctly")
+            ops.line("Data delete out of bound, fault flag is asserted correctly")
         else:
             cocotb.log.error("Data delete out of bound, fault flag is not asserted")
             err_cnt += 1
@@ -187,22 +180,19 @@ async def list_delete(dut, index):
             err_cnt += 1
         list_exp.pop(index)  # Update the expected list content
     
-    await RisingEdge(dut.clk)
-    await Timer(1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     dut.op_en.value = 0
 
-    cocotb.log.info("List content after delete: %s", list_exp)
+    ops.line("List content after delete: %s", list_exp)
 
 async def list_sum(dut):
     global list_exp
     global err_cnt
-    cocotb.log.info("OP_SUM")
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    ops.info("list_sum", "OP_SUM")
+    await clk_if.cycle()
     dut.op_sel.value = OP_SUM
     dut.op_en.value = 1
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     if (dut.op_done.value == 0):
         await RisingEdge(dut.op_done)
     
@@ -212,25 +202,22 @@ async def list_sum(dut):
 
     expected_sum = sum(list_exp)
     if (dut.data_out.value == expected_sum):
-        cocotb.log.info("Sum result: %0d", dut.data_out.value)
+        ops.line("Sum result: %0d", dut.data_out.value)
     else:
         cocotb.log.error("Sum result: %0d, Expected: %0d", dut.data_out.value, expected_sum)
         err_cnt += 1
     
-    await RisingEdge(dut.clk)
-    await Timer(1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     dut.op_en.value = 0
 
 async def list_sort_ascending(dut):
     global list_exp
     global err_cnt
-    cocotb.log.info("OP_SORT_ASC")
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    ops.info("list_sort_ascending", "OP_SORT_ASC")
+    await clk_if.cycle()
     dut.op_sel.value = OP_SORT_ASC
     dut.op_en.value = 1
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     if (dut.op_done.value == 0):
         await RisingEdge(dut.op_done)
     
@@ -240,22 +227,19 @@ async def list_sort_ascending(dut):
 
     list_exp.sort()
     
-    await RisingEdge(dut.clk)
-    await Timer(1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     dut.op_en.value = 0
 
-    cocotb.log.info("List content after sort ascending: %s", list_exp)
+    ops.line("List content after sort ascending: %s", list_exp)
 
 async def list_sort_descending(dut):
     global list_exp
     global err_cnt
-    cocotb.log.info("OP_SORT_DES")
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    ops.info("list_sort_descending", "OP_SORT_DES")
+    await clk_if.cycle()
     dut.op_sel.value = OP_SORT_DES
     dut.op_en.value = 1
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     if (dut.op_done.value == 0):
         await RisingEdge(dut.op_done)
     
@@ -265,23 +249,20 @@ async def list_sort_descending(dut):
 
     list_exp.sort(reverse=True)
     
-    await RisingEdge(dut.clk)
-    await Timer(1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     dut.op_en.value = 0
 
-    cocotb.log.info("List content after sort descending: %s", list_exp)
+    ops.line("List content after sort descending: %s", list_exp)
 
 async def list_find_1st_index(dut, value):
     global list_exp
     global err_cnt
-    cocotb.log.info("OP_FIND_1ST_INDEX for value %0d", value)
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    ops.info("list_find_1st_index", "OP_FIND_1ST_INDEX for value %0d", value)
+    await clk_if.cycle()
     dut.op_sel.value = OP_FIND_1ST_INDEX
     dut.op_en.value = 1
     dut.data_in.value = value
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     if(dut.op_done.value == 0):
         await RisingEdge(dut.op_done)
 
@@ -291,39 +272,36 @@ async def list_find_1st_index(dut, value):
             err_cnt += 1
         expected_index = list_exp.index(value)
         if (dut.data_out.value == expected_index):
-            cocotb.log.info("First index found: %0d", dut.data_out.value)
+            ops.line("First index found: %0d", dut.data_out.value)
         else:
             cocotb.log.error("First index found: %0d, Expected: %0d", dut.data_out.value, expected_index)
             err_cnt += 1
     else:
         if (dut.op_error.value == 1):
-            cocotb.log.info("Index is not found in list, fault flag is asserted correctly")
+            ops.line("Index is not found in list, fault flag is asserted correctly")
         else:
             cocotb.log.error("Index is not found in list, but fault flag is not asserted")
             err_cnt += 1
     
-    await RisingEdge(dut.clk)
-    await Timer(1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     dut.op_en.value = 0
 
 async def list_find_all_index(dut, value):
     global list_exp
     global err_cnt
-    cocotb.log.info("OP_FIND_ALL_INDEX for value %0d", value)
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    ops.info("list_find_all_index", "OP_FIND_ALL_INDEX for value %0d", value)
+    await clk_if.cycle()
     dut.op_sel.value = OP_FIND_ALL_INDEX
     dut.op_en.value = 1
     dut.data_in.value = value
-    await RisingEdge(dut.clk)
-    await Timer (1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     indices = [i for i, x in enumerate(list_exp) if x == value]
     cnt = 0
     if indices:
         while (cnt < len(indices)):
             if(dut.op_done.value == 1):
                 if(indices[cnt] == dut.data_out.value):
-                    cocotb.log.info("Value %0d found at index %0d", value, dut.data_out.value)
+                    ops.line("Value %0d found at index %0d", value, dut.data_out.value)
                 else:
                     cocotb.log.error("Value %0d found at index %0d, Expected: %0d", value, dut.data_out.value, indices[cnt])
                     err_cnt += 1
@@ -333,19 +311,17 @@ async def list_find_all_index(dut, value):
             if (dut.op_error.value == 1):
                 cocotb.log.error("Fault flag is asserted incorrectly")
                 err_cnt += 1
-            await RisingEdge(dut.clk)
-            await Timer(1, units='ns')
+            await clk_if.cycle()
     else:
         if (dut.op_done.value == 1):
             await RisingEdge(dut.op_done)
         if (dut.op_error.value == 1):
-            cocotb.log.info("Indices are not found in list, fault flag is asserted correctly")
+            ops.line("Indices are not found in list, fault flag is asserted correctly")
         else:
             cocotb.log.error("Indices are not found in list, but fault flag is not asserted")
             err_cnt += 1
     
-    await RisingEdge(dut.clk)
-    await Timer(1, units='ns')  # Wait for the clock to stabilize
+    await clk_if.cycle()
     dut.op_en.value = 0
 
 async def dut_init(dut):
@@ -356,6 +332,7 @@ async def dut_init(dut):
     global DATA_OUT_WIDTH 
     global MAX_VALUE 
     global list_exp
+    global clk_if
 
     DUT_DATA_WIDTH = dut.DATA_WIDTH.value
     DUT_LENGTH = dut.LENGTH.value
@@ -364,7 +341,10 @@ async def dut_init(dut):
     DATA_OUT_WIDTH = LENGTH_WIDTH + DUT_DATA_WIDTH
     MAX_VALUE = 2**DUT_DATA_WIDTH - 1
 
+    ops.reset()
+
     await cocotb.start(Clock(dut.clk, TB_CLK_PERIOD, units='ns').start())  # Start the clock generator
+    clk_if = ClockedIf(dut.clk, TB_CLK_PERIOD)
     dut.rst.value = 1
     dut.op_en.value = 0
     dut.op_sel.value = 0
@@ -418,6 +398,8 @@ async def basic_op_test(dut):
     #timeout_task.cancel()
     #task.kill()
 
+    ops.report()
+
     if (err_cnt > 0):
         cocotb.log.error("Errors count = %d",err_cnt)
         raise cocotb.result.TestFailure() 
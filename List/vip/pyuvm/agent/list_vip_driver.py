@@ -88,7 +88,7 @@ class ListVipDriver(uvm_driver):
         await RisingEdge(self.dut.clk)
         self.dut.op_en.value = 0
 
-        self.logger.debug(f"READ[{item.index}]: data=0x{item.result_data:x} error={item.op_error}")
+        self.logger.debug("READ[%s]: data=0x%x error=%s", item.index, item.result_data, item.op_error)
 
     async def drive_insert(self, item):
         """Drive INSERT operation"""
@@ -111,7 +111,7 @@ class ListVipDriver(uvm_driver):
         await RisingEdge(self.dut.clk)
         self.dut.op_en.value = 0
 
-        self.logger.debug(f"INSERT[{item.index}]: data=0x{item.data:x} error={item.op_error} len={item.current_len}")
+        self.logger.debug("INSERT[%s]: data=0x%x error=%s len=%s", item.index, item.data, item.op_error, item.current_len)
 
     async def drive_delete(self, item):
         """Drive DELETE operation"""
@@ -132,7 +132,7 @@ class ListVipDriver(uvm_driver):
         await RisingEdge(self.dut.clk)
         self.dut.op_en.value = 0
 
-        self.logger.debug(f"DELETE[{item.index}]: error={item.op_error} len={item.current_len}")
+        self.logger.debug("DELETE[%s]: error=%s len=%s", item.index, item.op_error, item.current_len)
 
     async def drive_find_1st(self, item):
         """Drive FIND_1ST operation"""
@@ -154,7 +154,7 @@ class ListVipDriver(uvm_driver):
         await RisingEdge(self.dut.clk)
         self.dut.op_en.value = 0
 
-        self.logger.debug(f"FIND_1ST(0x{item.data:x}): index={item.result_data} error={item.op_error}")
+        self.logger.debug("FIND_1ST(0x%x): index=%s error=%s", item.data, item.result_data, item.op_error)
 
     async def drive_find_all(self, item):
         """Drive FIND_ALL operation"""
@@ -175,7 +175,7 @@ class ListVipDriver(uvm_driver):
 
         self.dut.op_en.value = 0
 
-        self.logger.debug(f"FIND_ALL(0x{item.data:x}): completed error={item.op_error}")
+        self.logger.debug("FIND_ALL(0x%x): completed error=%s", item.data, item.op_error)
 
     async def drive_sum(self, item):
         """Drive SUM operation"""
@@ -195,7 +195,7 @@ class ListVipDriver(uvm_driver):
         await RisingEdge(self.dut.clk)
         self.dut.op_en.value = 0
 
-        self.logger.debug(f"SUM: result={item.result_data} error={item.op_error}")
+        self.logger.debug("SUM: result=%s error=%s", item.result_data, item.op_error)
 
     async def drive_sort_asc(self, item):
         """Drive SORT_ASC operation"""
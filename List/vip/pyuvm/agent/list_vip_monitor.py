@@ -7,8 +7,10 @@ Monitor for List VIP - observes DUT signals
 
 from pyuvm import *
 import cocotb
-from cocotb.triggers import RisingEdge
-from ..common.list_vip_seq_item import ListVipSeqItem
+from tbutils.snapshot import Snapshot
+from tbutils.tblog import lazy
+from tbutils.txn import BatchWriter, TxnPool
+from ..common.list_vip_seq_item import ListVipTxn
 from ..common.list_vip_types import ListOp
 from ..common.list_vip_config import ListVipConfig
 
@@ -21,54 +23,62 @@ class ListVipMonitor(uvm_monitor):
         self.dut = None
         self.cfg = None
         self.ap = uvm_analysis_port("ap", self)
+        self.pool = TxnPool(ListVipTxn)  # records go back to the pool once the subscribers returned
+        self.out = None
 
     def build_phase(self):
         super().build_phase()
         self.cfg = ConfigDB().get(self, "", "list_vip_cfg")
         if self.cfg is None:
             self.logger.error("No config object found")
+        self.out = BatchWriter(self.ap, self.cfg.batch_size, self.pool)
 
     async def run_phase(self):
         await self.get_dut()
 
+        # Edges without op_en (or op_done while waiting) are not sampled
+        issue = Snapshot(self.dut, ("op_sel", "data_in", "index_in"), self.dut.clk, qualifier="op_en",
+                         name="ListIssue")
+        result = Snapshot(self.dut, ("data_out", "op_error", "len"), self.dut.clk, qualifier="op_done",
+                          name="ListResult")
         while True:
-            await RisingEdge(self.dut.clk)
+            s = await issue.next()
+            item = self.pool.acquire()
 
-            # Detect operation when op_en is asserted
-            if self.dut.op_en.value:
-                item = ListVipSeqItem("monitored_item")
+            # Capture operation type
+            op_sel = s.op_sel
+            op_map = {
+                0b000: ListOp.READ,
+                0b001: ListOp.INSERT,
+                0b010: ListOp.FIND_ALL,
+                0b011: ListOp.FIND_1ST,
+                0b100: ListOp.SUM,
+                0b101: ListOp.SORT_ASC,
+                0b110: ListOp.SORT_DES,
+                0b111: ListOp.DELETE
+            }
+            item.op = op_map.get(op_sel, ListOp.IDLE)
 
-                # Capture operation type
-                op_sel = int(self.dut.op_sel.value)
-                op_map = {
-                    0b000: ListOp.READ,
-                    0b001: ListOp.INSERT,
-                    0b010: ListOp.FIND_ALL,
-                    0b011: ListOp.FIND_1ST,
-                    0b100: ListOp.SUM,
-                    0b101: ListOp.SORT_ASC,
-                    0b110: ListOp.SORT_DES,
-                    0b111: ListOp.DELETE
-                }
-                item.op = op_map.get(op_sel, ListOp.IDLE)
+            # Capture inputs
+            item.data = s.data_in
+            item.index = s.index_in
 
-                # Capture inputs
-                item.data = int(self.dut.data_in.value)
-                item.index = int(self.dut.index_in.value)
+            # Wait for operation to complete
+            r = await result.next()
 
-                # Wait for operation to complete
-                await RisingEdge(self.dut.clk)
-                while not self.dut.op_done.value:
-                    await RisingEdge(self.dut.clk)
+            # Capture outputs
+            item.result_data = r.data_out
+            item.op_done = True
+            item.op_error = bool(r.op_error)
+            item.current_len = r.len
 
-                # Capture outputs
-                item.result_data = int(self.dut.data_out.value)
-                item.op_done = bool(self.dut.op_done.value)
-                item.op_error = bool(self.dut.op_error.value)
-                item.current_len = int(self.dut.len.value)
+            self.logger.debug("Observed %s: %s", item.op.name, lazy(item.convert2string))
+            self.out.write(item, flush=item.op_error)  # an op_error goes out without waiting for the block
 
-                self.ap.write(item)
-                self.logger.debug(f"Observed {item.op.name}: {item.convert2string()}")
+    def extract_phase(self):
+        """End of test: deliver the last block"""
+        super().extract_phase()
+        self.out.flush()
 
     async def get_dut(self):
         """Get DUT handle from ConfigDB"""
@@ -5,11 +5,12 @@ Contains configuration, types, and sequence item definitions
 
 from .list_vip_types import ListOp, ListAgentMode
 from .list_vip_config import ListVipConfig
-from .list_vip_seq_item import ListVipSeqItem
+from .list_vip_seq_item import ListVipSeqItem, ListVipTxn
 
 __all__ = [
     'ListOp',
     'ListAgentMode',
     'ListVipConfig',
     'ListVipSeqItem',
+    'ListVipTxn',
 ]
@@ -6,6 +6,7 @@ Configuration class for List VIP
 """
 
 from pyuvm import *
+from tbutils.txn import batch_size_from_env
 
 
 class ListVipConfig(uvm_object):
@@ -23,6 +24,7 @@ class ListVipConfig(uvm_object):
         self.has_agent = True
         self.enable_scoreboard = True
         self.is_active = True
+        self.batch_size = batch_size_from_env()  # TB_BATCH: monitor to scoreboard blocks, 0 per transaction
 
     def do_print(self, printer=None):
         """Print configuration"""
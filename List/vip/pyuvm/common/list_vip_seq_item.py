@@ -6,6 +6,7 @@ Transaction item for List operations
 """
 
 from pyuvm import *
+from tbutils.txn import Txn
 import random
 from .list_vip_types import ListOp
 
@@ -61,3 +62,12 @@ class ListVipSeqItem(uvm_sequence_item):
         return (f"Op:{self.op.name} Data:0x{self.data:x} Index:{self.index} "
                 f"Result:0x{self.result_data:x} Done:{self.op_done} "
                 f"Error:{self.op_error} Len:{self.current_len}")
+
+
+class ListVipTxn(Txn):
+    """Monitored List transaction, pooled by the monitor, to_item() gives a ListVipSeqItem"""
+
+    __slots__ = ("op", "data", "index", "result_data", "op_done", "op_in_progress", "op_error", "current_len")
+    defaults = (ListOp.READ, 0, 0, 0, False, False, False, 0)
+    item_type = ListVipSeqItem
+    convert2string = ListVipSeqItem.convert2string
@@ -6,6 +6,8 @@ Scoreboard for List VIP - self-checking component with list model
 """
 
 from pyuvm import *
+from tbutils.tblog import OpsLog
+from tbutils.txn import TxnBatch
 from ..common.list_vip_seq_item import ListVipSeqItem
 from ..common.list_vip_types import ListOp
 from ..common.list_vip_config import ListVipConfig
@@ -26,6 +28,7 @@ class ListVipScoreboard(uvm_scoreboard):
         self.search_count = 0
         self.sort_count = 0
         self.sum_count = 0
+        self.ops = OpsLog(self.logger, "scoreboard")
 
     def build_phase(self):
         super().build_phase()
@@ -39,6 +42,8 @@ class ListVipScoreboard(uvm_scoreboard):
 
     def write(self, item):
         """Analysis write method - called by monitor"""
+        if type(item) is TxnBatch:
+            return self.write_batch(item)
         if item.op == ListOp.READ:
             self.check_read(item)
         elif item.op == ListOp.INSERT:
@@ -61,6 +66,12 @@ class ListVipScoreboard(uvm_scoreboard):
             self.logger.error(f"Length mismatch! Expected={len(self.list_model)} Actual={item.current_len}")
             self.error_count += 1
 
+    def write_batch(self, batch):
+        """Block of transactions from a batching monitor (TB_BATCH), checked in order against the model"""
+        write = self.write
+        for item in batch:
+            write(item)
+
     def check_read(self, item):
         """Check READ operation"""
         self.read_count += 1
@@ -79,7 +90,7 @@ class ListVipScoreboard(uvm_scoreboard):
                 self.logger.error(f"READ[{item.index}]: Data mismatch! Expected=0x{self.list_model[item.index]:x} Actual=0x{item.result_data:x}")
                 self.error_count += 1
             else:
-                self.logger.info(f"READ[{item.index}]: data=0x{item.result_data:x} MATCH")
+                self.ops.info("read", "READ[%s]: data=0x%x MATCH", item.index, item.result_data)
 
     def check_insert(self, item):
         """Check INSERT operation"""
@@ -102,7 +113,7 @@ class ListVipScoreboard(uvm_scoreboard):
             else:
                 # Insert at index
                 self.list_model.insert(item.index, item.data)
-            self.logger.info(f"INSERT[{item.index}]: data=0x{item.data:x} len={len(self.list_model)}")
+            self.ops.info("insert", "INSERT[%s]: data=0x%x len=%s", item.index, item.data, len(self.list_model))
 
     def check_delete(self, item):
         """Check DELETE operation"""
@@ -119,7 +130,7 @@ class ListVipScoreboard(uvm_scoreboard):
                 self.logger.error(f"DELETE[{item.index}]: Should not error")
                 self.error_count += 1
             del self.list_model[item.index]
-            self.logger.info(f"DELETE[{item.index}]: len={len(self.list_model)}")
+            self.ops.info("delete", "DELETE[%s]: len=%s", item.index, len(self.list_model))
 
     def check_find_1st(self, item):
         """Check FIND_1ST operation"""
@@ -146,12 +157,12 @@ class ListVipScoreboard(uvm_scoreboard):
                 self.logger.error(f"FIND_1ST(0x{item.data:x}): Index mismatch! Expected={found_idx} Actual={item.result_data}")
                 self.error_count += 1
             else:
-                self.logger.info(f"FIND_1ST(0x{item.data:x}): index={found_idx} MATCH")
+                self.ops.info("find_1st", "FIND_1ST(0x%x): index=%s MATCH", item.data, found_idx)
 
     def check_find_all(self, item):
         """Check FIND_ALL operation (simplified)"""
         self.search_count += 1
-        self.logger.info(f"FIND_ALL(0x{item.data:x}): Completed")
+        self.ops.info("find_all", "FIND_ALL(0x%x): Completed", item.data)
 
     def check_sum(self, item):
         """Check SUM operation"""
@@ -163,19 +174,19 @@ class ListVipScoreboard(uvm_scoreboard):
             self.logger.error(f"SUM: Mismatch! Expected={expected_sum} Actual={item.result_data}")
             self.error_count += 1
         else:
-            self.logger.info(f"SUM: result={expected_sum} MATCH")
+            self.ops.info("sum", "SUM: result=%s MATCH", expected_sum)
 
     def check_sort_asc(self, item):
         """Check SORT_ASC operation"""
         self.sort_count += 1
         self.list_model.sort()
-        self.logger.info("SORT_ASC: Updated model")
+        self.ops.info("sort_asc", "SORT_ASC: Updated model")
 
     def check_sort_des(self, item):
         """Check SORT_DES operation"""
         self.sort_count += 1
         self.list_model.sort(reverse=True)
-        self.logger.info("SORT_DES: Updated model")
+        self.ops.info("sort_des", "SORT_DES: Updated model")
 
     def report_phase(self):
         """Report statistics"""
@@ -189,6 +200,7 @@ class ListVipScoreboard(uvm_scoreboard):
         self.logger.info(f"Sum Count: {self.sum_count}")
         self.logger.info(f"Error Count: {self.error_count}")
         self.logger.info(f"Final List Size: {len(self.list_model)}")
+        self.ops.report()
         self.logger.info("=" * 50)
 
         if self.error_count > 0:
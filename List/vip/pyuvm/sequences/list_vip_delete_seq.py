@@ -30,4 +30,4 @@ class ListVipDeleteSeq(ListVipBaseSeq):
             await self.start_item(item)
             await self.finish_item(item)
 
-            self.logger.info(f"Delete #{i}: index={item.index}")
+            self.logger.info("Delete #%s: index=%s", i, item.index)
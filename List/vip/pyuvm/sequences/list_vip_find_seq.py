@@ -33,4 +33,4 @@ class ListVipFindSeq(ListVipBaseSeq):
             await self.start_item(item)
             await self.finish_item(item)
 
-            self.logger.info(f"Find #{i}: data=0x{item.data:x} op={op.name}")
+            self.logger.info("Find #%s: data=0x%x op=%s", i, item.data, op.name)
@@ -36,4 +36,4 @@ class ListVipInsertSeq(ListVipBaseSeq):
             await self.start_item(item)
             await self.finish_item(item)
 
-            self.logger.info(f"Insert #{i}: data=0x{item.data:x} index={item.index}")
+            self.logger.info("Insert #%s: data=0x%x index=%s", i, item.data, item.index)
@@ -30,4 +30,4 @@ class ListVipReadSeq(ListVipBaseSeq):
             await self.start_item(item)
             await self.finish_item(item)
 
-            self.logger.info(f"Read #{i}: index={item.index}")
+            self.logger.info("Read #%s: index=%s", i, item.index)
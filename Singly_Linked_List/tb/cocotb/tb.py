@@ -7,6 +7,8 @@ from cocotb.clock import Clock
 from cocotb_bus.drivers import BusDriver
 from cocotb_bus.monitors import BusMonitor
 from cocotb.binary import BinaryValue
+from tbutils.linked_list_model import LinkedListModel
+from tbutils.tblog import OpsLog, get_logger
 
 #BIN string
 #BinaryValue(dut.data_wr.value, n_bits=8) ; BinaryValue.integar ; BinaryValue.hex ; BinaryValue.binstr; BinaryValue.signed_integer ; can represent x,z
@@ -28,6 +30,7 @@ TB_CLK_PERIOD = 30 # TB clk generator
 TB_SIM_TIMEOUT = 30 # TB sim timeout 30ms
 TB_TEST_WEIGHT = 1
 err_cnt = 0
+ops = OpsLog(get_logger("singly_linked_list"), "singly_linked_list")
 
 # singly_linked_list #(.DATA_WIDTH(DUT_DATA_WIDTH),.MAX_NODE(DUT_MAX_NODE)) DUT
 # (   /*input*/  .rst(rst),
@@ -48,56 +51,18 @@ err_cnt = 0
 #     /*output reg*/  .fault(fault) // Invalid Errors 
 # );
 
-# Actual Python linked_list class: https://www.datacamp.com/tutorial/python-linked-lists
-# To mimic harware linked_list, we need to keep track of the address of each node, model in below way also for our ease of debug. 
-class singly_linked_list:
+# To mimic harware linked_list, the model keeps a node table indexed by address (Utils/tb/tbutils/linked_list_model.py)
+class singly_linked_list(LinkedListModel):
     def __init__(self, dut):
+        super().__init__(MAX_NODE, doubly=False, addr_null=ADDR_NULL)
         self.dut = dut
-        self.linked_list_value = []
-        self.linked_list_addr = []
-
-    def remove(self, index):
-        self.linked_list_value.pop(index)
-        self.linked_list_addr.pop(index)
-
-    def find_next_addr(self):
-        for i in range(len(self.linked_list_addr)+2):
-            if i not in self.linked_list_addr:
-                return i
-
-    def insert_by_addr(self, addr, data):
-        if(addr == -1):
-            self.linked_list_value.append(data)
-            self.linked_list_addr.append(self.find_next_addr())
-        else:
-            self.linked_list_value.insert(self.linked_list_addr.index(addr), data)
-            self.linked_list_addr.insert(self.linked_list_addr.index(addr), self.find_next_addr())
-
-    def insert_by_index(self, index, data):
-        if(index == -1):
-            self.linked_list_value.append(data)
-            self.linked_list_addr.append(self.find_next_addr())
-        else:
-            self.linked_list_value.insert(index, data)
-            self.linked_list_addr.insert(index, self.find_next_addr())
-
-    def delete_by_value(self, data):
-        self.linked_list_addr.remove(self.linked_list_value.index(data))
-        self.linked_list_value.remove(data)
-        
-    def delete_by_addr(self, addr):
-        self.linked_list_value.pop(self.linked_list_addr.index(addr))
-        self.linked_list_addr.pop(self.linked_list_addr.index(addr))
-
-    def read_by_addr(self, addr):
-        return self.linked_list_value[self.linked_list_addr.index(addr)]
 
     def print_content(self):
-        cocotb.log.info(f"Linked List Content: value = {self.linked_list_value}, addr = {self.linked_list_addr}")
+        ops.line("Linked List Content: %s", self)
 
 async def read_n(dut, list_exp, n):
     global err_cnt
-    cocotb.log.info("OP_Read %0d values", n)
+    ops.info("read_n", "OP_Read %0d values", n)
     i = 0
     await RisingEdge(dut.clk)
     await Timer (1, units = 'ns')
@@ -109,16 +74,16 @@ async def read_n(dut, list_exp, n):
         await RisingEdge(dut.clk)
         await Timer (1, units = 'ns')
         if (dut.op_done.value == 1):
-            if( (i-1) >= len(list_exp.linked_list_addr)):
+            if( (i-1) >= len(list_exp)):
                 if(dut.fault.value == 1):
-                    cocotb.log.info("Data read out of bound, fault flag is asserted correctly")
+                    ops.line("Data read out of bound, fault flag is asserted correctly")
                 else:
                     cocotb.log.error("Data read out of bound, fault flag is not asserted")
                     err_cnt += 1
-            elif (list_exp.linked_list_value[i-1] == dut.data_out.value):
-                cocotb.log.info("Data read : %0d at Index %0d", dut.data_out.value, i-1)
+            elif (list_exp.value_at(i-1) == dut.data_out.value):
+                ops.line("Data read : %0d at Index %0d", dut.data_out.value, i-1)
             else:
-                cocotb.log.error("Data read at Index %0d is Correct, ACT: %0d, EXP: %0d", i-1, dut.data_out.value, list_exp.linked_list_value[i-1])
+                cocotb.log.error("Data read at Index %0d is Correct, ACT: %0d, EXP: %0d", i-1, dut.data_out.value, list_exp.value_at(i-1))
                 err_cnt += 1
             if(i==n):
                 dut.op_start.value = 0
@@ -128,7 +93,7 @@ async def read_n(dut, list_exp, n):
 
 async def delete_value(dut, list_exp, value):
      global err_cnt
-     cocotb.log.info("OP_Delete_Value %0d value", value)
+     ops.info("delete_value", "OP_Delete_Value %0d value", value)
      i = 0
      found = 0
      await RisingEdge(dut.clk)
@@ -138,15 +103,14 @@ async def delete_value(dut, list_exp, value):
      dut.op_start.value = 1
      await RisingEdge(dut.op_done)
      await Timer (1, units = 'ns')
-     for i in range(len(list_exp.linked_list_addr)):
-         if list_exp.linked_list_value[i] == value:
-             cocotb.log.info("Data %0d at Index %0d is Deleted_by_Value", value, i)
-             list_exp.remove(i)
-             found = 1
-             break
+     i = list_exp.index_of_value(value)
+     if i is not None:
+         ops.line("Data %0d at Index %0d is Deleted_by_Value", value, i)
+         list_exp.remove(i)
+         found = 1
      if found == 0:
          if(dut.fault.value == 1):
-             cocotb.log.info("Data delete out of bound, fault flag is asserted correctly")
+             ops.line("Data delete out of bound, fault flag is asserted correctly")
          else:
              cocotb.log.error("Data delete out of bound, fault flag is not asserted")
              err_cnt += 1
@@ -159,7 +123,7 @@ async def delete_value(dut, list_exp, value):
 
 async def delete_at_index(dut, list_exp, index):
     global err_cnt
-    cocotb.log.info("OP_Delete_At_Index %0d index", index)
+    ops.info("delete_at_index", "OP_Delete_At_Index %0d index", index)
     await RisingEdge(dut.clk)
     await Timer (1, units = 'ns')
     dut.op.value = OP_Delete_At_Index
@@ -167,9 +131,9 @@ async def delete_at_index(dut, list_exp, index):
     dut.op_start.value = 1
     await RisingEdge(dut.op_done)
     await Timer (1, units = 'ns')
-    if (index >= len(list_exp.linked_list_addr)):
+    if (index >= len(list_exp)):
         if(dut.fault.value == 1):
-            cocotb.log.info("Data delete out of bound, fault flag is asserted correctly")
+            ops.line("Data delete out of bound, fault flag is asserted correctly")
         else:
             cocotb.log.error("Data delete out of bound, fault flag is not asserted")
             err_cnt += 1
@@ -177,20 +141,20 @@ async def delete_at_index(dut, list_exp, index):
         if(dut.fault.value == 1):
             cocotb.log.error("Fault flag is asserted incorrectly")
             err_cnt += 1
-        cocotb.log.info("Data %0d at Front is Deleted_by_Index", list_exp.linked_list_value[0])
+        ops.line("Data %0d at Front is Deleted_by_Index", list_exp.value_at(0))
         list_exp.remove(0)
     else:
         if(dut.fault.value == 1):
             cocotb.log.error("Fault flag is asserted incorrectly")
             err_cnt += 1
-        cocotb.log.info("Data %0d at Index %0d is Deleted_by_Index", list_exp.linked_list_value[index], index)
+        ops.line("Data %0d at Index %0d is Deleted_by_Index", list_exp.value_at(index), index)
         list_exp.remove(index)
     dut.op_start.value = 0
     list_exp.print_content()
 
 async def insert_at_index(dut, list_exp, index, data):
     global err_cnt
-    cocotb.log.info("OP_Insert_At_Index %0d index, %0d data", index, data)
+    ops.info("insert_at_index", "OP_Insert_At_Index %0d index, %0d data", index, data)
     await RisingEdge(dut.clk)
     await Timer (1, units = 'ns')
     dut.op.value = OP_Insert_At_Index
@@ -199,9 +163,9 @@ async def insert_at_index(dut, list_exp, index, data):
     dut.op_start.value = 1
     await RisingEdge(dut.op_done)
     await Timer (1, units = 'ns')
-    if (len(list_exp.linked_list_value) >= MAX_NODE):
+    if (len(list_exp) >= MAX_NODE):
         if(dut.fault.value == 1):
-            cocotb.log.info("Data insert out of bound, fault flag is asserted correctly")
+            ops.line("Data insert out of bound, fault flag is asserted correctly")
         else:
             cocotb.log.error("Data insert out of bound, fault flag is not asserted")
             err_cnt += 1
@@ -210,22 +174,22 @@ async def insert_at_index(dut, list_exp, index, data):
             cocotb.log.error("Fault flag is asserted incorrectly")
             err_cnt += 1
         list_exp.insert_by_index(0, data)
-        cocotb.log.info("Data %0d at Front is Inserted_by_Index", data)
-    elif (index >= len(list_exp.linked_list_value)):
+        ops.line("Data %0d at Front is Inserted_by_Index", data)
+    elif (index >= len(list_exp)):
         if(dut.fault.value == 1):
             cocotb.log.error("Fault flag is asserted incorrectly")
             err_cnt += 1
         list_exp.insert_by_index(-1, data)
-        cocotb.log.info("Data %0d at End is Inserted_by_Index", data)
+        ops.line("Data %0d at End is Inserted_by_Index", data)
     else:
         if(dut.fault.value == 1):
             cocotb.log.error("Fault flag is asserted incorrectly")
             err_cnt += 1
         list_exp.insert_by_index(index, data)
-        cocotb.log.info("Data %0d at Index %0d is Inserted_by_Index", data, index)
-    if(len(list_exp.linked_list_value) >= MAX_NODE):
+        ops.line("Data %0d at Index %0d is Inserted_by_Index", data, index)
+    if(len(list_exp) >= MAX_NODE):
         if(dut.full.value == 1):
-            cocotb.log.info("Full flag is asserted correctly")
+            ops.line("Full flag is asserted correctly")
         else:
             cocotb.log.error("Full flag is not asserted")
             err_cnt += 1
@@ -237,7 +201,7 @@ async def insert_at_index(dut, list_exp, index, data):
 
 async def delete_at_addr (dut, list_exp, addr):
     global err_cnt
-    cocotb.log.info("OP_Delete_At_Addr %0d addr", addr)
+    ops.info("delete_at_addr", "OP_Delete_At_Addr %0d addr", addr)
     await RisingEdge(dut.clk)
     await Timer (1, units = 'ns')
     dut.op.value = OP_Delete_At_Addr
@@ -250,7 +214,7 @@ async def delete_at_addr (dut, list_exp, addr):
     await Timer (1, units = 'ns')
     if (addr >= ADDR_NULL):
         if(dut.fault.value == 1):
-            cocotb.log.info("Data delete out of bound, fault flag is asserted correctly")
+            ops.line("Data delete out of bound, fault flag is asserted correctly")
         else:
             cocotb.log.error("Data delete out of bound, fault flag is not asserted")
             err_cnt += 1
@@ -258,16 +222,16 @@ async def delete_at_addr (dut, list_exp, addr):
         if(dut.fault.value == 1):
             cocotb.log.error("Fault flag is asserted incorrectly")
             err_cnt += 1
-        cocotb.log.info("Data %0d at Front is Deleted_by_Addr", list_exp.linked_list_value[0])
+        ops.line("Data %0d at Front is Deleted_by_Addr", list_exp.value_at(0))
         list_exp.remove(0)
     elif (addr == pre_tail):
         if(dut.fault.value == 1):
             cocotb.log.error("Fault flag is asserted incorrectly")
             err_cnt += 1
-        cocotb.log.info("Data %0d at Back is Deleted_by_Addr", list_exp.linked_list_value[0])
+        ops.line("Data %0d at Back is Deleted_by_Addr", list_exp.value_at(-1))
         list_exp.remove(-1)
     else:
-        if(addr not in list_exp.linked_list_addr):
+        if(addr not in list_exp):
             if(dut.fault.value == 0):
                 cocotb.log.error("Fault flag is not asserted")
                 err_cnt += 1
@@ -275,11 +239,11 @@ async def delete_at_addr (dut, list_exp, addr):
             if(dut.fault.value == 1):
                 cocotb.log.error("Fault flag is asserted incorrectly")
                 err_cnt += 1
-            cocotb.log.info("Data %0d at Addr %0d is Inserted_by_Addr", list_exp.linked_list_value[list_exp.linked_list_addr.index(addr)], addr)
+            ops.line("Data %0d at Addr %0d is Inserted_by_Addr", list_exp.read_by_addr(addr), addr)
             list_exp.delete_by_addr(addr)
-    if(len(list_exp.linked_list_value) == 0):
+    if(len(list_exp) == 0):
         if(dut.empty.value == 1):
-            cocotb.log.info("Full flag is asserted correctly")
+            ops.line("Full flag is asserted correctly")
         else:
             cocotb.log.error("Full flag is not asserted")
             err_cnt += 1
@@ -291,7 +255,7 @@ async def delete_at_addr (dut, list_exp, addr):
 
 async def insert_at_addr(dut, list_exp, addr, data):
     global err_cnt
-    cocotb.log.info("OP_Insert_At_Addr %0d addr, %0d data", addr, data)
+    ops.info("insert_at_addr", "OP_Insert_At_Addr %0d addr, %0d data", addr, data)
     await RisingEdge(dut.clk)
     await Timer (1, units = 'ns')
     dut.op.value = OP_Insert_At_Addr
@@ -303,9 +267,9 @@ async def insert_at_addr(dut, list_exp, addr, data):
 
     await RisingEdge(dut.op_done)
     await Timer (1, units = 'ns')
-    if (len(list_exp.linked_list_value) >= MAX_NODE):
+    if (len(list_exp) >= MAX_NODE):
         if(dut.fault.value == 1):
-            cocotb.log.info("Data insert out of bound, fault flag is asserted correctly")
+            ops.line("Data insert out of bound, fault flag is asserted correctly")
         else:
             cocotb.log.error("Data insert out of bound, fault flag is not asserted")
             err_cnt += 1
@@ -314,21 +278,21 @@ async def insert_at_addr(dut, list_exp, addr, data):
             cocotb.log.error("Fault flag is asserted incorrectly")
             err_cnt += 1
         list_exp.insert_by_addr(-1, data)
-        cocotb.log.info("Data %0d at End is Inserted_by_Addr", data)
+        ops.line("Data %0d at End is Inserted_by_Addr", data)
     elif (addr == pre_head):
         if(dut.fault.value == 1):
             cocotb.log.error("Fault flag is asserted incorrectly")
             err_cnt += 1
         list_exp.insert_by_addr(addr, data)
-        cocotb.log.info("Data %0d at Front is Inserted_by_Addr", data)
+        ops.line("Data %0d at Front is Inserted_by_Addr", data)
     elif (addr == pre_tail):
         if(dut.fault.value == 1):
             cocotb.log.error("Fault flag is asserted incorrectly")
             err_cnt += 1
-        list_exp.insert_by_index(len(list_exp.linked_list_value)-1, data)
-        cocotb.log.info("Data %0d at End is Inserted_by_Addr", data)
+        list_exp.insert_by_index(len(list_exp)-1, data)
+        ops.line("Data %0d at End is Inserted_by_Addr", data)
     else:
-        if(addr not in list_exp.linked_list_addr):
+        if(addr not in list_exp):
             if(dut.fault.value == 0):
                 cocotb.log.error("Fault flag is not asserted")
                 err_cnt += 1
@@ -337,10 +301,10 @@ async def insert_at_addr(dut, list_exp, addr, data):
                 cocotb.log.error("Fault flag is asserted incorrectly")
                 err_cnt += 1
             list_exp.insert_by_addr(addr, data)
-            cocotb.log.info("Data %0d at Addr %0d is Inserted_by_Addr", data, addr)
-    if(len(list_exp.linked_list_value) >= MAX_NODE):
+            ops.line("Data %0d at Addr %0d is Inserted_by_Addr", data, addr)
+    if(len(list_exp) >= MAX_NODE):
         if(dut.full.value == 1):
-            cocotb.log.info("Full flag is asserted correctly")
+            ops.line("Full flag is asserted correctly")
         else:
             cocotb.log.error("Full flag is not asserted")
             err_cnt += 1
@@ -359,6 +323,7 @@ async def dut_init(dut):
     MAX_NODE = dut.MAX_NODE.value
     ADDR_NULL = MAX_NODE
     MAX_DATA  = 2**DATA_WIDTH - 1
+    ops.reset()
     await cocotb.start(Clock(dut.clk, TB_CLK_PERIOD, units="ns").start())
     dut.data_in.value = 0
     dut.addr_in.value = 0
@@ -387,7 +352,7 @@ async def index_op_test(dut):
     await insert_at_index(dut,list_exp,ADDR_NULL,1)
     await insert_at_index(dut,list_exp,0,3)
     await Timer(200, units = 'ns')
-    await read_n(dut,list_exp,len(list_exp.linked_list_value))
+    await read_n(dut,list_exp,len(list_exp))
     await Timer(200, units = 'ns')
     await delete_value(dut,list_exp,7)
     await delete_at_index(dut,list_exp,0)
@@ -403,6 +368,8 @@ async def index_op_test(dut):
     await delete_at_index(dut,list_exp,0)    
     await Timer(200, units = 'ns')
 
+    ops.report()
+
     if (err_cnt > 0):
         cocotb.log.error("Errors count = %d",err_cnt)
         cocotb.result.test_fail()
@@ -417,7 +384,7 @@ async def addr_op_test(dut):
     await Timer(100, units='ns')
     await insert_at_addr(dut, list_exp, int(dut.head.value), 5)
     await insert_at_addr(dut, list_exp, int(dut.head.value), 6)
-    await insert_at_addr(dut, list_exp, list_exp.linked_list_addr[2], 7)
+    await insert_at_addr(dut, list_exp, list_exp.addr_at(2), 7)
     await insert_at_addr(dut, list_exp, 0, 3)
     await insert_at_addr(dut, list_exp, int(dut.head.value), 4)
     await insert_at_addr(dut, list_exp, int(dut.tail.value), 3)
@@ -425,13 +392,13 @@ async def addr_op_test(dut):
     await insert_at_addr(dut, list_exp, ADDR_NULL, 1)
     await insert_at_addr(dut, list_exp, 0, 3)
     await Timer(200, units='ns')
-    await read_n(dut, list_exp, len(list_exp.linked_list_value))
+    await read_n(dut, list_exp, len(list_exp))
     await Timer(500, units='ns')
     await delete_value(dut, list_exp, 7)
     await delete_at_addr(dut, list_exp, 0)
     await delete_at_addr(dut, list_exp, 0)
     await delete_value(dut, list_exp, 2)
-    await read_n(dut, list_exp, len(list_exp.linked_list_value))
+    await read_n(dut, list_exp, len(list_exp))
     await delete_value(dut, list_exp, 4)
     await delete_at_addr(dut, list_exp, 0)
     await delete_at_addr(dut, list_exp, 7)
@@ -440,6 +407,8 @@ async def addr_op_test(dut):
     await delete_at_addr(dut, list_exp, 0)
     await Timer(500, units='ns')
 
+    ops.report()
+
     if (err_cnt > 0):
         cocotb.log.error("Errors count = %d",err_cnt)
         cocotb.result.test_fail()
@@ -77,4 +77,4 @@ class SllVipDriver(uvm_driver):
         await RisingEdge(self.dut.clk)
         self.dut.op_start.value = 0
 
-        self.logger.debug(f"{item.op.name}: addr={item.addr} data=0x{item.data:x} fault={item.fault}")
+        self.logger.debug("%s: addr=%s data=0x%x fault=%s", item.op.name, item.addr, item.data, item.fault)
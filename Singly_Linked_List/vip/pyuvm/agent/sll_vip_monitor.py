@@ -7,8 +7,10 @@ Monitor for Singly Linked List VIP - observes DUT signals
 
 from pyuvm import *
 import cocotb
-from cocotb.triggers import RisingEdge
-from ..common.sll_vip_seq_item import SllVipSeqItem
+from tbutils.snapshot import Snapshot
+from tbutils.tblog import lazy
+from tbutils.txn import TxnPool
+from ..common.sll_vip_seq_item import SllVipTxn
 from ..common.sll_vip_types import SllOp
 from ..common.sll_vip_config import SllVipConfig
 
@@ -21,6 +23,7 @@ class SllVipMonitor(uvm_monitor):
         self.dut = None
         self.cfg = None
         self.ap = uvm_analysis_port("ap", self)
+        self.pool = TxnPool(SllVipTxn)  # records go back to the pool once the subscribers returned
 
     def build_phase(self):
         super().build_phase()
@@ -31,46 +34,47 @@ class SllVipMonitor(uvm_monitor):
     async def run_phase(self):
         await self.get_dut()
 
+        # Edges without op_start (or op_done while waiting) are not sampled
+        issue = Snapshot(self.dut, ("op", "data_in", "addr_in"), self.dut.clk, qualifier="op_start",
+                         name="SllIssue")
+        result = Snapshot(self.dut, ("data_out", "next_node_addr", "fault", "length", "head", "tail"),
+                          self.dut.clk, qualifier="op_done", name="SllResult")
         while True:
-            await RisingEdge(self.dut.clk)
+            s = await issue.next()
+            item = self.pool.acquire()
 
-            # Detect operation when op_start is asserted
-            if self.dut.op_start.value:
-                item = SllVipSeqItem("monitored_item")
+            # Capture operation type
+            op_val = s.op
+            op_map = {
+                0: SllOp.READ_ADDR,
+                1: SllOp.INSERT_AT_ADDR,
+                2: SllOp.DELETE_VALUE,
+                3: SllOp.DELETE_AT_ADDR,
+                4: SllOp.IDLE,
+                5: SllOp.INSERT_AT_INDEX,
+                7: SllOp.DELETE_AT_INDEX
+            }
+            item.op = op_map.get(op_val, SllOp.IDLE)
 
-                # Capture operation type
-                op_val = int(self.dut.op.value)
-                op_map = {
-                    0: SllOp.READ_ADDR,
-                    1: SllOp.INSERT_AT_ADDR,
-                    2: SllOp.DELETE_VALUE,
-                    3: SllOp.DELETE_AT_ADDR,
-                    4: SllOp.IDLE,
-                    5: SllOp.INSERT_AT_INDEX,
-                    7: SllOp.DELETE_AT_INDEX
-                }
-                item.op = op_map.get(op_val, SllOp.IDLE)
+            # Capture inputs
+            item.data = s.data_in
+            item.addr = s.addr_in
 
-                # Capture inputs
-                item.data = int(self.dut.data_in.value)
-                item.addr = int(self.dut.addr_in.value)
+            # Wait for operation to complete
+            r = await result.next()
 
-                # Wait for operation to complete
-                await RisingEdge(self.dut.clk)
-                while not self.dut.op_done.value:
-                    await RisingEdge(self.dut.clk)
+            # Capture outputs
+            item.result_data = r.data_out
+            item.result_next_addr = r.next_node_addr
+            item.op_done = True
+            item.fault = bool(r.fault)
+            item.current_len = r.length
+            item.current_head = r.head
+            item.current_tail = r.tail
 
-                # Capture outputs
-                item.result_data = int(self.dut.data_out.value)
-                item.result_next_addr = int(self.dut.next_node_addr.value)
-                item.op_done = bool(self.dut.op_done.value)
-                item.fault = bool(self.dut.fault.value)
-                item.current_len = int(self.dut.length.value)
-                item.current_head = int(self.dut.head.value)
-                item.current_tail = int(self.dut.tail.value)
-
-                self.ap.write(item)
-                self.logger.debug(f"Observed {item.op.name}: {item.convert2string()}")
+            self.ap.write(item)
+            self.logger.debug("Observed %s: %s", item.op.name, lazy(item.convert2string))
+            self.pool.release(item)
 
     async def get_dut(self):
         """Get DUT handle from ConfigDB"""
@@ -5,10 +5,11 @@ Contains configuration, types, and sequence item definitions
 
 from .sll_vip_types import SllOp
 from .sll_vip_config import SllVipConfig
-from .sll_vip_seq_item import SllVipSeqItem
+from .sll_vip_seq_item import SllVipSeqItem, SllVipTxn
 
 __all__ = [
     'SllOp',
     'SllVipConfig',
     'SllVipSeqItem',
+    'SllVipTxn',
 ]
@@ -6,6 +6,7 @@ Transaction item for Singly Linked List operations
 """
 
 from pyuvm import *
+from tbutils.txn import Txn
 import random
 from .sll_vip_types import SllOp
 
@@ -63,3 +64,13 @@ class SllVipSeqItem(uvm_sequence_item):
         return (f"Op:{self.op.name} Data:0x{self.data:x} Addr:{self.addr} "
                 f"Result:0x{self.result_data:x} Done:{self.op_done} "
                 f"Fault:{self.fault} Len:{self.current_len}")
+
+
+class SllVipTxn(Txn):
+    """Monitored Singly Linked List transaction, pooled by the monitor, to_item() gives a SllVipSeqItem"""
+
+    __slots__ = ("op", "data", "addr", "result_data", "result_next_addr", "op_done", "fault", "current_len",
+                 "current_head", "current_tail")
+    defaults = (SllOp.READ_ADDR, 0, 0, 0, 0, False, False, 0, 0, 0)
+    item_type = SllVipSeqItem
+    convert2string = SllVipSeqItem.convert2string
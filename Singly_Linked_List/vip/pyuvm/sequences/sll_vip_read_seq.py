@@ -30,4 +30,4 @@ class SllVipReadSeq(SllVipBaseSeq):
             await self.start_item(item)
             await self.finish_item(item)
 
-            self.logger.info(f"Read #{i}: addr={item.addr}")
+            self.logger.info("Read #%s: addr=%s", i, item.addr)
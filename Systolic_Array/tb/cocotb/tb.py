@@ -6,12 +6,19 @@ Tests:
 2. Identity matrix multiplication
 3. Random matrix multiplication
 4. Edge cases (zeros, signed values)
+5. Tiled GEMM of matrices larger than the array (run_gemm), reports MACs/cycle and PE utilization
+6. Back-to-back jobs through the concurrent SystolicPipeline driver, reports throughput and latency
 """
 
 import random
+from collections import deque
 import cocotb
-from cocotb.triggers import Timer, RisingEdge, FallingEdge
+from cocotb.triggers import Timer, RisingEdge, FallingEdge, Event, with_timeout
 from cocotb.clock import Clock
+from cocotb.utils import get_sim_time
+from systolic_model import SystolicModel
+from tbutils.packing import lane_packer
+from tbutils.tblog import OpsLog, get_logger
 
 # Default parameters (overridden by DUT parameters)
 ARRAY_ROWS = 4
@@ -24,6 +31,8 @@ SIGNED_MATH = 1
 
 CLK_PERIOD = 10  # ns
 err_cnt = 0
+ops = OpsLog(get_logger("systolic"), "systolic")
+model = SystolicModel(DATA_WIDTH, WEIGHT_WIDTH, ACC_WIDTH, signed=SIGNED_MATH)
 
 
 def signed_value(val, width):
@@ -42,7 +51,7 @@ def to_unsigned(val, width):
 
 async def dut_init(dut):
     """Initialize DUT and start clock."""
-    global ARRAY_ROWS, ARRAY_COLS, K_DIM, DATA_WIDTH, WEIGHT_WIDTH, ACC_WIDTH, SIGNED_MATH
+    global ARRAY_ROWS, ARRAY_COLS, K_DIM, DATA_WIDTH, WEIGHT_WIDTH, ACC_WIDTH, SIGNED_MATH, model
 
     # Read parameters from DUT
     ARRAY_ROWS = dut.ARRAY_ROWS.value
@@ -52,11 +61,14 @@ async def dut_init(dut):
     WEIGHT_WIDTH = dut.WEIGHT_WIDTH.value
     ACC_WIDTH = dut.ACC_WIDTH.value
     SIGNED_MATH = dut.SIGNED_MATH.value
+    model = SystolicModel(DATA_WIDTH, WEIGHT_WIDTH, ACC_WIDTH, signed=SIGNED_MATH)
 
     dut._log.info(f"Array Size: {ARRAY_ROWS}x{ARRAY_COLS}, K={K_DIM}")
     dut._log.info(f"Data Width: {DATA_WIDTH}, Weight Width: {WEIGHT_WIDTH}, Acc Width: {ACC_WIDTH}")
     dut._log.info(f"Signed Math: {SIGNED_MATH}")
 
+    ops.reset()
+
     # Start clock
     await cocotb.start(Clock(dut.clk, CLK_PERIOD, units="ns").start())
 
@@ -76,68 +88,50 @@ async def dut_init(dut):
 
 
 def compute_expected_result(matrix_a, matrix_b):
-    """Compute expected matrix multiplication result."""
-    result = [[0] * ARRAY_COLS for _ in range(ARRAY_ROWS)]
-
-    for i in range(ARRAY_ROWS):
-        for j in range(ARRAY_COLS):
-            acc = 0
-            for k in range(K_DIM):
-                if SIGNED_MATH:
-                    a_val = signed_value(matrix_a[i][k], DATA_WIDTH)
-                    b_val = signed_value(matrix_b[k][j], WEIGHT_WIDTH)
-                else:
-                    a_val = matrix_a[i][k]
-                    b_val = matrix_b[k][j]
-                acc += a_val * b_val
-            result[i][j] = acc
-
-    return result
+    """Compute expected matrix multiplication result (ACC_WIDTH wrap, see tb/model/systolic_model.py)."""
+    return [[int(v) for v in row] for row in model.matmul(matrix_a, matrix_b)]
 
 
 async def load_weights(dut, matrix_b):
     """Load weight matrix into systolic array."""
-    dut._log.info("Loading weights...")
+    ops.info("load_weights", "Loading weights...")
 
     # Wait for weight_ready
     while dut.weight_ready.value != 1:
         await RisingEdge(dut.clk)
 
+    weights = lane_packer(WEIGHT_WIDTH, ARRAY_COLS)
+
     # Load weights: K dimension outer, rows inner
     for k in range(K_DIM):
+        # Pack all columns
+        weight_packed = weights.pack(matrix_b[k])
         for row in range(ARRAY_ROWS):
             await RisingEdge(dut.clk)
 
-            # Pack all columns
-            weight_packed = 0
-            for col in range(ARRAY_COLS):
-                weight_packed |= (matrix_b[k][col] & ((1 << WEIGHT_WIDTH) - 1)) << (col * WEIGHT_WIDTH)
-
             dut.weight_data.value = weight_packed
             dut.weight_valid.value = 1
 
     await RisingEdge(dut.clk)
     dut.weight_valid.value = 0
     dut.weight_data.value = 0
-    dut._log.info("Weight loading complete")
+    ops.line("Weight loading complete")
 
 
 async def stream_activations(dut, matrix_a):
     """Stream activation matrix into systolic array."""
-    dut._log.info("Streaming activations...")
+    ops.info("stream_activations", "Streaming activations...")
 
     # Wait for act_ready
     while dut.act_ready.value != 1:
         await RisingEdge(dut.clk)
 
-    # Stream column by column (K dimension)
-    for k in range(K_DIM):
-        await RisingEdge(dut.clk)
+    acts = lane_packer(DATA_WIDTH, ARRAY_ROWS)
 
-        # Pack all rows
-        act_packed = 0
-        for row in range(ARRAY_ROWS):
-            act_packed |= (matrix_a[row][k] & ((1 << DATA_WIDTH) - 1)) << (row * DATA_WIDTH)
+    # Stream column by column (K dimension), all rows packed per cycle
+    for column in zip(*matrix_a):
+        act_packed = acts.pack(column)
+        await RisingEdge(dut.clk)
 
         dut.act_data.value = act_packed
         dut.act_valid.value = 1
@@ -145,14 +139,15 @@ async def stream_activations(dut, matrix_a):
     await RisingEdge(dut.clk)
     dut.act_valid.value = 0
     dut.act_data.value = 0
-    dut._log.info("Activation streaming complete")
+    ops.line("Activation streaming complete")
 
 
 async def collect_results(dut):
     """Collect results from systolic array."""
-    dut._log.info("Collecting results...")
+    ops.line("Collecting results...")
 
     results = []
+    result_lanes = lane_packer(ACC_WIDTH, ARRAY_COLS, signed=SIGNED_MATH)
     dut.result_ready.value = 1
     timeout = 0
 
@@ -162,52 +157,23 @@ async def collect_results(dut):
 
         if dut.result_valid.value == 1:
             # Unpack result row
-            result_packed = dut.result_data.value.integer
-            row_result = []
-            for col in range(ARRAY_COLS):
-                val = (result_packed >> (col * ACC_WIDTH)) & ((1 << ACC_WIDTH) - 1)
-                if SIGNED_MATH:
-                    val = signed_value(val, ACC_WIDTH)
-                row_result.append(val)
+            row_result = result_lanes.unpack(dut.result_data.value.integer)
             results.append(row_result)
-            dut._log.info(f"Received result row: {row_result}")
+            ops.info("result_row", "Received result row: %s", row_result)
 
     dut.result_ready.value = 0
-    dut._log.info("Result collection complete")
+    ops.line("Result collection complete")
     return results
 
 
-async def run_matmul_test(dut, matrix_a, matrix_b, test_name):
-    """Run a single matrix multiplication test."""
-    global err_cnt
-
-    dut._log.info(f"\n{'='*50}")
-    dut._log.info(f"Test: {test_name}")
-    dut._log.info(f"{'='*50}")
-
-    # Print matrices
-    dut._log.info(f"Matrix A ({ARRAY_ROWS}x{K_DIM}):")
-    for row in matrix_a:
-        if SIGNED_MATH:
-            dut._log.info(f"  {[signed_value(v, DATA_WIDTH) for v in row]}")
-        else:
-            dut._log.info(f"  {row}")
-
-    dut._log.info(f"Matrix B ({K_DIM}x{ARRAY_COLS}):")
-    for row in matrix_b:
-        if SIGNED_MATH:
-            dut._log.info(f"  {[signed_value(v, WEIGHT_WIDTH) for v in row]}")
-        else:
-            dut._log.info(f"  {row}")
-
-    # Compute expected result
-    expected = compute_expected_result(matrix_a, matrix_b)
-    dut._log.info(f"Expected C ({ARRAY_ROWS}x{ARRAY_COLS}):")
-    for row in expected:
-        dut._log.info(f"  {row}")
+async def run_pass(dut, matrix_a, matrix_b):
+    """One start..done pass of the array on an ARRAY_ROWSxK_DIM by K_DIMxARRAY_COLS tile.
 
+    Returns the collected result rows and the pass length in clock cycles.
+    """
     # Start computation
     await RisingEdge(dut.clk)
+    start_time = get_sim_time("ns")
     dut.start.value = 1
     await RisingEdge(dut.clk)
     dut.start.value = 0
@@ -216,7 +182,7 @@ async def run_matmul_test(dut, matrix_a, matrix_b, test_name):
     while dut.busy.value != 1:
         await RisingEdge(dut.clk)
 
-    # Run load, stream, and collect concurrently
+    # Load, stream and collect one after the other, see SystolicPipeline for the overlapped driver
     await load_weights(dut, matrix_b)
     await stream_activations(dut, matrix_a)
     actual = await collect_results(dut)
@@ -225,17 +191,340 @@ async def run_matmul_test(dut, matrix_a, matrix_b, test_name):
     while dut.done.value != 1:
         await RisingEdge(dut.clk)
 
+    cycles = int(get_sim_time("ns") - start_time) // CLK_PERIOD
+    return actual, cycles
+
+
+def split_tiles(size, tile):
+    """(start, stop) ranges covering size in steps of tile."""
+    return [(start, min(start + tile, size)) for start in range(0, size, tile)]
+
+
+def get_tile(matrix, rows, cols, shape):
+    """Sub-matrix matrix[rows][cols], zero padded to shape (rows, cols)."""
+    (r0, r1), (c0, c1), (n_rows, n_cols) = rows, cols, shape
+    tile = [list(row[c0:c1]) + [0] * (n_cols - (c1 - c0)) for row in matrix[r0:r1]]
+    tile += [[0] * n_cols for _ in range(n_rows - (r1 - r0))]
+    return tile
+
+
+async def run_gemm(dut, matrix_a, matrix_b, test_name):
+    """Tiled C = A x B for any MxK A and KxN B.
+
+    A is cut into ARRAY_ROWSxK_DIM tiles and B into K_DIMxARRAY_COLS tiles, edge tiles
+    are zero padded. Every (N tile, K tile, M tile) runs as one pass of the array and
+    the K tile partial sums are accumulated here with the ACC_WIDTH semantics of the
+    model. Passes are ordered weight-stationary (same B tile back to back) so the
+    schedule is ready for a DUT that keeps weights across passes; this one reloads
+    them every pass, which shows up in the reported utilization.
+    """
+    global err_cnt
+
+    m_dim, k_dim, n_dim = len(matrix_a), len(matrix_b), len(matrix_b[0])
+
+    dut._log.info(f"\n{'='*50}")
+    dut._log.info(f"Test: {test_name}")
+    dut._log.info(f"GEMM {m_dim}x{k_dim} by {k_dim}x{n_dim} on a {ARRAY_ROWS}x{ARRAY_COLS} array, K_DIM={K_DIM}")
+    dut._log.info(f"{'='*50}")
+
+    expected = compute_expected_result(matrix_a, matrix_b)
+    actual = [[0] * n_dim for _ in range(m_dim)]
+    passes = 0
+    total_cycles = 0
+
+    for n0, n1 in split_tiles(n_dim, ARRAY_COLS):
+        for k0, k1 in split_tiles(k_dim, K_DIM):
+            b_tile = get_tile(matrix_b, (k0, k1), (n0, n1), (K_DIM, ARRAY_COLS))
+            for m0, m1 in split_tiles(m_dim, ARRAY_ROWS):
+                a_tile = get_tile(matrix_a, (m0, m1), (k0, k1), (ARRAY_ROWS, K_DIM))
+                partial, cycles = await run_pass(dut, a_tile, b_tile)
+                passes += 1
+                total_cycles += cycles
+                for i, row in enumerate(partial[:m1 - m0]):
+                    out = actual[m0 + i]
+                    for j in range(n1 - n0):
+                        out[n0 + j] = model.accumulate(out[n0 + j], row[j])
+                if len(partial) < m1 - m0:
+                    dut._log.warning(f"Pass {passes}: only {len(partial)} of {m1 - m0} result rows collected")
+
+    # Compare the whole C at once
+    mismatches = model.compare(expected, actual)
+    for line in model.report(mismatches):
+        dut._log.error(line)
+    err_cnt += len(mismatches)
+
+    # Useful MACs exclude the zero padding of edge tiles
+    macs = m_dim * n_dim * k_dim
+    pe_count = ARRAY_ROWS * ARRAY_COLS
+    macs_per_cycle = macs / total_cycles if total_cycles else 0.0
+    dut._log.info(f"Passes: {passes}, cycles: {total_cycles}, MACs: {macs}")
+    dut._log.info(f"Effective MACs/cycle: {macs_per_cycle:.2f} (peak {pe_count})")
+    dut._log.info(f"PE utilization: {100.0 * macs_per_cycle / pe_count:.1f}%, "
+                  f"tile fill: {100.0 * macs / (passes * pe_count * K_DIM):.1f}%")
+
+    if mismatches:
+        dut._log.error(f"Test '{test_name}': FAILED with {len(mismatches)} errors")
+    else:
+        dut._log.info(f"Test '{test_name}': PASSED")
+
+    return {"passes": passes, "cycles": total_cycles, "macs": macs,
+            "macs_per_cycle": macs_per_cycle, "pe_utilization": macs_per_cycle / pe_count}
+
+
+class StreamSource:
+    """valid/ready source for one DUT input bus.
+
+    send() queues the beats of one job; they are driven back to back and a beat
+    counts as taken at the first rising edge that samples valid and ready both
+    high. Every cycle without a beat drives data=0 with valid=0, the array
+    consumes the activation bus whenever it is enabled (CLEAR, COMPUTE, DRAIN),
+    valid or not, so only the weight bus gets bubbles. With ahead=False a job's first beat waits for ready of that
+    job, so nothing of the next job is on the bus while the current one drains;
+    ahead=True (weights, only taken with weight_valid) raises valid before ready.
+    """
+
+    def __init__(self, clk, data, valid, ready, idle_prob=0.0, ahead=False):
+        self.clk = clk
+        self.data = data
+        self.valid = valid
+        self.ready = ready
+        self.idle_prob = idle_prob  # chance of a bubble cycle between beats
+        self.ahead = ahead
+        self.jobs = deque()  # beats of every queued job, one deque per job
+        self.sent = 0
+
+    def send(self, beats):
+        self.jobs.append(deque(beats))
+
+    def _idle(self):
+        self.data.value = 0
+        self.valid.value = 0
+
+    async def run(self):
+        pending = False
+        armed = self.ahead  # ready seen for the job at the head of jobs
+        self._idle()
+        while True:
+            await RisingEdge(self.clk)
+            ready = self.ready.value == 1
+            if pending:
+                if not ready:
+                    continue
+                self.sent += 1
+                pending = False
+                if not self.jobs[0]:
+                    # last beat of the job taken, the next one waits for its own ready
+                    self.jobs.popleft()
+                    armed = self.ahead
+            elif ready:
+                armed = True
+            if self.jobs and armed and random.random() >= self.idle_prob:
+                self.data.value = self.jobs[0].popleft()
+                self.valid.value = 1
+                pending = True
+            else:
+                self._idle()
+
+
+class MatmulJob:
+    """One A x B job of the pipelined driver, cycle stamps filled in as it runs."""
+
+    def __init__(self, index, matrix_a, matrix_b):
+        self.index = index
+        self.matrix_a = matrix_a
+        self.matrix_b = matrix_b
+        self.expected = compute_expected_result(matrix_a, matrix_b)
+        self.result = []
+        self.submit_cycle = None
+        self.start_cycle = None
+        self.done_cycle = None
+        self.done = Event()
+
+    @property
+    def latency(self):
+        return self.done_cycle - self.start_cycle
+
+
+class SystolicPipeline:
+    """Concurrent driver keeping start, weight, activation and result interfaces busy.
+
+    Weight and activation beats of every submitted job are queued on their
+    StreamSource right away, so job n+1's weights are waiting on the bus while job
+    n drains; its activations follow once act_ready is up for it. idle_prob puts
+    bubbles on the weight bus only: the array does not stall COMPUTE on act_valid,
+    an activation bubble would shift the later columns against the skew. start is held
+    high as long as a job is waiting; the array takes it at the edge that samples
+    start=1 with busy=0 (IDLE). The result side
+    collects result_valid rows into the oldest running job until done.
+    result_ready stays high since the DUT has no output buffering.
+    """
+
+    def __init__(self, dut, idle_prob=0.0):
+        self.dut = dut
+        self.clk = dut.clk
+        self.weights = StreamSource(dut.clk, dut.weight_data, dut.weight_valid, dut.weight_ready, idle_prob,
+                                    ahead=True)
+        self.acts = StreamSource(dut.clk, dut.act_data, dut.act_valid, dut.act_ready)
+        self.weight_lanes = lane_packer(WEIGHT_WIDTH, ARRAY_COLS)
+        self.act_lanes = lane_packer(DATA_WIDTH, ARRAY_ROWS)
+        self.result_lanes = lane_packer(ACC_WIDTH, ARRAY_COLS, signed=SIGNED_MATH)
+        self.waiting = deque()   # submitted, start not taken yet
+        self.running = deque()   # started, done not seen yet
+        self.jobs = []
+        self.errors = 0
+        self.cycle = 0
+        self.tasks = []
+
+    def start(self):
+        self.dut.result_ready.value = 1
+        for coro in (self._clock_count(), self.weights.run(), self.acts.run(),
+                     self._control(), self._results()):
+            self.tasks.append(cocotb.start_soon(coro))
+
+    def stop(self):
+        for task in self.tasks:
+            task.kill()
+        self.tasks = []
+        self.dut.start.value = 0
+        self.dut.weight_valid.value = 0
+        self.dut.weight_data.value = 0
+        self.dut.act_valid.value = 0
+        self.dut.act_data.value = 0
+        self.dut.result_ready.value = 0
+
+    def submit(self, matrix_a, matrix_b):
+        """Queue a job, returns its MatmulJob (await job.done.wait() for the result)"""
+        job = MatmulJob(len(self.jobs), matrix_a, matrix_b)
+        job.submit_cycle = self.cycle
+        self.jobs.append(job)
+        self.waiting.append(job)
+        self.weights.send(self.weight_lanes.pack(matrix_b[k]) for k in range(K_DIM) for _ in range(ARRAY_ROWS))
+        self.acts.send(self.act_lanes.pack(column) for column in zip(*matrix_a))
+        return job
+
+    async def join(self):
+        for job in self.jobs:
+            await job.done.wait()
+
+    async def _clock_count(self):
+        while True:
+            await RisingEdge(self.clk)
+            self.cycle += 1
+
+    async def _control(self):
+        start = 0
+        self.dut.start.value = start
+        while True:
+            await RisingEdge(self.clk)
+            if start and self.dut.busy.value == 0:
+                job = self.waiting.popleft()
+                job.start_cycle = self.cycle
+                self.running.append(job)
+            start = 1 if self.waiting else 0
+            self.dut.start.value = start
+
+    async def _results(self):
+        while True:
+            await RisingEdge(self.clk)
+            if not self.running:
+                continue
+            job = self.running[0]
+            if self.dut.result_valid.value == 1:
+                job.result.append(self.result_lanes.unpack(self.dut.result_data.value.integer))
+            if self.dut.done.value == 1:
+                self.running.popleft()
+                job.done_cycle = self.cycle
+                self._check(job)
+                job.done.set()
+
+    def _check(self, job):
+        mismatches = model.compare(job.expected, job.result)
+        if len(job.result) < ARRAY_ROWS:
+            self.dut._log.warning(f"Job {job.index}: only {len(job.result)} of {ARRAY_ROWS} result rows collected")
+        for line in model.report(mismatches):
+            self.dut._log.error(f"Job {job.index}: {line}")
+        self.errors += len(mismatches)
+
+    def report(self):
+        """Log and return steady-state throughput and per-job latency"""
+        done = [job for job in self.jobs if job.done_cycle is not None]
+        if not done:
+            return {}
+        latencies = [job.latency for job in done]
+        # Steady state: done to done spacing, the first job's fill latency excluded
+        interval = ((done[-1].done_cycle - done[0].done_cycle) / (len(done) - 1)
+                    if len(done) > 1 else float(latencies[0]))
+        macs = ARRAY_ROWS * ARRAY_COLS * K_DIM
+        pe_count = ARRAY_ROWS * ARRAY_COLS
+        span = done[-1].done_cycle - done[0].start_cycle
+        stats = {
+            "jobs": len(done),
+            "interval": interval,
+            "latency_min": min(latencies),
+            "latency_max": max(latencies),
+            "latency_avg": sum(latencies) / len(latencies),
+            "macs_per_cycle": macs / interval,
+            "pe_utilization": macs / interval / pe_count,
+            "weight_bus": self.weights.sent / span,
+            "act_bus": self.acts.sent / span,
+        }
+        log = self.dut._log
+        log.info(f"Jobs: {stats['jobs']}, steady-state interval: {interval:.1f} cycles/job")
+        log.info(f"Latency (start to done): min {stats['latency_min']}, max {stats['latency_max']}, "
+                 f"avg {stats['latency_avg']:.1f} cycles")
+        log.info(f"Throughput: {stats['macs_per_cycle']:.2f} MACs/cycle, "
+                 f"PE utilization {100.0 * stats['pe_utilization']:.1f}%")
+        log.info(f"Bus occupancy: weights {100.0 * stats['weight_bus']:.1f}%, "
+                 f"activations {100.0 * stats['act_bus']:.1f}%")
+        return stats
+
+
+async def run_matmul_test(dut, matrix_a, matrix_b, test_name):
+    """Run a single matrix multiplication test."""
+    global err_cnt
+
+    dut._log.info(f"\n{'='*50}")
+    dut._log.info(f"Test: {test_name}")
+    dut._log.info(f"{'='*50}")
+
+    # Print matrices
+    if ops.enabled():
+        dut._log.info(f"Matrix A ({ARRAY_ROWS}x{K_DIM}):")
+        for row in matrix_a:
+            if SIGNED_MATH:
+                dut._log.info(f"  {[signed_value(v, DATA_WIDTH) for v in row]}")
+            else:
+                dut._log.info(f"  {row}")
+
+        dut._log.info(f"Matrix B ({K_DIM}x{ARRAY_COLS}):")
+        for row in matrix_b:
+            if SIGNED_MATH:
+                dut._log.info(f"  {[signed_value(v, WEIGHT_WIDTH) for v in row]}")
+            else:
+                dut._log.info(f"  {row}")
+
+    # Compute expected result
+    expected = compute_expected_result(matrix_a, matrix_b)
+    if ops.enabled():
+        dut._log.info(f"Expected C ({ARRAY_ROWS}x{ARRAY_COLS}):")
+        for row in expected:
+            dut._log.info(f"  {row}")
+
+    actual, cycles = await run_pass(dut, matrix_a, matrix_b)
+    dut._log.info(f"Pass took {cycles} cycles, {ARRAY_ROWS * ARRAY_COLS * K_DIM / cycles:.2f} MACs/cycle")
+
     # Compare results
     local_err = 0
     dut._log.info("\n--- Result Comparison ---")
 
     if len(actual) > 0:
-        for i in range(min(len(actual), ARRAY_ROWS)):
-            for j in range(ARRAY_COLS):
-                if actual[i][j] != expected[i][j]:
-                    dut._log.error(f"C[{i}][{j}] mismatch: Expected {expected[i][j]}, Got {actual[i][j]}")
-                    local_err += 1
-                    err_cnt += 1
+        mismatches = model.compare(expected, actual)
+        for line in model.report(mismatches):
+            dut._log.error(line)
+        local_err += len(mismatches)
+        err_cnt += len(mismatches)
+        if len(actual) < ARRAY_ROWS:
+            dut._log.warning(f"Only {len(actual)} of {ARRAY_ROWS} result rows collected")
     else:
         dut._log.warning("No results collected")
 
@@ -318,6 +607,7 @@ async def test_simple_values(dut):
     matrix_a, matrix_b = generate_simple_matrices()
     await run_matmul_test(dut, matrix_a, matrix_b, "Simple Known Values")
 
+    ops.report()
     if err_cnt > 0:
         raise cocotb.result.TestFailure(f"Test failed with {err_cnt} errors")
 
@@ -331,6 +621,7 @@ async def test_identity_matrix(dut):
     matrix_a, matrix_b = generate_identity_matrices()
     await run_matmul_test(dut, matrix_a, matrix_b, "Identity Matrix")
 
+    ops.report()
     if err_cnt > 0:
         raise cocotb.result.TestFailure(f"Test failed with {err_cnt} errors")
 
@@ -344,6 +635,7 @@ async def test_random_matrices(dut):
     matrix_a, matrix_b = generate_random_matrices()
     await run_matmul_test(dut, matrix_a, matrix_b, "Random Matrices")
 
+    ops.report()
     if err_cnt > 0:
         raise cocotb.result.TestFailure(f"Test failed with {err_cnt} errors")
 
@@ -357,6 +649,7 @@ async def test_zero_matrix(dut):
     matrix_a, matrix_b = generate_zero_matrices()
     await run_matmul_test(dut, matrix_a, matrix_b, "Zero Matrix")
 
+    ops.report()
     if err_cnt > 0:
         raise cocotb.result.TestFailure(f"Test failed with {err_cnt} errors")
 
@@ -374,5 +667,60 @@ async def test_signed_values(dut):
     else:
         dut._log.info("Skipping signed test (SIGNED_MATH=0)")
 
+    ops.report()
+    if err_cnt > 0:
+        raise cocotb.result.TestFailure(f"Test failed with {err_cnt} errors")
+
+
+@cocotb.test()
+async def test_tiled_gemm(dut):
+    """Tiled GEMM larger than the array in every dimension, edge tiles partially filled."""
+    global err_cnt
+    err_cnt = 0
+    await dut_init(dut)
+
+    m_dim = 2 * ARRAY_ROWS + 1
+    k_dim = 2 * K_DIM + 1
+    n_dim = 2 * ARRAY_COLS - 1
+    matrix_a = [[random.getrandbits(DATA_WIDTH) for _ in range(k_dim)] for _ in range(m_dim)]
+    matrix_b = [[random.getrandbits(WEIGHT_WIDTH) for _ in range(n_dim)] for _ in range(k_dim)]
+    await run_gemm(dut, matrix_a, matrix_b, "Tiled GEMM")
+
+    ops.report()
     if err_cnt > 0:
         raise cocotb.result.TestFailure(f"Test failed with {err_cnt} errors")
+
+
+async def run_pipelined(dut, idle_prob=0.0, jobs=8):
+    """Back-to-back random jobs through SystolicPipeline, checked against the model."""
+    global err_cnt
+    err_cnt = 0
+    await dut_init(dut)
+
+    pipeline = SystolicPipeline(dut, idle_prob)
+    pipeline.start()
+    for _ in range(jobs):
+        matrix_a, matrix_b = generate_random_matrices()
+        pipeline.submit(matrix_a, matrix_b)
+    job_cycles = (ARRAY_ROWS + 2) * K_DIM + 2 * ARRAY_ROWS + 16
+    # bubbles stretch the weight phase by 1 / (1 - idle_prob)
+    await with_timeout(pipeline.join(), int(jobs * 4 * job_cycles / (1.0 - idle_prob)) * CLK_PERIOD, "ns")
+    pipeline.report()
+    pipeline.stop()
+    err_cnt += pipeline.errors
+
+    ops.report()
+    if err_cnt > 0:
+        raise cocotb.result.TestFailure(f"Test failed with {err_cnt} errors")
+
+
+@cocotb.test()
+async def test_pipelined_jobs(dut):
+    """Back-to-back random jobs through SystolicPipeline, steady-state throughput and latency."""
+    await run_pipelined(dut)
+
+
+@cocotb.test()
+async def test_pipelined_bubbles(dut):
+    """Pipelined jobs with random bubble cycles on the weight bus."""
+    await run_pipelined(dut, idle_prob=0.3)
@@ -0,0 +1,187 @@
+"""
+Systolic Array Reference Model
+Create Date: 18/10/2026
+
+Golden model of systolic_array_top.sv: C = A x B with A (ARRAY_ROWS x K_DIM) in
+DATA_WIDTH lanes, B (K_DIM x ARRAY_COLS) in WEIGHT_WIDTH lanes and C in ACC_WIDTH
+lanes. Inputs are the raw lane values driven on the bus, they are reinterpreted
+as two's complement when SIGNED_MATH=1 like pe.sv does with $signed().
+
+The accumulator wraps at ACC_WIDTH like the RTL adder. saturate=True instead clips
+every partial sum (k ascending) to the ACC_WIDTH range, for designs that saturate.
+
+The whole matrix is computed with one NumPy matmul. int64 is used whenever the
+result is exact in it (wrapping is modulo 2^64 in NumPy, so ACC_WIDTH <= 64 is
+exact in wrap mode, except signed ACC_WIDTH=63 whose sign fold needs 2^63), other
+configurations fall back to Python integers in an object array. Without NumPy the
+same results come from plain Python loops; self_check() compares both paths at the
+int64 boundary (python systolic_model.py).
+
+    from systolic_model import SystolicModel
+    model = SystolicModel(DATA_WIDTH, WEIGHT_WIDTH, ACC_WIDTH, signed=SIGNED_MATH)
+    expected = model.matmul(matrix_a, matrix_b)
+    mismatches = model.compare(expected, actual)   # [(row, col, expected, actual), ...]
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pure Python fallback, slower on large arrays
+    np = None
+
+
+def to_signed(values, width):
+    """Reinterpret unsigned width-bit lane values as two's complement"""
+    mask = (1 << width) - 1
+    half = 1 << (width - 1)
+    if np is not None and isinstance(values, np.ndarray):
+        values = values & mask
+        return np.where(values >= half, values - (1 << width), values)
+    values = values & mask
+    return values - (1 << width) if values >= half else values
+
+
+def to_unsigned(values, width):
+    """Two's complement values to their unsigned width-bit lane encoding"""
+    return values & ((1 << width) - 1)
+
+
+class SystolicModel:
+    """Vectorized matmul golden model with ACC_WIDTH wrap or saturation"""
+
+    def __init__(self, data_width, weight_width, acc_width, signed=True, saturate=False):
+        self.data_width = int(data_width)
+        self.weight_width = int(weight_width)
+        self.acc_width = int(acc_width)
+        self.signed = bool(int(signed))
+        self.saturate = saturate
+        self.acc_mask = (1 << self.acc_width) - 1
+        if self.signed:
+            self.acc_min = -(1 << (self.acc_width - 1))
+            self.acc_max = (1 << (self.acc_width - 1)) - 1
+        else:
+            self.acc_min = 0
+            self.acc_max = self.acc_mask
+
+    # ------------------------------------------------------------ conversion
+    def _exact_int64(self):
+        """True when every value the selected mode computes fits in int64"""
+        if max(self.data_width, self.weight_width) > 62:
+            return False
+        if self.saturate:
+            # acc + product before clipping
+            return max(self.acc_width, self.data_width + self.weight_width) + 1 <= 62
+        if self.signed and self.acc_width == 63:
+            return False  # to_signed() subtracts 1 << 63
+        return self.acc_width <= 64
+
+    def _lanes(self, matrix, width):
+        """Raw lane values to the operand domain (signed or unsigned)"""
+        dtype = np.int64 if self._exact_int64() else object
+        values = np.array(matrix, dtype=dtype) & ((1 << width) - 1)
+        return to_signed(values, width) if self.signed else values
+
+    def _wrap(self, acc):
+        """Reduce the accumulator to ACC_WIDTH bits in the output domain"""
+        if acc.dtype == object or self.acc_width < 64:
+            acc = acc & self.acc_mask
+            return to_signed(acc, self.acc_width) if self.signed else acc
+        # ACC_WIDTH == 64, the int64 result already is the wrapped value
+        return acc if self.signed else acc.astype(np.uint64)
+
+    # ---------------------------------------------------------------- matmul
+    def matmul(self, matrix_a, matrix_b):
+        """Expected C for raw lane matrices A and B"""
+        if np is None:
+            return self._matmul_python(matrix_a, matrix_b)
+        a = self._lanes(matrix_a, self.data_width)
+        b = self._lanes(matrix_b, self.weight_width)
+        if not self.saturate:
+            return self._wrap(a @ b)
+        acc = np.zeros((a.shape[0], b.shape[1]), dtype=a.dtype)
+        for k in range(a.shape[1]):
+            acc = np.clip(acc + np.outer(a[:, k], b[k, :]), self.acc_min, self.acc_max)
+        return acc
+
+    def _matmul_python(self, matrix_a, matrix_b):
+        def lane(v, width):
+            v &= (1 << width) - 1
+            return to_signed(v, width) if self.signed else v
+
+        a = [[lane(v, self.data_width) for v in row] for row in matrix_a]
+        b_cols = [[lane(v, self.weight_width) for v in col] for col in zip(*matrix_b)]
+        result = []
+        for row in a:
+            out = []
+            for col in b_cols:
+                if self.saturate:
+                    acc = 0
+                    for x, w in zip(row, col):
+                        acc = min(max(acc + x * w, self.acc_min), self.acc_max)
+                else:
+                    acc = sum(x * w for x, w in zip(row, col)) & self.acc_mask
+                    if self.signed:
+                        acc = to_signed(acc, self.acc_width)
+                out.append(acc)
+            result.append(out)
+        return result
+
+    def accumulate(self, acc, partial):
+        """acc + partial in the ACC_WIDTH output domain, e.g. summing K tile partial sums"""
+        total = int(acc) + int(partial)
+        if self.saturate:
+            return min(max(total, self.acc_min), self.acc_max)
+        total &= self.acc_mask
+        return to_signed(total, self.acc_width) if self.signed else total
+
+    # --------------------------------------------------------------- compare
+    def compare(self, expected, actual):
+        """Mismatches between expected and actual as (row, col, expected, actual)
+
+        Only the rows present in actual are compared, a short result is left to
+        the caller to report.
+        """
+        rows = min(len(expected), len(actual))
+        if rows == 0:
+            return []
+        if np is None:
+            return [(i, j, e, a)
+                    for i in range(rows)
+                    for j, (e, a) in enumerate(zip(expected[i], actual[i])) if e != a]
+        exp = np.asarray(expected, dtype=object)[:rows]
+        act = np.asarray([list(r) for r in actual[:rows]], dtype=object)
+        return [(int(i), int(j), int(exp[i, j]), int(act[i, j]))
+                for i, j in np.argwhere(exp != act)]
+
+    @staticmethod
+    def report(mismatches, limit=16):
+        """Lines describing the first limit mismatches"""
+        lines = [f"C[{i}][{j}] mismatch: Expected {e}, Got {a}" for i, j, e, a in mismatches[:limit]]
+        if len(mismatches) > limit:
+            lines.append(f"... {len(mismatches) - limit} more mismatches")
+        return lines
+
+
+def self_check(acc_widths=(62, 63, 64), size=4, seed=0):
+    """Vectorized matmul against the scalar loops for wrap and saturate, signed and
+    unsigned, at every ACC_WIDTH; returns the configurations that disagree"""
+    import random
+    rng = random.Random(seed)
+    failures = []
+    for acc_width in acc_widths:
+        for signed in (True, False):
+            for saturate in (False, True):
+                model = SystolicModel(32, 32, acc_width, signed=signed, saturate=saturate)
+                a = [[rng.getrandbits(32) for _ in range(size)] for _ in range(size)]
+                b = [[rng.getrandbits(32) for _ in range(size)] for _ in range(size)]
+                fast = [[int(v) for v in row] for row in model.matmul(a, b)]
+                if fast != model._matmul_python(a, b):
+                    failures.append(f"ACC_WIDTH={acc_width} signed={signed} saturate={saturate}")
+    return failures
+
+
+if __name__ == "__main__":
+    failed = self_check()
+    for line in failed:
+        print(f"vectorized and scalar results differ: {line}")
+    print("systolic_model self check " + ("FAILED" if failed else "passed"))
+    raise SystemExit(1 if failed else 0)
@@ -1,12 +1,18 @@
+import os
 import random
 #import asyncio
 import math
 import cocotb
-from cocotb.triggers import Timer, RisingEdge, ReadOnly
+from cocotb.triggers import Timer
 from cocotb.clock import Clock
 from cocotb_bus.drivers import BusDriver
 from cocotb_bus.monitors import BusMonitor
 from cocotb.binary import BinaryValue
+from tbutils.packing import lane_packer
+from tbutils.tblog import OpsLog, get_logger
+from tbutils.bench import write_result
+from tbutils.clocked import ClockedIf
+from tbutils.snapshot import Snapshot
 
 #BIN string
 #BinaryValue(dut.data_wr.value, n_bits=8) ; BinaryValue.integar ; BinaryValue.hex ; BinaryValue.binstr; BinaryValue.signed_integer ; can represent x,z
@@ -19,8 +25,11 @@ INDEX_WIDTH = 1
 TB_CLK_PERIOD = 30 # TB clk generator
 TB_SIM_TIMEOUT = 30 # TB sim timeout 30ms
 TB_TEST_WEIGHT = 1
+BENCH_CYCLES = int(os.environ.get("BENCH_CYCLES", 1000)) # cycles table_bench_test drives every port
+BENCH_CONFLICT = float(os.environ.get("BENCH_CONFLICT", 0.25)) # probability a lane reuses an index written in the same cycle
 table_expected = [0 for i in range(TABLE_SIZE)]
 err_cnt = 0
+ops = OpsLog(get_logger("table"), "table")
 
 # table_top #(
 #     .TABLE_SIZE(TABLE_SIZE), 
@@ -48,36 +57,30 @@ class OutputDriver(BusDriver):
         self.bus.data_wr.value = 0
         self.dut = dut
         self.clk = clk
+        # drive on the falling edge, InputMonitor samples the inputs at the rising edge
+        self.clk_if = ClockedIf(clk)
 
     # async def _driver_send(self):
     async def write_burst(self, input_data):
         for i in range(0,len(input_data)//INPUT_RATE): 
-            await RisingEdge(self.clk)
-            await Timer (1, units = 'ns')
-            data_wr = 0
-            index_wr = 0
-            for j in range(0,INPUT_RATE):
-                data_wr = (data_wr<<(j)*DATA_WIDTH) + input_data[i*INPUT_RATE+j][1] 
-                index_wr = (index_wr<<(j)*INDEX_WIDTH) + input_data[i*INPUT_RATE+j][0] 
+            await self.clk_if.falling
+            burst = input_data[i*INPUT_RATE:(i+1)*INPUT_RATE]
+            data_wr = lane_packer(DATA_WIDTH, INPUT_RATE).pack([data for index, data in burst])
+            index_wr = lane_packer(INDEX_WIDTH, INPUT_RATE).pack([index for index, data in burst])
             self.bus.wr_en.value = 2**INPUT_RATE - 1
             self.bus.data_wr.value = data_wr
             self.bus.index_wr.value = index_wr      
-        await RisingEdge(self.clk)
-        await Timer (1, units = 'ns')               
+        await self.clk_if.falling
         self.bus.wr_en.value = 0
 
     async def read_burst(self, target_index): 
         for i in range(0,len(target_index)//OUTPUT_RATE):  
-            await RisingEdge(self.clk)
-            await Timer (1, units = 'ns')
-            index_rd = 0
-            for j in range(0,OUTPUT_RATE):
-                index_rd = (index_rd<<(j)*INDEX_WIDTH) + target_index[i*OUTPUT_RATE+j]
+            await self.clk_if.falling
+            index_rd = lane_packer(INDEX_WIDTH, OUTPUT_RATE).pack(target_index[i*OUTPUT_RATE:(i+1)*OUTPUT_RATE])
             #print(index_rd)
             self.bus.rd_en.value = 1
             self.bus.index_rd.value = index_rd      
-        await RisingEdge(self.clk)
-        await Timer (1, units = 'ns')               
+        await self.clk_if.falling
         self.bus.rd_en.value = 0       
 
 class InputMonitor(BusMonitor):
@@ -92,12 +95,13 @@ class InputMonitor(BusMonitor):
     async def _monitor_recv(self): #this will be called in init. 
         global err_cnt
         global table_expected
+        # one record per edge with a write, a read or reset, idle edges are skipped
+        snap = Snapshot(self.dut, ("rst","wr_en","rd_en","index_wr","index_rd","data_wr","data_rd"), self.clock,
+                        qualifier=("wr_en","rd_en","rst"), settle=True, name="TableSample")
         while True:
-             await RisingEdge(self.clock)
-             await ReadOnly()
-             #await Timer (1, units = 'ns')
+             s = await snap.next()
 
-             if self.reset.value == 1:
+             if s.rst == 1:
                  self.bus.wr_en.value = 0
                  self.bus.rd_en.value = 0
                  self.bus.index_wr.value = 0
@@ -106,34 +110,30 @@ class InputMonitor(BusMonitor):
                  table_expected = [0 for i in range(TABLE_SIZE)]
                  continue
 
-             if self.bus.wr_en.value == (2**INPUT_RATE -1) and self.bus.rd_en.value == 1: 
-                    self.read_update()
-                    self.write_update()
-             elif self.bus.wr_en.value == (2**INPUT_RATE - 1):
-                    self.write_update()
-             elif self.bus.rd_en.value == 1:
-                    self.read_update()
+             if s.wr_en == (2**INPUT_RATE -1) and s.rd_en == 1: 
+                    self.read_update(s)
+                    self.write_update(s)
+             elif s.wr_en == (2**INPUT_RATE - 1):
+                    self.write_update(s)
+             elif s.rd_en == 1:
+                    self.read_update(s)
 
-    def write_update(self):
+    def write_update(self, s):
         global table_expected
-        for j in range(0,INPUT_RATE):
-            target_index = self.bus.index_wr.value & ((2**INDEX_WIDTH - 1) << (INDEX_WIDTH*j))
-            target_index = target_index >> (INDEX_WIDTH*j)
-            exp_data_wr = self.bus.data_wr.value & ((2**DATA_WIDTH - 1) << (DATA_WIDTH*j))
-            exp_data_wr = exp_data_wr >> (DATA_WIDTH*j)
+        index_wr = lane_packer(INDEX_WIDTH, INPUT_RATE).unpack(s.index_wr)
+        data_wr = lane_packer(DATA_WIDTH, INPUT_RATE).unpack(s.data_wr)
+        for target_index, exp_data_wr in zip(index_wr, data_wr):
             table_expected[target_index] = exp_data_wr
-            cocotb.log.info("WRITE OPERATION: INDEX = d%0d, DATA = d%0d", target_index, exp_data_wr)
+            ops.info("write", "WRITE OPERATION: INDEX = d%0d, DATA = d%0d", target_index, exp_data_wr)
 
-    def read_update(self): 
+    def read_update(self, s): 
         global err_cnt
-        for j in range(0,OUTPUT_RATE):
-            target_index = self.bus.index_rd.value & ((2**INDEX_WIDTH - 1) << (INDEX_WIDTH*j))
-            target_index = target_index >> (INDEX_WIDTH*j)
-            act_data_rd = self.bus.data_rd.value & ((2**DATA_WIDTH - 1) << (DATA_WIDTH*j))
-            act_data_rd = act_data_rd >> (DATA_WIDTH*j)
+        index_rd = lane_packer(INDEX_WIDTH, OUTPUT_RATE).unpack(s.index_rd)
+        data_rd = lane_packer(DATA_WIDTH, OUTPUT_RATE).unpack(s.data_rd)
+        for target_index, act_data_rd in zip(index_rd, data_rd):
             exp_data_rd = table_expected[target_index]
             if (act_data_rd == exp_data_rd):
-                cocotb.log.info("READ  OPERATION: INDEX = d%0d, DATA = d%0d", target_index,act_data_rd)
+                ops.info("read", "READ  OPERATION: INDEX = d%0d, DATA = d%0d", target_index,act_data_rd)
             else:
                 err_cnt += 1
                 cocotb.log.error("READ  OPERATION: INDEX = d%0d, ACT DATA = d%0d, EXP DATA = d%0d, ", target_index, act_data_rd, exp_data_rd)
@@ -149,6 +149,7 @@ async def dut_init(dut):
     INPUT_RATE = dut.INPUT_RATE.value
     OUTPUT_RATE = dut.OUTPUT_RATE.value
     INDEX_WIDTH = math.ceil(math.log2(TABLE_SIZE));
+    ops.reset()
     await cocotb.start(Clock(dut.clk, TB_CLK_PERIOD, units="ns").start())
     dut.data_wr.value = 0
     dut.index_wr.value = 0
@@ -188,6 +189,106 @@ async def table_rand_test(dut):
     await driver.read_burst(read_index)
     await Timer (500, units = 'ns') 
     
+    ops.report()
+    
     if (err_cnt > 0):
         cocotb.log.error("Errors count = %d",err_cnt)
         cocotb.result.test_fail()
+
+def bench_indices(rng, count, taken):
+    # random indices, each one reusing an index of taken with probability BENCH_CONFLICT
+    indices = []
+    for _ in range(count):
+        pool = taken + indices
+        if pool and rng.random() < BENCH_CONFLICT:
+            indices.append(rng.choice(pool))
+        else:
+            indices.append(rng.randrange(TABLE_SIZE))
+    return indices
+
+@cocotb.test()
+async def table_bench_test(dut):
+    # Every write and read port busy on every cycle. A read of an index written on the same
+    # edge may return the new or the old data (two always blocks on one edge), both are
+    # counted, anything else is an error. Writes of one index on one edge: last lane wins.
+    global err_cnt
+    await dut_init(dut)
+    rng = random.Random(cocotb.RANDOM_SEED)
+    wr_lanes = lane_packer(DATA_WIDTH, INPUT_RATE)
+    wr_index_lanes = lane_packer(INDEX_WIDTH, INPUT_RATE)
+    rd_lanes = lane_packer(DATA_WIDTH, OUTPUT_RATE)
+    rd_index_lanes = lane_packer(INDEX_WIDTH, OUTPUT_RATE)
+    dut._log.info("\nTABLE BENCHMARK: %d cycles, TABLE_SIZE=%d DATA_WIDTH=%d INPUT_RATE=%d OUTPUT_RATE=%d conflict=%.2f",
+                  BENCH_CYCLES, TABLE_SIZE, DATA_WIDTH, INPUT_RATE, OUTPUT_RATE, BENCH_CONFLICT)
+    table = [0]*TABLE_SIZE
+    writes = reads = ok_reads = raw_new = raw_old = ww_conflicts = errors = 0
+    pending = None # (read indices, table before the edge, indices written on the edge)
+    clk_if = ClockedIf(dut.clk, TB_CLK_PERIOD)
+    await clk_if.cycle()
+    for cycle in range(BENCH_CYCLES + 1):
+        if(cycle < BENCH_CYCLES):
+            index_wr = bench_indices(rng, INPUT_RATE, [])
+            data_wr = [rng.randint(0, 2**DATA_WIDTH - 1) for _ in range(INPUT_RATE)]
+            index_rd = bench_indices(rng, OUTPUT_RATE, index_wr)
+            dut.wr_en.value = 2**INPUT_RATE - 1
+            dut.data_wr.value = wr_lanes.pack(data_wr)
+            dut.index_wr.value = wr_index_lanes.pack(index_wr)
+            dut.rd_en.value = 1
+            dut.index_rd.value = rd_index_lanes.pack(index_rd)
+        else:
+            dut.wr_en.value = 0
+            dut.rd_en.value = 0
+        await clk_if.cycle() # data_rd settled, the next cycle is driven right after the checks
+        if(cycle < BENCH_CYCLES):
+            before = list(table)
+            ww_conflicts += len(index_wr) - len(set(index_wr))
+            for index, data in zip(index_wr, data_wr):
+                table[index] = data
+            writes += INPUT_RATE
+            pending = (index_rd, before, set(index_wr))
+        # data_rd of the reads issued on this edge
+        if(pending is not None):
+            index_rd, before, written = pending
+            for index, data in zip(index_rd, rd_lanes.unpack(dut.data_rd.value)):
+                reads += 1
+                new, old = table[index], before[index]
+                if(data != old and (index not in written or data != new)):
+                    errors += 1
+                    if(errors <= 10):
+                        dut._log.error("Cycle %d read index %d: got %d, expected %d (new %d)", cycle, index, data,
+                                       old, new)
+                    continue
+                ok_reads += 1
+                if(index in written and new != old): # same data written tells nothing
+                    if(data == new):
+                        raw_new += 1
+                    else:
+                        raw_old += 1
+            pending = None
+
+    raw = raw_new + raw_old
+    policy = None if raw == 0 else "write-first" if raw_old == 0 else "read-first" if raw_new == 0 else "mixed"
+    accesses = (writes + ok_reads)/BENCH_CYCLES
+    metrics = {
+        "params": {"TABLE_SIZE": int(TABLE_SIZE), "DATA_WIDTH": int(DATA_WIDTH), "INPUT_RATE": int(INPUT_RATE),
+                   "OUTPUT_RATE": int(OUTPUT_RATE), "conflict": BENCH_CONFLICT},
+        "cycles": BENCH_CYCLES,
+        "writes": writes,
+        "reads": reads,
+        "accesses_per_cycle": round(accesses, 4),
+        "bits_per_cycle": round(accesses*DATA_WIDTH, 2),
+        "peak_accesses_per_cycle": INPUT_RATE + OUTPUT_RATE,
+        "sustained": errors == 0 and accesses == INPUT_RATE + OUTPUT_RATE,
+        "same_cycle_raw": {"reads": raw, "new_data": raw_new, "old_data": raw_old, "policy": policy},
+        "write_write_conflicts": ww_conflicts,
+        "errors": errors,
+    }
+    dut._log.info("Bandwidth: %.3f of %d accesses/cycle (%.1f bits/cycle), same cycle read after write: %d reads, %s",
+                  accesses, INPUT_RATE + OUTPUT_RATE, metrics["bits_per_cycle"], raw, policy)
+    path = write_result("table", metrics)
+    if(path):
+        dut._log.info("Benchmark results written to %s", path)
+    if(errors > 0):
+        err_cnt += errors
+        cocotb.log.error("Errors count = %d",err_cnt)
+        cocotb.result.test_fail()
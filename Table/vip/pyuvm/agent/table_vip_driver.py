@@ -1,6 +1,7 @@
 """Table VIP Driver"""
 from pyuvm import uvm_driver
 from cocotb.triggers import RisingEdge
+from tbutils.packing import lane_packer
 from ..common.table_vip_seq_item import TableVipSeqItem
 from ..common import TableOp
 
@@ -49,25 +50,24 @@ class TableVipDriver(uvm_driver):
         """Drive WRITE operation"""
         await RisingEdge(self.dut.clk)
 
-        # Pack write enables (2 bits)
-        wr_en_val = (item.wr_en[1] << 1) | item.wr_en[0]
+        # Pack write enables (1 bit per lane)
+        wr_en_val = lane_packer(1, len(item.wr_en)).pack(item.wr_en)
         self.dut.wr_en.value = wr_en_val
         self.dut.rd_en.value = 0
 
-        # Pack write indices (10 bits: [9:5] for idx[1], [4:0] for idx[0])
-        index_wr_val = (item.index_wr[1] << 5) | item.index_wr[0]
+        # Pack write indices (INDEX_WIDTH per lane, lane 0 in the LSBs)
+        index_wr_val = lane_packer(self.cfg.INDEX_WIDTH, len(item.index_wr)).pack(item.index_wr)
         self.dut.index_wr.value = index_wr_val
 
-        # Pack write data (16 bits: [15:8] for data[1], [7:0] for data[0])
-        data_wr_val = (item.data_wr[1] << 8) | item.data_wr[0]
+        # Pack write data (DATA_WIDTH per lane)
+        data_wr_val = lane_packer(self.cfg.DATA_WIDTH, len(item.data_wr)).pack(item.data_wr)
         self.dut.data_wr.value = data_wr_val
 
         await RisingEdge(self.dut.clk)
         self.dut.wr_en.value = 0
 
-        self.logger.debug(f"WRITE: wr_en=0x{wr_en_val:x} idx[0]={item.index_wr[0]} "
-                         f"data[0]=0x{item.data_wr[0]:x} idx[1]={item.index_wr[1]} "
-                         f"data[1]=0x{item.data_wr[1]:x}")
+        self.logger.debug("WRITE: wr_en=0x%x idx[0]=%s data[0]=0x%x idx[1]=%s data[1]=0x%x",
+                          wr_en_val, item.index_wr[0], item.data_wr[0], item.index_wr[1], item.data_wr[1])
 
     async def drive_read(self, item):
         """Drive READ operation"""
@@ -75,18 +75,16 @@ class TableVipDriver(uvm_driver):
         self.dut.rd_en.value = 1
         self.dut.wr_en.value = 0
 
-        # Pack read indices (10 bits: [9:5] for idx[1], [4:0] for idx[0])
-        index_rd_val = (item.index_rd[1] << 5) | item.index_rd[0]
+        # Pack read indices (INDEX_WIDTH per lane)
+        index_rd_val = lane_packer(self.cfg.INDEX_WIDTH, len(item.index_rd)).pack(item.index_rd)
         self.dut.index_rd.value = index_rd_val
 
         await RisingEdge(self.dut.clk)
 
         # Unpack read data
-        data_rd_val = int(self.dut.data_rd.value)
-        item.data_rd[0] = data_rd_val & 0xFF
-        item.data_rd[1] = (data_rd_val >> 8) & 0xFF
+        item.data_rd = lane_packer(self.cfg.DATA_WIDTH, len(item.data_rd)).unpack(self.dut.data_rd.value)
 
         self.dut.rd_en.value = 0
 
-        self.logger.debug(f"READ: idx[0]={item.index_rd[0]} data[0]=0x{item.data_rd[0]:x} "
-                         f"idx[1]={item.index_rd[1]} data[1]=0x{item.data_rd[1]:x}")
+        self.logger.debug("READ: idx[0]=%s data[0]=0x%x idx[1]=%s data[1]=0x%x",
+                          item.index_rd[0], item.data_rd[0], item.index_rd[1], item.data_rd[1])
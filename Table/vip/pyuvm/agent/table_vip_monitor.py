@@ -1,7 +1,9 @@
 """Table VIP Monitor"""
 from pyuvm import uvm_monitor
 from cocotb.triggers import RisingEdge
-from ..common.table_vip_seq_item import TableVipSeqItem
+from tbutils.packing import lane_packer
+from tbutils.txn import TxnPool
+from ..common.table_vip_seq_item import TableVipTxn
 from ..common import TableOp
 
 class TableVipMonitor(uvm_monitor):
@@ -11,6 +13,7 @@ class TableVipMonitor(uvm_monitor):
         self.cfg = None
         from pyuvm import uvm_analysis_port
         self.ap = uvm_analysis_port("ap", self)
+        self.pool = TxnPool(TableVipTxn)  # records go back to the pool once the subscribers returned
 
     def build_phase(self):
         super().build_phase()
@@ -36,42 +39,36 @@ class TableVipMonitor(uvm_monitor):
 
             # Detect write operation
             if wr_en_val != 0:
-                item = TableVipSeqItem("item")
+                item = self.pool.acquire()
                 item.op = TableOp.WRITE
-                item.wr_en = [wr_en_val & 1, (wr_en_val >> 1) & 1]
+                item.wr_en = lane_packer(1, self.cfg.INPUT_RATE).unpack(wr_en_val)
                 item.rd_en = 0
 
                 # Unpack write indices
-                index_wr_val = int(self.dut.index_wr.value)
-                item.index_wr[0] = index_wr_val & 0x1F
-                item.index_wr[1] = (index_wr_val >> 5) & 0x1F
+                item.index_wr = lane_packer(self.cfg.INDEX_WIDTH, self.cfg.INPUT_RATE).unpack(self.dut.index_wr.value)
 
                 # Unpack write data
-                data_wr_val = int(self.dut.data_wr.value)
-                item.data_wr[0] = data_wr_val & 0xFF
-                item.data_wr[1] = (data_wr_val >> 8) & 0xFF
+                item.data_wr = lane_packer(self.cfg.DATA_WIDTH, self.cfg.INPUT_RATE).unpack(self.dut.data_wr.value)
 
                 self.ap.write(item)
-                self.logger.debug(f"Observed {item}")
+                self.logger.debug("Observed %s", item)
+                self.pool.release(item)
 
             # Detect read operation
             if rd_en_val != 0:
-                item = TableVipSeqItem("item")
+                item = self.pool.acquire()
                 item.op = TableOp.READ
                 item.rd_en = 1
-                item.wr_en = [0, 0]
+                item.wr_en = [0] * self.cfg.INPUT_RATE
 
                 # Unpack read indices
-                index_rd_val = int(self.dut.index_rd.value)
-                item.index_rd[0] = index_rd_val & 0x1F
-                item.index_rd[1] = (index_rd_val >> 5) & 0x1F
+                item.index_rd = lane_packer(self.cfg.INDEX_WIDTH, self.cfg.OUTPUT_RATE).unpack(self.dut.index_rd.value)
 
                 await RisingEdge(self.dut.clk)
 
                 # Unpack read data
-                data_rd_val = int(self.dut.data_rd.value)
-                item.data_rd[0] = data_rd_val & 0xFF
-                item.data_rd[1] = (data_rd_val >> 8) & 0xFF
+                item.data_rd = lane_packer(self.cfg.DATA_WIDTH, self.cfg.OUTPUT_RATE).unpack(self.dut.data_rd.value)
 
                 self.ap.write(item)
-                self.logger.debug(f"Observed {item}")
+                self.logger.debug("Observed %s", item)
+                self.pool.release(item)
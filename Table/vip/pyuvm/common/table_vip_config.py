@@ -9,3 +9,8 @@ class TableVipConfig(uvm_object):
         self.DATA_WIDTH = 8
         self.INPUT_RATE = 2
         self.OUTPUT_RATE = 2
+
+    @property
+    def INDEX_WIDTH(self):
+        """$clog2(TABLE_SIZE), width of one index_wr/index_rd lane"""
+        return max(1, (self.TABLE_SIZE - 1).bit_length())
@@ -2,6 +2,7 @@
 from pyuvm import uvm_sequence_item
 from . import TableOp
 import random
+from tbutils.txn import Txn
 
 class TableVipSeqItem(uvm_sequence_item):
     def __init__(self, name="table_vip_seq_item"):
@@ -68,3 +69,12 @@ class TableVipSeqItem(uvm_sequence_item):
         else:
             return (f"READ: idx[0]={self.index_rd[0]} data[0]=0x{self.data_rd[0]:x} "
                    f"idx[1]={self.index_rd[1]} data[1]=0x{self.data_rd[1]:x}")
+
+
+class TableVipTxn(Txn):
+    """Monitored Table transaction, pooled by the monitor, to_item() gives a TableVipSeqItem"""
+
+    __slots__ = ("op", "wr_en", "index_wr", "data_wr", "rd_en", "index_rd", "data_rd")
+    defaults = (TableOp.WRITE, (0, 0), (0, 0), (0, 0), 0, (0, 0), (0, 0))
+    item_type = TableVipSeqItem
+    __str__ = TableVipSeqItem.__str__
@@ -1,5 +1,6 @@
 """Table VIP Scoreboard"""
 from pyuvm import uvm_scoreboard, uvm_analysis_imp
+from tbutils.tblog import OpsLog
 from ..common import TableOp
 
 class TableVipScoreboard(uvm_scoreboard):
@@ -10,6 +11,7 @@ class TableVipScoreboard(uvm_scoreboard):
         self.table_model = {}  # Python dict as table reference model
         self.write_count = 0
         self.read_count = 0
+        self.ops = OpsLog(self.logger, "scoreboard")
 
     def build_phase(self):
         super().build_phase()
@@ -26,7 +28,7 @@ class TableVipScoreboard(uvm_scoreboard):
 
     def write(self, item):
         """Receive transaction from monitor"""
-        self.logger.info(f"Checking: {item}")
+        self.ops.info(item.op.name.lower(), "Checking: %s", item)
 
         if item.op == TableOp.WRITE:
             self.check_write(item)
@@ -40,11 +42,11 @@ class TableVipScoreboard(uvm_scoreboard):
         # Update model based on write enables
         if item.wr_en[0]:
             self.table_model[item.index_wr[0]] = item.data_wr[0]
-            self.logger.debug(f"Updated table[{item.index_wr[0]}] = 0x{item.data_wr[0]:x}")
+            self.logger.debug("Updated table[%s] = 0x%x", item.index_wr[0], item.data_wr[0])
 
         if item.wr_en[1]:
             self.table_model[item.index_wr[1]] = item.data_wr[1]
-            self.logger.debug(f"Updated table[{item.index_wr[1]}] = 0x{item.data_wr[1]:x}")
+            self.logger.debug("Updated table[%s] = 0x%x", item.index_wr[1], item.data_wr[1])
 
     def check_read(self, item):
         """Check READ operation"""
@@ -56,7 +58,7 @@ class TableVipScoreboard(uvm_scoreboard):
                             f"expected=0x{self.table_model[item.index_rd[0]]:x} "
                             f"actual=0x{item.data_rd[0]:x}")
         else:
-            self.logger.debug(f"Read[0] matched: table[{item.index_rd[0]}] = 0x{item.data_rd[0]:x}")
+            self.logger.debug("Read[0] matched: table[%s] = 0x%x", item.index_rd[0], item.data_rd[0])
 
         # Check read data[1]
         if item.data_rd[1] != self.table_model[item.index_rd[1]]:
@@ -64,11 +66,12 @@ class TableVipScoreboard(uvm_scoreboard):
                             f"expected=0x{self.table_model[item.index_rd[1]]:x} "
                             f"actual=0x{item.data_rd[1]:x}")
         else:
-            self.logger.debug(f"Read[1] matched: table[{item.index_rd[1]}] = 0x{item.data_rd[1]:x}")
+            self.logger.debug("Read[1] matched: table[%s] = 0x%x", item.index_rd[1], item.data_rd[1])
 
     def report_phase(self):
         self.logger.info("=" * 50)
         self.logger.info("=== Table Statistics ===")
         self.logger.info(f"Total Writes: {self.write_count}")
         self.logger.info(f"Total Reads: {self.read_count}")
+        self.ops.report()
         self.logger.info("=" * 50)
@@ -0,0 +1,39 @@
+# Content-addressed compile cache for cocotb simulation builds
+# Include after "include $(shell cocotb-config --makefiles)/Makefile.sim"
+#
+# The compiled image ($(SIM_BUILD)/sim.vvp for icarus, $(SIM_BUILD)/Vtop for verilator)
+# is keyed on the content of VERILOG_SOURCES (incl. the generated iverilog_dump.v),
+# COMPILE_ARGS, TOPLEVEL and the simulator/cocotb versions:
+#   - same key as the last build in SIM_BUILD : image reused, no recompile
+#   - key found in SIM_CACHE_DIR              : image copied in, no recompile
+#   - otherwise                               : stale image dropped, compiled and stored
+# so parameter changes no longer need "make clean" and sweep/regression reruns reuse builds.
+#
+# SIM_CACHE=0 disables the cache, SIM_CACHE_DIR moves it,
+# "make sim_cache_clean" empties it.
+
+SIM_CACHE ?= 1
+SIM_CACHE_DIR ?= $(HOME)/.cache/rtlstructlib/sim_cache
+SIM_CACHE_PY := python3 $(dir $(lastword $(MAKEFILE_LIST)))../sim_cache.py --dir $(SIM_CACHE_DIR)
+
+SIM_CACHE_IMAGE_icarus = $(SIM_BUILD)/sim.vvp
+SIM_CACHE_IMAGE_verilator = $(SIM_BUILD)/Vtop
+SIM_CACHE_IMAGE = $(SIM_CACHE_IMAGE_$(SIM))
+
+ifeq ($(SIM_CACHE), 1)
+ifneq ($(SIM_CACHE_IMAGE),)
+SIM_CACHE_BUILD_ARGS = --sim $(SIM) --build $(SIM_BUILD) --top '$(strip $(TOPLEVEL))' \
+                       --args '$(COMPILE_ARGS) $(EXTRA_ARGS)' $(VERILOG_SOURCES)
+SIM_CACHE_KEY := $(shell $(SIM_CACHE_PY) restore $(SIM_CACHE_BUILD_ARGS))
+
+$(COCOTB_RESULTS_FILE): $(SIM_BUILD)/sim_cache.key
+
+# A failing cache never fails the run, the image is simply not stored
+$(SIM_BUILD)/sim_cache.key: $(SIM_CACHE_IMAGE)
+	-@$(SIM_CACHE_PY) store --key '$(SIM_CACHE_KEY)' $(SIM_CACHE_BUILD_ARGS)
+endif
+endif
+
+.PHONY: sim_cache_clean
+sim_cache_clean:
+	@$(SIM_CACHE_PY) clean
@@ -0,0 +1,24 @@
+# Verilator support shared by the cocotb and pyuvm Makefiles
+# Include after TOPLEVEL and COMPILE_ARGS are set and
+# before "include $(shell cocotb-config --makefiles)/Makefile.sim"
+#
+# The Makefiles write DUT parameter overrides the icarus way, -P<TOPLEVEL>.<NAME>=<VALUE>.
+# With SIM=verilator they are rewritten to -G<NAME>=<VALUE>, so the same parameter
+# variables, TESTCASE selection and WAVES settings (Utils/tb/cocotb/waves.mk) work on
+# both simulators:
+#
+#   make SIM=verilator TOTAL_INDEX=64 CHAINING_SIZE=8 TESTCASE=ht_bench_test
+#
+#   VERILATOR_WARNINGS=-Wall      lint options, default -Wno-fatal (warnings do not stop the build)
+#   VERILATOR_ARGS=--x-assign unique
+#                                 extra verilator options, e.g. --threads 2
+#
+# --public-params keeps the DUT parameters visible to the testbenches (dut.DEPTH.value).
+
+VERILATOR_WARNINGS ?= -Wno-fatal
+VERILATOR_ARGS ?=
+
+ifeq ($(SIM), verilator)
+   COMPILE_ARGS := $(patsubst -P$(strip $(TOPLEVEL)).%,-G%,$(COMPILE_ARGS))
+   EXTRA_ARGS += --public-params $(VERILATOR_WARNINGS) $(VERILATOR_ARGS)
+endif
@@ -0,0 +1,74 @@
+# Waveform dump control shared by the cocotb Makefiles (icarus, verilator)
+# Include after TOPLEVEL, VERILOG_SOURCES and COMPILE_ARGS are set and
+# before "include $(shell cocotb-config --makefiles)/Makefile.sim"
+#
+#   WAVES=1              dump to $(SIM_BUILD)/<TOPLEVEL>.<WAVES_FORMAT>, off by default
+#   WAVES_FORMAT=fst     vcd (default) or fst, fst is far smaller and faster to write
+#   WAVES_SCOPE=fifo     hierarchy to dump, default TOPLEVEL
+#   WAVES_DEPTH=1        levels below WAVES_SCOPE, 0 = all
+#   WAVES_START=5000     dump from this time (ns)
+#   WAVES_STOP=9000      dump until this time (ns), 0 = end of simulation
+#   WAVES_TRIGGER=1      start with dumping off, the testbench turns it on through
+#                        tbutils.waves.WaveControl (e.g. at the first scoreboard error)
+#
+# SIM=verilator builds the model with --trace (--trace-fst), WAVES_DEPTH becomes
+# --trace-depth and the whole run is dumped to dump.vcd (dump.fst) in the run
+# directory. WAVES_SCOPE, WAVES_START/STOP and WAVES_TRIGGER are icarus only.
+
+SIM_BUILD ?= sim_build
+WAVES := $(strip $(WAVES))
+WAVES_FORMAT ?= vcd
+WAVES_SCOPE ?= $(strip $(TOPLEVEL))
+WAVES_DEPTH ?= 0
+WAVES_START ?= 0
+WAVES_STOP ?= 0
+WAVES_TRIGGER ?= 0
+
+ifeq ($(SIM), icarus)
+ifeq ($(WAVES), 1)
+   $(shell mkdir -p $(SIM_BUILD))
+   $(shell echo '`timescale 1ns/1ps' > $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo 'module iverilog_dump();' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo 'reg waves_on = 0;' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo 'initial begin' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo '    $$dumpfile("$(SIM_BUILD)/$(strip $(TOPLEVEL)).$(WAVES_FORMAT)");' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo '    $$dumpvars($(WAVES_DEPTH), $(WAVES_SCOPE));' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo '    $$dumpoff;' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo '    if ($(WAVES_TRIGGER) == 0) begin' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo '        #($(WAVES_START)) waves_on = 1;' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo '        if ($(WAVES_STOP) > $(WAVES_START)) #($(WAVES_STOP) - $(WAVES_START)) waves_on = 0;' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo '    end' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo 'end' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo 'always @(waves_on) if (waves_on) $$dumpon; else $$dumpoff;' >> $(SIM_BUILD)/iverilog_dump.v)
+   $(shell echo 'endmodule' >> $(SIM_BUILD)/iverilog_dump.v)
+   VERILOG_SOURCES += $(SIM_BUILD)/iverilog_dump.v
+   COMPILE_ARGS += -s iverilog_dump
+ifeq ($(WAVES_FORMAT), fst)
+   PLUSARGS += -fst
+endif
+endif
+endif
+
+ifeq ($(SIM), verilator)
+ifeq ($(WAVES), 1)
+ifeq ($(WAVES_FORMAT), fst)
+   EXTRA_ARGS += --trace-fst --trace-structs
+else
+   EXTRA_ARGS += --trace --trace-structs
+endif
+ifneq ($(WAVES_DEPTH), 0)
+   EXTRA_ARGS += --trace-depth $(WAVES_DEPTH)
+endif
+ifneq ($(filter-out 0,$(WAVES_START) $(WAVES_STOP) $(WAVES_TRIGGER)),)
+   $(warning WAVES_START/WAVES_STOP/WAVES_TRIGGER need SIM=icarus, verilator dumps the whole run)
+endif
+ifneq ($(WAVES_SCOPE), $(strip $(TOPLEVEL)))
+   $(warning WAVES_SCOPE needs SIM=icarus, verilator dumps from $(strip $(TOPLEVEL)))
+endif
+endif
+endif
+
+# The settings above replace cocotb's own WAVES handling
+ifneq ($(filter icarus verilator,$(SIM)),)
+override WAVES := 0
+endif
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Benchmark entry point
+Create Date: 18/10/2026
+
+Usage (from the repository root):
+    python Utils/tb/run_bench.py -m FIFO                       # grid from FIFO/tb/cocotb/bench.json
+    python Utils/tb/run_bench.py -m FIFO -p RD_BUFFER=1 -D BENCH_WORDS=5000
+    python Utils/tb/run_bench.py -m FIFO --list                # print the points only
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tbutils.bench import main
+
+if __name__ == "__main__":
+    sys.exit(main())
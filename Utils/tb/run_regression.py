@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Regression entry point
+Create Date: 18/10/2026
+
+Usage (from the repository root):
+    python Utils/tb/run_regression.py                  # every module, all cores
+    python Utils/tb/run_regression.py -m FIFO LIFO -j 4 --seed 1234
+    python Utils/tb/run_regression.py -D WAVES=0
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tbutils.regression import main
+
+if __name__ == "__main__":
+    sys.exit(main())
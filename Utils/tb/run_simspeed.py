@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Simulator speed comparison entry point
+Create Date: 18/10/2026
+
+Usage (from the repository root):
+    python Utils/tb/run_simspeed.py -m Hash_Table Systolic_Array          # icarus vs verilator
+    python Utils/tb/run_simspeed.py -m Systolic_Array -D ARRAY_ROWS=16 -D ARRAY_COLS=16 -D K_DIM=16
+    python Utils/tb/run_simspeed.py --vip --no-cache                      # all flows, compile time included
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tbutils.simspeed import main
+
+if __name__ == "__main__":
+    sys.exit(main())
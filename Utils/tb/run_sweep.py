@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Parameter sweep entry point
+Create Date: 18/10/2026
+
+Usage (from the repository root):
+    python Utils/tb/run_sweep.py -m FIFO                    # grid from FIFO/tb/cocotb/sweep.json
+    python Utils/tb/run_sweep.py -m FIFO -p DEPTH=4,256     # override one axis
+    python Utils/tb/run_sweep.py -m Hash_Table --list       # print the points only
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tbutils.sweep import main
+
+if __name__ == "__main__":
+    sys.exit(main())
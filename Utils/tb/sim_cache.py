@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Simulation Compile Cache
+Create Date: 18/10/2026
+
+Called by Utils/tb/cocotb/sim_cache.mk, or by hand:
+    python Utils/tb/sim_cache.py key --sim icarus --args "-Pfifo.DEPTH=12" FIFO/src/fifo.sv
+    python Utils/tb/sim_cache.py clean
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tbutils.sim_cache import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+"""
+RTLStructLib Shared Testbench Utilities
+Create Date: 18/10/2026
+
+Helpers shared by the cocotb testbenches, pyUVM VIPs and the regression flow.
+Sub-modules are imported explicitly so that flow scripts do not pull in cocotb.
+"""
+
+__version__ = "1.0.0"
+__author__ = "RTLStructLib"
@@ -0,0 +1,214 @@
+"""
+Benchmark Runner
+Create Date: 18/10/2026
+
+Runs the benchmark test of a testbench over a parameter grid and merges the
+measurements of every point into one JSON results file. The benchmark spec
+lives next to the testbench in tb/cocotb/bench.json:
+
+    {
+        "testcase": "fifo_bench_test",
+        "grid": [{"ASYNC": [1], "DEPTH": [4, 8], "RD_CLK_PERIOD": [10, 32]},
+                 {"ASYNC": [0], "DEPTH": [4, 8]}],
+        "exclude": [{"DEPTH": 4, "RD_CLK_PERIOD": 32}],
+        "size": "DEPTH"
+    }
+
+"grid" is a sweep.json grid or a list of them. Every point runs make with the
+point as parameter overrides, TESTCASE=<testcase> and BENCH_RESULTS set to a file
+in its work directory, which the testbench fills through write_result(). With
+"size" set, the summary gives the smallest size value that reports
+"sustained": true for every combination of the other parameters, e.g. the
+minimum FIFO DEPTH per clock ratio.
+
+In the testbench:
+
+    from tbutils.bench import histogram, percentiles, write_result
+    write_result("fifo", {"throughput": rate, "latency_ns": percentiles(latencies), "sustained": ok})
+    write_result("hash_table", {"search_cycles": histogram(cycles)})   # {"3": 120, "5": 40}
+"""
+
+import argparse
+import json
+import os
+
+from .regression import (REPO_ROOT, RegressionJob, cache_make_args, cache_summary, discover_jobs,
+                         parse_defines, run_regression, write_json, write_junit)
+from .sweep import expand_grid, parse_grid_overrides, point_name
+
+BENCH_FILE = "bench.json"
+ENV_RESULTS = "BENCH_RESULTS"
+RESULT_FILE = "bench_result.json"
+
+
+# ------------------------------------------------------------------ testbench side
+def percentiles(values, points=(50, 90, 99)):
+    """min/mean/pN/max of a list of numbers (nearest rank), None when empty"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    stats = {"min": ordered[0], "mean": round(sum(ordered) / len(ordered), 3)}
+    for p in points:
+        rank = max(0, min(len(ordered) - 1, -(-p * len(ordered) // 100) - 1))
+        stats[f"p{p}"] = ordered[rank]
+    stats["max"] = ordered[-1]
+    return stats
+
+
+def histogram(values):
+    """{value: count} in ascending value order, keys as strings so the JSON round-trips"""
+    counts = {}
+    for v in values:
+        counts[v] = counts.get(v, 0) + 1
+    return {str(v): counts[v] for v in sorted(counts)}
+
+
+def write_result(name, metrics, path=None):
+    """Append a benchmark record to BENCH_RESULTS, no-op when it is not set"""
+    path = path or os.environ.get(ENV_RESULTS)
+    if not path:
+        return None
+    records = []
+    if os.path.exists(path):
+        with open(path) as f:
+            records = json.load(f)
+    records.append({"bench": name, **metrics})
+    with open(path, "w") as f:
+        json.dump(records, f, indent=2)
+    return path
+
+
+# ----------------------------------------------------------------------- runner
+def load_spec(tb_dir):
+    """Load the benchmark spec of a testbench directory, None if it has none"""
+    path = os.path.join(tb_dir, BENCH_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def expand_grids(grid, exclude=None):
+    """expand_grid over one grid or a list of grids, duplicate points dropped"""
+    points = []
+    for g in grid if isinstance(grid, list) else [grid]:
+        for point in expand_grid(g, exclude):
+            if point not in points:
+                points.append(point)
+    return points
+
+
+def bench_jobs(out_dir, root=REPO_ROOT, modules=None, grid_overrides=None):
+    """(job, spec, point) for every benchmark point of every selected module"""
+    jobs = []
+    for tb_job in discover_jobs(root, modules):
+        spec = load_spec(tb_job.tb_dir)
+        if spec is None:
+            continue
+        grids = spec.get("grid", {})
+        if grid_overrides:
+            grids = [dict(g, **grid_overrides) for g in (grids if isinstance(grids, list) else [grids])]
+        for point in expand_grids(grids, spec.get("exclude")):
+            name = point_name(tb_job.name, point)
+            make_args = {k: str(v) for k, v in point.items()}
+            make_args["TESTCASE"] = spec["testcase"]
+            make_args[ENV_RESULTS] = os.path.join(out_dir, name, RESULT_FILE)
+            jobs.append((RegressionJob(name, tb_job.tb_dir, make_args), spec, point))
+    return jobs
+
+
+def collect(results, points):
+    """Merge the per-point result files, keyed by job name"""
+    runs = []
+    for r in results:
+        path = r.job.make_args[ENV_RESULTS]
+        records = []
+        if os.path.exists(path):
+            with open(path) as f:
+                records = json.load(f)
+        runs.append({"name": r.job.name, "params": points[r.job.name], "status": r.status,
+                     "seed": r.job.seed, "results": records})
+    return runs
+
+
+def min_size(runs, size):
+    """Smallest size value sustaining its rate per combination of the other parameters"""
+    groups = {}
+    for run in runs:
+        if size not in run["params"]:
+            continue
+        others = {k: v for k, v in run["params"].items() if k != size}
+        key = json.dumps(others, sort_keys=True)
+        entry = groups.setdefault(key, {"params": others, "sizes": {}})
+        ok = run["status"] == "pass" and bool(run["results"]) and all(r.get("sustained") for r in run["results"])
+        entry["sizes"][run["params"][size]] = ok
+    summary = []
+    for entry in groups.values():
+        sustained = sorted(v for v, ok in entry["sizes"].items() if ok)
+        summary.append({"params": entry["params"], f"min_{size}": sustained[0] if sustained else None,
+                        "tested": sorted(entry["sizes"])})
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the testbench benchmarks over their parameter grids")
+    parser.add_argument("-m", "--modules", nargs="*", help="module folders to benchmark (default: all with a spec)")
+    parser.add_argument("-p", "--param", action="append",
+                        help="override/add a grid axis NAME=v1,v2,... (e.g. -p DEPTH=4,8)")
+    parser.add_argument("-D", "--define", action="append", help="extra make variable NAME=VALUE for every point")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="parallel jobs (default: all cores)")
+    parser.add_argument("--sim", default="icarus", help="cocotb SIM (default: icarus)")
+    parser.add_argument("--seed", type=int, help="RANDOM_SEED for every point (default: random per point)")
+    parser.add_argument("--timeout", type=float, help="per-point timeout in seconds")
+    parser.add_argument("--cache-dir", help="compile cache directory (default: ~/.cache/rtlstructlib/sim_cache)")
+    parser.add_argument("--no-cache", action="store_true", help="always recompile")
+    parser.add_argument("--log-summary", action="store_true",
+                        help="per-point logs keep only the ops counters (TB_LOG_SUMMARY=1)")
+    parser.add_argument("--list", action="store_true", help="print the benchmark points and exit")
+    parser.add_argument("--root", default=REPO_ROOT, help="repository root")
+    parser.add_argument("--out", default="bench_out", help="output directory")
+    args = parser.parse_args(argv)
+
+    out_dir = os.path.abspath(args.out)
+    entries = bench_jobs(out_dir, args.root, args.modules, parse_grid_overrides(args.param))
+    if not entries:
+        print(f"No benchmark found, add a {BENCH_FILE} next to the testbench")
+        return 1
+    if args.list:
+        for job, _, _ in entries:
+            print(job.name)
+        return 0
+    make_args = cache_make_args(args.no_cache, args.cache_dir)
+    if args.log_summary:
+        make_args["TB_LOG_SUMMARY"] = "1"
+    make_args.update(parse_defines(args.define))
+    jobs = []
+    for job, _, _ in entries:
+        job.make_args.update(make_args)
+        if os.path.exists(job.make_args[ENV_RESULTS]):
+            os.remove(job.make_args[ENV_RESULTS])
+        jobs.append(job)
+
+    os.makedirs(out_dir, exist_ok=True)
+    print(f"Benchmarking {len(jobs)} points on {args.jobs} workers, output in {out_dir}")
+    results = run_regression(jobs, out_dir, workers=args.jobs, sim=args.sim, seed=args.seed, timeout=args.timeout)
+    write_json(results, os.path.join(out_dir, "bench_runs.json"))
+    write_junit(results, os.path.join(out_dir, "bench_runs.xml"))
+
+    runs = collect(results, {job.name: point for job, _, point in entries})
+    report = {"runs": runs, "summary": {}}
+    specs = {job.name.split(os.sep)[0]: spec for job, spec, _ in entries}
+    for module, spec in sorted(specs.items()):
+        if not spec.get("size"):
+            continue
+        module_runs = [run for run in runs if run["name"].split(os.sep)[0] == module]
+        report["summary"][module] = min_size(module_runs, spec["size"])
+        for row in report["summary"][module]:
+            print(f"{module} {row['params']}: min {spec['size']} = {row['min_' + spec['size']]}")
+    with open(os.path.join(out_dir, "bench_results.json"), "w") as f:
+        json.dump(report, f, indent=2)
+
+    failed = [r for r in results if r.failed]
+    print(f"{len(results) - len(failed)}/{len(results)} points passed, {cache_summary(results)}, "
+          f"results in {os.path.join(out_dir, 'bench_results.json')}")
+    return 1 if failed else 0
@@ -0,0 +1,69 @@
+"""
+Clocked Interface
+Create Date: 18/10/2026
+
+Drive and sample points of one clock without the per-cycle settling Timer. The
+testbenches used to do
+
+    await RisingEdge(dut.clk)
+    await Timer(1, 'ns')        # let the edge settle, then check outputs and drive
+
+which costs a second time slot and a new Timer object every cycle. ClockedIf keeps
+the edge and phase triggers of its clock and stays in the time step of the edge:
+
+    clk = ClockedIf(dut.clk, TB_CLK_PERIOD)
+    await clk.cycle()           # rising edge, read-write phase: registers updated, inputs drivable
+    dut.op_en.value = 1
+    await clk.settle()          # read-only phase: settled response to this step's drives
+    await clk.idle(20)          # 20 rising edges, then the read-write phase again
+
+Outputs read after cycle() are the post-edge values the Timer wait saw, inputs driven
+there are sampled by the DUT at the next edge. Nothing can be driven after settle()
+until the next cycle(). A driver sharing the clock with a monitor that samples the
+inputs in the read-only phase of the rising edge drives on the falling edge instead
+(await clk.falling, one trigger per cycle), so the monitor still sees the inputs the
+DUT registered. With a fixed period (not a StressClock) idle() jumps over the gap
+with one Timer instead of waking up on every edge.
+"""
+
+from cocotb.triggers import ClockCycles, FallingEdge, ReadOnly, ReadWrite, RisingEdge, Timer
+from cocotb.utils import get_sim_steps
+
+
+class ClockedIf:
+    """Cached edge and phase triggers of one clock"""
+
+    def __init__(self, clk, period=None, units="ns"):
+        self.clk = clk
+        self.rising = RisingEdge(clk)
+        self.falling = FallingEdge(clk)
+        self.read_write = ReadWrite()
+        self.read_only = ReadOnly()
+        self.period = get_sim_steps(period, units) if period else None  # None: idle() counts edges
+
+    async def cycle(self):
+        """Next rising edge, returns in its read-write phase"""
+        await self.rising
+        await self.read_write
+
+    async def fall(self):
+        """Next falling edge, returns in its read-write phase"""
+        await self.falling
+        await self.read_write
+
+    async def settle(self):
+        """Read-only phase of the current time step"""
+        await self.read_only
+
+    async def idle(self, cycles):
+        """cycles rising edges, returns in the read-write phase of the last one"""
+        if cycles <= 0:
+            return
+        if self.period and cycles > 2:
+            # first edge, mid-way through the cycle before the last edge, the last edge
+            await self.rising
+            await Timer((cycles - 2) * self.period + self.period // 2, "step")
+            await self.rising
+        else:
+            await ClockCycles(self.clk, cycles)
+        await self.read_write
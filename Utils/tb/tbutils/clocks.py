@@ -0,0 +1,171 @@
+"""
+Stress Clocks
+Create Date: 18/10/2026
+
+Clock generators for clock domain crossing stress runs. A fixed cocotb Clock pair
+only ever shows the DUT one phase relationship between two domains; StressClock
+randomizes the period at start, starts at a random phase, adds per-cycle jitter
+and lets the period drift slowly, so a long run sweeps the edges of one domain
+across the whole period of the other.
+
+Every random choice comes from a random.Random seeded from CDC_SEED (default the
+cocotb RANDOM_SEED), one stream per clock, so a failing run is reproduced with the
+logged seed. Settings come from the environment (make passes CDC_* on):
+
+    CDC_STRESS=1        use StressClock instead of cocotb Clock
+    CDC_SEED=1234       seed of the clock RNGs
+    CDC_SPREAD=0.25     nominal period randomized by up to +-25% at start
+    CDC_JITTER=0.05     per-cycle edge jitter, +-5% of the period
+    CDC_DRIFT=0.10      period drifts in a bounded random walk, up to +-10%
+    CDC_PHASE=1         random start phase in [0, period)
+    CDC_WORDS=2000      words streamed by the CDC soak tests (FIFO cocotb TB and pyUVM VIP)
+    CDC_IDLE=0.3        wr_en/rd_en idle probability per cycle in the soak tests
+
+    stress = ClockStress.from_env()
+    cocotb.start_soon(stress.clock(dut.wr_clk, 20, "ns", "wr_clk").start())
+    cov = PhaseCoverage(dut.wr_clk, dut.rd_clk)   # which wr_clk phases rd_clk edges hit
+"""
+
+import os
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, Timer
+from cocotb.utils import get_sim_steps, get_sim_time
+
+ENV_PREFIX = "CDC_"
+
+
+class ClockStress:
+    """Stress settings shared by the clocks of one testbench"""
+
+    def __init__(self, enabled=False, seed=None, spread=0.25, jitter=0.05, drift=0.10, phase=True,
+                 words=2000, idle=0.3):
+        self.enabled = enabled
+        self.seed = seed if seed is not None else getattr(cocotb, "RANDOM_SEED", None) or random.randrange(2**31)
+        self.spread = spread
+        self.jitter = jitter
+        self.drift = drift
+        self.phase = phase
+        self.words = words  # soak test length
+        self.idle = idle    # soak test idle probability
+
+    @classmethod
+    def from_env(cls, prefix=ENV_PREFIX):
+        def get(name, default):
+            return os.environ.get(prefix + name, default)
+
+        seed = get("SEED", None)
+        return cls(enabled=str(get("STRESS", "0")).strip() not in ("", "0"),
+                   seed=int(seed) if seed not in (None, "") else None,
+                   spread=float(get("SPREAD", 0.25)),
+                   jitter=float(get("JITTER", 0.05)),
+                   drift=float(get("DRIFT", 0.10)),
+                   phase=str(get("PHASE", "1")).strip() not in ("", "0"),
+                   words=int(get("WORDS", 2000)),
+                   idle=float(get("IDLE", 0.3)))
+
+    def rng(self, name):
+        """Reproducible per-clock random stream"""
+        return random.Random(f"{self.seed}:{name}")
+
+    def clock(self, signal, period, units="ns", name=None):
+        """StressClock when enabled, plain cocotb Clock otherwise"""
+        if not self.enabled:
+            return Clock(signal, period, units=units)
+        return StressClock(signal, period, units, spread=self.spread, jitter=self.jitter, drift=self.drift,
+                           phase=self.phase, rng=self.rng(name or signal._name))
+
+    def __str__(self):
+        if not self.enabled:
+            return "CDC stress off"
+        return (f"CDC stress seed={self.seed} spread={self.spread} jitter={self.jitter} "
+                f"drift={self.drift} phase={int(self.phase)}")
+
+
+class StressClock:
+    """Clock with randomized period and phase, per-cycle jitter and bounded drift"""
+
+    def __init__(self, signal, period, units="ns", spread=0.0, jitter=0.0, drift=0.0, phase=False, rng=None):
+        self.signal = signal
+        self.rng = rng or random.Random()
+        self.nominal = get_sim_steps(period, units)
+        self.period = max(2, round(self.nominal * (1 + self.rng.uniform(-spread, spread))))
+        self.jitter = max(0, round(self.period * jitter))
+        self.drift = max(0, round(self.period * drift))
+        self.drift_step = max(1, self.drift // 32) if self.drift else 0
+        self.phase = self.rng.randrange(self.period) if phase else 0
+        self.min_cycle = None
+        self.max_cycle = None
+        self.cycles = 0
+
+    def __repr__(self):
+        return (f"StressClock(period={self.period} steps, jitter={self.jitter}, drift={self.drift}, "
+                f"phase={self.phase})")
+
+    async def start(self):
+        rng = self.rng
+        offset = 0  # drift of the period from self.period
+        skew = 0  # jitter of the previous rising edge
+        self.signal.value = 0
+        if self.phase:
+            await Timer(self.phase, "step")
+        while True:
+            if self.drift:
+                offset = max(-self.drift, min(self.drift, offset + rng.randint(-self.drift_step, self.drift_step)))
+            edge_skew = rng.randint(-self.jitter, self.jitter) if self.jitter else 0
+            cycle = max(2, self.period + offset + edge_skew - skew)
+            skew = edge_skew
+            self.cycles += 1
+            self.min_cycle = cycle if self.min_cycle is None else min(self.min_cycle, cycle)
+            self.max_cycle = cycle if self.max_cycle is None else max(self.max_cycle, cycle)
+            self.signal.value = 1
+            await Timer(cycle // 2, "step")
+            self.signal.value = 0
+            await Timer(cycle - cycle // 2, "step")
+
+
+class PhaseCoverage:
+    """Histogram of where the rising edges of clk_b fall within the period of clk_a"""
+
+    def __init__(self, clk_a, clk_b, bins=16):
+        self.clk_a = clk_a
+        self.clk_b = clk_b
+        self.bins = [0] * bins
+        self._last_a = None
+        self._period_a = None
+        self._tasks = []
+
+    def start(self):
+        self._tasks = [cocotb.start_soon(self._track_a()), cocotb.start_soon(self._sample_b())]
+        return self
+
+    def stop(self):
+        for task in self._tasks:
+            task.kill()
+        self._tasks = []
+
+    async def _track_a(self):
+        while True:
+            await RisingEdge(self.clk_a)
+            now = get_sim_time("step")
+            if self._last_a is not None:
+                self._period_a = now - self._last_a
+            self._last_a = now
+
+    async def _sample_b(self):
+        while True:
+            await RisingEdge(self.clk_b)
+            if not self._period_a:
+                continue
+            phase = (get_sim_time("step") - self._last_a) / self._period_a
+            self.bins[min(len(self.bins) - 1, int(phase * len(self.bins)))] += 1
+
+    @property
+    def covered(self):
+        """Fraction of phase bins hit at least once"""
+        return sum(1 for n in self.bins if n) / len(self.bins)
+
+    def __str__(self):
+        return f"{100 * self.covered:.0f}% of {len(self.bins)} phase bins hit {self.bins}"
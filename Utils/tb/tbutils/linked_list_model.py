@@ -0,0 +1,207 @@
+"""
+Linked List Reference Model
+Create Date: 18/10/2026
+
+Node-table model of singly_linked_list.sv / doubly_linked_list.sv. Like the RTL it
+keeps a table of nodes indexed by address, each with a next (and prev) pointer,
+and allocates new nodes at the lowest free address (find_next_ptr on valid_bits).
+
+Address lookups, inserts and deletes by address are O(1), allocation is O(log n)
+through a heap of free addresses. Prev pointers are kept for the singly linked
+list as well, they are just not part of what the DUT exposes. Index based
+operations walk the list like the hardware does, but sequential index access
+(read_n style loops) is O(1) per step through a cursor, so MAX_NODE in the
+thousands stays cheap.
+
+    model = LinkedListModel(MAX_NODE, doubly=True)
+    addr = model.insert_by_index(0, 0x12)
+    model.read_by_addr(addr), model.next_addr(addr), model.prev_addr(addr)
+"""
+
+import heapq
+
+
+class Node:
+    """One entry of the node table"""
+
+    __slots__ = ("value", "next", "prev")
+
+    def __init__(self, value, next_addr, prev_addr):
+        self.value = value
+        self.next = next_addr
+        self.prev = prev_addr
+
+
+class LinkedListModel:
+    """Address-indexed linked list with RTL-like address allocation"""
+
+    def __init__(self, max_node, doubly=False, addr_null=None):
+        self.max_node = int(max_node)
+        self.doubly = doubly  # DUT exposes prev pointers (pre_node_addr)
+        self.addr_null = self.max_node if addr_null is None else int(addr_null)
+        self.reset()
+
+    def reset(self):
+        self.nodes = {}  # addr -> Node
+        self.free = list(range(self.max_node))  # sorted, hence already a heap
+        self.head = self.addr_null
+        self.tail = self.addr_null
+        self._cursor = None  # (index, addr) of the last index lookup
+
+    # ------------------------------------------------------------------ status
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, addr):
+        return addr in self.nodes
+
+    def __iter__(self):
+        """Values from head to tail"""
+        for addr in self.addrs():
+            yield self.nodes[addr].value
+
+    @property
+    def full(self):
+        return len(self.nodes) >= self.max_node
+
+    @property
+    def empty(self):
+        return not self.nodes
+
+    def addrs(self):
+        """Addresses from head to tail"""
+        addr = self.head
+        while addr != self.addr_null:
+            yield addr
+            addr = self.nodes[addr].next
+
+    def values(self):
+        return list(self)
+
+    def find_next_addr(self):
+        """Address the next insert will use, addr_null when full"""
+        return self.free[0] if self.free else self.addr_null
+
+    # ----------------------------------------------------------------- lookup
+    def read_by_addr(self, addr):
+        return self.nodes[addr].value
+
+    def next_addr(self, addr):
+        return self.nodes[addr].next
+
+    def prev_addr(self, addr):
+        return self.nodes[addr].prev
+
+    def addr_at(self, index):
+        """Address of the node at index (negative counts from the tail)"""
+        length = len(self.nodes)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(index)
+        # Walk from the closest known point: head, tail or the cursor
+        starts = [(0, self.head), (length - 1, self.tail)]
+        if self._cursor is not None:
+            starts.append(self._cursor)
+        start_idx, addr = min(starts, key=lambda s: abs(index - s[0]))
+        while start_idx < index:
+            addr = self.nodes[addr].next
+            start_idx += 1
+        while start_idx > index:
+            addr = self.nodes[addr].prev
+            start_idx -= 1
+        self._cursor = (index, addr)
+        return addr
+
+    def value_at(self, index):
+        return self.nodes[self.addr_at(index)].value
+
+    def index_of_addr(self, addr):
+        for i, a in enumerate(self.addrs()):
+            if a == addr:
+                return i
+        raise ValueError(addr)
+
+    def index_of_value(self, value):
+        """Index of the first node holding value, None if absent"""
+        for i, a in enumerate(self.addrs()):
+            if self.nodes[a].value == value:
+                return i
+        return None
+
+    # ----------------------------------------------------------------- update
+    def _alloc(self, value):
+        addr = heapq.heappop(self.free)
+        self.nodes[addr] = Node(value, self.addr_null, self.addr_null)
+        self._cursor = None
+        return addr
+
+    def _link_before(self, new, before):
+        """Link node new in front of node before (addr_null = append at tail)"""
+        node = self.nodes[new]
+        if before == self.addr_null:
+            node.prev = self.tail
+            if self.tail != self.addr_null:
+                self.nodes[self.tail].next = new
+            else:
+                self.head = new
+            self.tail = new
+            return
+        prev = self.nodes[before].prev
+        node.next = before
+        node.prev = prev
+        self.nodes[before].prev = new
+        if prev != self.addr_null:
+            self.nodes[prev].next = new
+        else:
+            self.head = new
+
+    def insert_by_addr(self, addr, data):
+        """Insert in front of the node at addr, -1/addr_null appends; returns the new address"""
+        if self.full:
+            return None
+        before = self.addr_null if addr in (-1, self.addr_null) else addr
+        if before != self.addr_null and before not in self.nodes:
+            raise KeyError(addr)
+        new = self._alloc(data)
+        self._link_before(new, before)
+        return new
+
+    def insert_by_index(self, index, data):
+        """Insert so the new node ends up at index, -1 or index >= length appends"""
+        if self.full:
+            return None
+        before = self.addr_null if index == -1 or index >= len(self.nodes) else self.addr_at(index)
+        new = self._alloc(data)
+        self._link_before(new, before)
+        return new
+
+    def delete_by_addr(self, addr):
+        """Unlink and free the node at addr, returns its value"""
+        node = self.nodes.pop(addr)
+        prev = node.prev
+        if prev != self.addr_null:
+            self.nodes[prev].next = node.next
+        else:
+            self.head = node.next
+        if node.next != self.addr_null:
+            self.nodes[node.next].prev = prev
+        else:
+            self.tail = prev
+        heapq.heappush(self.free, addr)
+        self._cursor = None
+        return node.value
+
+    def remove(self, index):
+        """Delete the node at index (negative counts from the tail), returns its value"""
+        return self.delete_by_addr(self.addr_at(index))
+
+    def delete_by_value(self, data):
+        """Delete the first node holding data, returns its index or None"""
+        index = self.index_of_value(data)
+        if index is not None:
+            self.remove(index)
+        return index
+
+    def __repr__(self):
+        return f"value = {self.values()}, addr = {list(self.addrs())}"
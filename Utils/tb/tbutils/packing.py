@@ -0,0 +1,131 @@
+"""
+Packed Bus Lanes
+Create Date: 18/10/2026
+
+Pack and unpack lane arrays to and from the flat buses the DUTs use for parallel
+data, e.g. act_data[ARRAY_ROWS*DATA_WIDTH-1:0] or data_wr[INPUT_RATE*DATA_WIDTH-1:0].
+Lane 0 sits in the least significant bits.
+
+A LanePacker holds the masks and shifts for one (width, lanes, signed) config and
+lane_packer() caches one per config. Byte aligned widths (8/16/32/64) go through
+array.array and int.from_bytes/to_bytes, so a whole bus is converted in C. Other
+widths use the precomputed shifts, or a single binary string once the bus is wide
+enough (STRING_BUS_WIDTH) for per-lane big-int shifts to turn quadratic.
+
+    from tbutils.packing import lane_packer
+    acts = lane_packer(DATA_WIDTH, ARRAY_ROWS, signed=True)
+    dut.act_data.value = acts.pack(column)
+    row = acts.unpack(dut.act_data.value)
+"""
+
+import sys
+from array import array
+from functools import lru_cache
+
+STRING_BUS_WIDTH = 8192  # bits, measured crossover of shift vs binary string packing
+
+# array typecodes by lane width in bytes, (unsigned, signed)
+_TYPECODES = {}
+for _u, _s in (("B", "b"), ("H", "h"), ("I", "i"), ("L", "l"), ("Q", "q")):
+    _TYPECODES.setdefault(array(_u).itemsize, (_u, _s))
+
+
+class LanePacker:
+    """Masks and shifts of one lane config, pack()/unpack() the whole bus at once"""
+
+    def __init__(self, width, lanes, signed=False):
+        self.width = int(width)
+        self.lanes = int(lanes)
+        self.signed = signed
+        self.mask = (1 << self.width) - 1
+        self.sign_bit = 1 << (self.width - 1)
+        self.shifts = [lane * self.width for lane in range(self.lanes)]
+        self.bus_width = self.width * self.lanes
+        self.bus_mask = (1 << self.bus_width) - 1
+        self.nbytes = (self.bus_width + 7) // 8
+        typecodes = _TYPECODES.get(self.width // 8) if self.width % 8 == 0 else None
+        self._typecode = typecodes[1 if signed else 0] if typecodes else None
+        self._utypecode = typecodes[0] if typecodes else None
+        self._binfmt = f"0{self.width}b"
+
+    def __repr__(self):
+        return f"LanePacker(width={self.width}, lanes={self.lanes}, signed={self.signed})"
+
+    def _check(self, values):
+        if len(values) > self.lanes:
+            raise ValueError(f"{len(values)} values for a {self.lanes} lane bus")
+
+    # ------------------------------------------------------------------- int
+    def pack(self, values):
+        """Lane values (lane 0 first, negative allowed) to the bus integer"""
+        values = list(values)
+        self._check(values)
+        mask = self.mask
+        if self._utypecode:
+            data = array(self._utypecode, [int(v) & mask for v in values])
+            if sys.byteorder != "little":
+                data.byteswap()
+            return int.from_bytes(data.tobytes(), "little")
+        if self.bus_width < STRING_BUS_WIDTH:
+            width = self.width
+            word = 0
+            for v in reversed(values):
+                word = (word << width) | (int(v) & mask)
+            return word
+        if not values:
+            return 0
+        fmt = self._binfmt
+        return int("".join([format(int(v) & mask, fmt) for v in reversed(values)]), 2)
+
+    def unpack(self, word):
+        """Bus integer (or simulator value) to the list of lanes, lane 0 first"""
+        word = int(word) & self.bus_mask
+        if self._typecode:
+            data = array(self._typecode)
+            data.frombytes(word.to_bytes(self.nbytes, "little"))
+            if sys.byteorder != "little":
+                data.byteswap()
+            return data.tolist()
+        width, mask = self.width, self.mask
+        if self.bus_width < STRING_BUS_WIDTH:
+            lanes = [(word >> shift) & mask for shift in self.shifts]
+        else:
+            bits = format(word, f"0{self.bus_width}b")
+            lanes = [int(bits[pos - width:pos], 2) for pos in range(self.bus_width, 0, -width)]
+        if self.signed:
+            sign_bit, span = self.sign_bit, 1 << width
+            lanes = [v - span if v & sign_bit else v for v in lanes]
+        return lanes
+
+    def lane(self, word, index):
+        """Single lane of a bus integer"""
+        value = (int(word) >> self.shifts[index]) & self.mask
+        if self.signed and value & self.sign_bit:
+            value -= 1 << self.width
+        return value
+
+    # ----------------------------------------------------------------- bytes
+    def to_bytes(self, values):
+        """Lane values to little endian bus bytes"""
+        return self.pack(values).to_bytes(self.nbytes, "little")
+
+    def from_bytes(self, data):
+        """Little endian bus bytes to the list of lanes"""
+        return self.unpack(int.from_bytes(data, "little"))
+
+
+@lru_cache(maxsize=None)
+def lane_packer(width, lanes, signed=False):
+    """Shared LanePacker for a lane config"""
+    return LanePacker(int(width), int(lanes), bool(signed))
+
+
+def pack(values, width, signed=False):
+    """One-off pack of len(values) lanes"""
+    values = list(values)
+    return lane_packer(width, len(values), signed).pack(values)
+
+
+def unpack(word, width, lanes, signed=False):
+    """One-off unpack of lanes from a bus integer"""
+    return lane_packer(width, lanes, signed).unpack(word)
@@ -0,0 +1,280 @@
+"""
+Parallel Regression Runner
+Create Date: 18/10/2026
+
+Discovers every <module>/tb/cocotb testbench and runs them concurrently. Each job
+gets its own sim_build directory, log and results file, and the per-job cocotb
+results are merged into a single JUnit XML and JSON report.
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+STATUS_PASS = "pass"
+STATUS_FAIL = "fail"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+
+# Printed by Utils/tb/cocotb/sim_cache.mk: "sim_cache: hit|current|miss <key>"
+CACHE_RE = re.compile(r"^sim_cache: (\w+)", re.M)
+
+
+class RegressionJob:
+    """One make invocation of a cocotb testbench"""
+
+    def __init__(self, name, tb_dir, make_args=None, seed=None):
+        self.name = name
+        self.tb_dir = tb_dir
+        self.make_args = dict(make_args or {})
+        self.seed = seed
+
+    def __repr__(self):
+        return f"RegressionJob({self.name}, seed={self.seed})"
+
+
+class JobResult:
+    """Outcome of a regression job"""
+
+    def __init__(self, job, work_dir):
+        self.job = job
+        self.work_dir = work_dir
+        self.status = STATUS_ERROR
+        self.returncode = None
+        self.wall_time = 0.0
+        self.tests = []  # [{"name", "status", "time", "sim_time_ns", "message"}]
+        self.cache = None  # compile cache outcome, None when the cache is off
+        self.log_path = os.path.join(work_dir, "run.log")
+        self.results_path = os.path.join(work_dir, "results.xml")
+
+    @property
+    def failed(self):
+        return self.status != STATUS_PASS
+
+    def to_dict(self):
+        return {
+            "name": self.job.name,
+            "tb_dir": self.job.tb_dir,
+            "seed": self.job.seed,
+            "make_args": self.job.make_args,
+            "status": self.status,
+            "returncode": self.returncode,
+            "wall_time": round(self.wall_time, 3),
+            "cache": self.cache,
+            "log": self.log_path,
+            "tests": self.tests,
+        }
+
+
+def discover_jobs(root=REPO_ROOT, modules=None):
+    """Find every <module>/tb/cocotb/tb.py below root, optionally filtered by module name"""
+    jobs = []
+    for tb_file in sorted(glob.glob(os.path.join(root, "*", "tb", "cocotb", "tb.py"))):
+        tb_dir = os.path.dirname(tb_file)
+        name = os.path.basename(os.path.dirname(os.path.dirname(tb_dir)))
+        if modules and name not in modules:
+            continue
+        jobs.append(RegressionJob(name, tb_dir))
+    return jobs
+
+
+def parse_cocotb_results(path):
+    """Parse a cocotb results.xml into a list of test dicts"""
+    tests = []
+    for testcase in ET.parse(path).getroot().iter("testcase"):
+        status = STATUS_PASS
+        message = ""
+        for tag, tag_status in (("failure", STATUS_FAIL), ("error", STATUS_ERROR), ("skipped", "skipped")):
+            node = testcase.find(tag)
+            if node is not None:
+                status = tag_status
+                message = node.get("message", "")
+                break
+        tests.append({
+            "name": testcase.get("name"),
+            "status": status,
+            "time": float(testcase.get("time", 0.0)),
+            "sim_time_ns": float(testcase.get("sim_time_ns", 0.0)),
+            "message": message,
+        })
+    return tests
+
+
+def build_make_command(job, work_dir, sim):
+    """Make command line for a job; SIM_BUILD and results file live in work_dir"""
+    cmd = [
+        "make", "-C", job.tb_dir,
+        f"SIM={sim}",
+        f"SIM_BUILD={os.path.join(work_dir, 'sim_build')}",
+        f"COCOTB_RESULTS_FILE={os.path.join(work_dir, 'results.xml')}",
+    ]
+    cmd += [f"{key}={value}" for key, value in job.make_args.items()]
+    return cmd
+
+
+def run_job(job, out_dir, sim="icarus", timeout=None):
+    """Run a single job to completion and collect its result"""
+    work_dir = os.path.join(out_dir, job.name)
+    os.makedirs(work_dir, exist_ok=True)
+    result = JobResult(job, work_dir)
+    if os.path.exists(result.results_path):
+        os.remove(result.results_path)
+
+    env = os.environ.copy()
+    env["RANDOM_SEED"] = str(job.seed)
+    env["COCOTB_RESULTS_FILE"] = result.results_path
+
+    start = time.monotonic()
+    with open(result.log_path, "w") as log:
+        try:
+            proc = subprocess.run(build_make_command(job, work_dir, sim), stdout=log,
+                                  stderr=subprocess.STDOUT, env=env, timeout=timeout)
+            result.returncode = proc.returncode
+        except subprocess.TimeoutExpired:
+            result.status = STATUS_TIMEOUT
+    result.wall_time = time.monotonic() - start
+    with open(result.log_path, errors="replace") as log:
+        match = CACHE_RE.search(log.read())
+    result.cache = match.group(1) if match else None
+
+    if result.status == STATUS_TIMEOUT:
+        return result
+    if os.path.exists(result.results_path):
+        result.tests = parse_cocotb_results(result.results_path)
+    if result.returncode == 0 and result.tests:
+        failed = [t for t in result.tests if t["status"] in (STATUS_FAIL, STATUS_ERROR)]
+        result.status = STATUS_FAIL if failed else STATUS_PASS
+    else:
+        result.status = STATUS_ERROR
+    return result
+
+
+def run_regression(jobs, out_dir, workers=None, sim="icarus", seed=None, timeout=None, log=print):
+    """Run jobs across a pool of workers, one simulator process per job"""
+    workers = workers or os.cpu_count() or 1
+    for job in jobs:
+        if job.seed is None:
+            job.seed = seed if seed is not None else random.randrange(1, 2**31)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_job, job, out_dir, sim, timeout): job for job in jobs}
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            log(f"[{result.status.upper():7}] {result.job.name:<24} seed={result.job.seed:<10} "
+                f"{result.wall_time:8.1f}s  {result.log_path}")
+    results.sort(key=lambda r: r.job.name)
+    return results
+
+
+def write_json(results, path):
+    """Write a JSON report of all job results"""
+    report = {
+        "total": len(results),
+        "passed": sum(not r.failed for r in results),
+        "failed": sum(r.failed for r in results),
+        "wall_time": round(sum(r.wall_time for r in results), 3),
+        "jobs": [r.to_dict() for r in results],
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def write_junit(results, path):
+    """Write a JUnit XML report with one testsuite per job"""
+    suites = ET.Element("testsuites", name="rtlstructlib_regression")
+    for r in results:
+        suite = ET.SubElement(suites, "testsuite", name=r.job.name, time=f"{r.wall_time:.3f}",
+                              tests=str(max(len(r.tests), 1)))
+        props = ET.SubElement(suite, "properties")
+        ET.SubElement(props, "property", name="random_seed", value=str(r.job.seed))
+        for key, value in r.job.make_args.items():
+            ET.SubElement(props, "property", name=key, value=str(value))
+        if not r.tests:
+            case = ET.SubElement(suite, "testcase", classname=r.job.name, name="run", time=f"{r.wall_time:.3f}")
+            ET.SubElement(case, "error", message=f"{r.status}: no cocotb results, see {r.log_path}")
+            continue
+        for t in r.tests:
+            case = ET.SubElement(suite, "testcase", classname=r.job.name, name=t["name"], time=f"{t['time']:.3f}")
+            if t["status"] in (STATUS_FAIL, STATUS_ERROR):
+                ET.SubElement(case, "failure" if t["status"] == STATUS_FAIL else "error", message=t["message"])
+            elif t["status"] == "skipped":
+                ET.SubElement(case, "skipped")
+    ET.ElementTree(suites).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def cache_make_args(no_cache=False, cache_dir=None):
+    """Make variables selecting the compile cache of Utils/tb/cocotb/sim_cache.mk"""
+    if no_cache:
+        return {"SIM_CACHE": "0"}
+    return {"SIM_CACHE_DIR": os.path.abspath(cache_dir)} if cache_dir else {}
+
+
+def cache_summary(results):
+    """e.g. "7 compiles reused, 2 compiled" """
+    reused = sum(r.cache in ("hit", "current") for r in results)
+    compiled = sum(r.cache == "miss" for r in results)
+    return f"{reused} compiles reused, {compiled} compiled"
+
+
+def parse_defines(defines):
+    """Turn ["NAME=VALUE", ...] into a dict"""
+    make_args = {}
+    for define in defines or []:
+        key, _, value = define.partition("=")
+        make_args[key] = value
+    return make_args
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run every cocotb testbench in parallel")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="parallel jobs (default: all cores)")
+    parser.add_argument("-m", "--modules", nargs="*", help="module folders to run (default: all)")
+    parser.add_argument("-D", "--define", action="append", help="extra make variable NAME=VALUE for every job")
+    parser.add_argument("--sim", default="icarus", help="cocotb SIM (default: icarus)")
+    parser.add_argument("--seed", type=int, help="RANDOM_SEED for every job (default: random per job)")
+    parser.add_argument("--timeout", type=float, help="per-job timeout in seconds")
+    parser.add_argument("--cache-dir", help="compile cache directory (default: ~/.cache/rtlstructlib/sim_cache)")
+    parser.add_argument("--no-cache", action="store_true", help="always recompile")
+    parser.add_argument("--log-summary", action="store_true",
+                        help="per-job logs keep only the ops counters (TB_LOG_SUMMARY=1)")
+    parser.add_argument("--root", default=REPO_ROOT, help="repository root")
+    parser.add_argument("--out", default="regression_out", help="output directory")
+    args = parser.parse_args(argv)
+
+    jobs = discover_jobs(args.root, args.modules)
+    if not jobs:
+        print("No testbench found")
+        return 1
+    make_args = cache_make_args(args.no_cache, args.cache_dir)
+    if args.log_summary:
+        make_args["TB_LOG_SUMMARY"] = "1"
+    make_args.update(parse_defines(args.define))
+    for job in jobs:
+        job.make_args.update(make_args)
+
+    out_dir = os.path.abspath(args.out)
+    os.makedirs(out_dir, exist_ok=True)
+    print(f"Running {len(jobs)} jobs on {args.jobs} workers, output in {out_dir}")
+    results = run_regression(jobs, out_dir, workers=args.jobs, sim=args.sim, seed=args.seed, timeout=args.timeout)
+    write_json(results, os.path.join(out_dir, "regression.json"))
+    write_junit(results, os.path.join(out_dir, "regression.xml"))
+
+    failed = [r for r in results if r.failed]
+    print(f"{len(results) - len(failed)}/{len(results)} jobs passed, {cache_summary(results)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+Content-Addressed Simulation Compile Cache
+Create Date: 18/10/2026
+
+Caches compiled simulation images (icarus sim.vvp, verilator Vtop) under a key
+made from the content of every VERILOG_SOURCES file (the RTL from rtl_list.f /
+rtl_src.f / rtl_file.f plus the generated iverilog_dump.v), COMPILE_ARGS, the
+top level, the simulator version and the cocotb version.
+
+Used by Utils/tb/cocotb/sim_cache.mk at make parse time:
+    restore  - put the cached image into SIM_BUILD (or drop a stale one)
+    store    - save a freshly compiled image into the cache
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "rtlstructlib", "sim_cache")
+KEY_FILE = "sim_cache.key"
+
+# Files making up a compiled image, ordered from oldest to newest prerequisite
+IMAGE_FILES = {
+    "icarus": ["cmds.f", "sim.vvp"],
+    "verilator": ["Vtop.mk", "Vtop"],
+}
+
+VERSION_COMMANDS = {
+    "icarus": ["iverilog", "-V"],
+    "verilator": ["verilator", "--version"],
+}
+
+
+def tool_version(cmd):
+    """First output line of a version command, empty if the tool is missing"""
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    lines = proc.stdout.strip().splitlines()
+    return lines[0] if lines else ""
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def read_filelist(path):
+    """Source paths of an rtl_list.f style file list, relative to the list's folder"""
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path) as f:
+        names = [line.strip() for line in f if line.strip() and not line.strip().startswith("//")]
+    return [os.path.join(base, name) for name in names]
+
+
+def compute_key(sim, sources, compile_args="", toplevel="", sim_version=None, cocotb_version=None):
+    """Cache key of a build; source paths do not matter, only their content and order"""
+    if sim_version is None:
+        sim_version = tool_version(VERSION_COMMANDS.get(sim, [sim, "--version"]))
+    if cocotb_version is None:
+        cocotb_version = tool_version(["cocotb-config", "--version"])
+    h = hashlib.sha256()
+    for field in (sim, sim_version, cocotb_version, toplevel.strip(), " ".join(compile_args.split())):
+        h.update(field.encode())
+        h.update(b"\0")
+    for src in sources:
+        h.update(os.path.basename(src).encode())
+        h.update(file_digest(src).encode())
+    return h.hexdigest()
+
+
+class SimCache:
+    """Directory of cached images, one <key[:2]>/<key>/ folder per build"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def entry(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def has(self, key, files):
+        return all(os.path.exists(os.path.join(self.entry(key), f)) for f in files)
+
+    def restore(self, key, build_dir, files):
+        """Copy an image into build_dir"""
+        os.makedirs(build_dir, exist_ok=True)
+        for name in files:
+            shutil.copy2(os.path.join(self.entry(key), name), os.path.join(build_dir, name))
+
+    def store(self, key, build_dir, files):
+        """Atomically publish an image; concurrent stores of one key keep the first"""
+        if self.has(key, files):
+            return False
+        os.makedirs(os.path.dirname(self.entry(key)), exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=f".{key[:8]}-", dir=os.path.dirname(self.entry(key)))
+        for name in files:
+            shutil.copy2(os.path.join(build_dir, name), os.path.join(tmp, name))
+        try:
+            os.rename(tmp, self.entry(key))
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            return False
+        return True
+
+    def clean(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+def _read_key(build_dir):
+    try:
+        with open(os.path.join(build_dir, KEY_FILE)) as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _write_key(build_dir, key):
+    with open(os.path.join(build_dir, KEY_FILE), "w") as f:
+        f.write(key + "\n")
+
+
+def _touch_in_order(build_dir, files):
+    """Newest mtime on the last file so make sees every prerequisite as up to date"""
+    now = time.time()
+    for i, name in enumerate(files):
+        stamp = now - (len(files) - 1 - i)
+        os.utime(os.path.join(build_dir, name), (stamp, stamp))
+
+
+def restore_build(cache, sim, build_dir, key):
+    """Make build_dir hold the image for key if possible; returns "hit", "current" or "miss" """
+    files = IMAGE_FILES.get(sim)
+    if files is None:
+        return "miss"
+    present = [f for f in files if os.path.exists(os.path.join(build_dir, f))]
+    if _read_key(build_dir) == key and len(present) == len(files):
+        # Same content as last build, only mtimes are stale (e.g. regenerated iverilog_dump.v)
+        _touch_in_order(build_dir, files)
+        return "current"
+    if cache.has(key, files):
+        cache.restore(key, build_dir, files)
+        _touch_in_order(build_dir, files)
+        _write_key(build_dir, key)
+        return "hit"
+    # Image built from other content (e.g. other parameters): force a rebuild
+    for name in present:
+        os.remove(os.path.join(build_dir, name))
+    if os.path.exists(os.path.join(build_dir, KEY_FILE)):
+        os.remove(os.path.join(build_dir, KEY_FILE))
+    return "miss"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Content-addressed cache for compiled simulation images")
+    parser.add_argument("action", choices=["key", "restore", "store", "clean"])
+    parser.add_argument("sources", nargs="*", help="VERILOG_SOURCES in compile order")
+    parser.add_argument("--dir", default=DEFAULT_CACHE_DIR, help="cache directory")
+    parser.add_argument("--sim", default="icarus")
+    parser.add_argument("--build", default="sim_build", help="SIM_BUILD directory")
+    parser.add_argument("--args", default="", help="COMPILE_ARGS")
+    parser.add_argument("--top", default="", help="TOPLEVEL")
+    parser.add_argument("-f", "--filelist", action="append", help="rtl_list.f style file list to add to sources")
+    parser.add_argument("--key", help="key to store under (default: recompute)")
+    args = parser.parse_intermixed_args(argv)
+
+    cache = SimCache(args.dir)
+    if args.action == "clean":
+        cache.clean()
+        return 0
+
+    sources = list(args.sources)
+    for filelist in args.filelist or []:
+        sources += read_filelist(filelist)
+    key = args.key or compute_key(args.sim, sources, args.args, args.top)
+
+    if args.action == "key":
+        print(key)
+    elif args.action == "restore":
+        status = restore_build(cache, args.sim, args.build, key)
+        print(key)
+        print(f"sim_cache: {status} {key[:12]}", file=sys.stderr)
+    elif args.action == "store":
+        files = IMAGE_FILES.get(args.sim, [])
+        if files and all(os.path.exists(os.path.join(args.build, f)) for f in files):
+            cache.store(key, args.build, files)
+            _write_key(args.build, key)
+    return 0
@@ -0,0 +1,124 @@
+"""
+Simulator Speed Comparison
+Create Date: 18/10/2026
+
+Runs the same testbenches with the same seeds and parameter overrides on several
+simulators (icarus and verilator by default) and compares them side by side. Every
+run goes through the regression runner, so results land in <out>/<sim>/<job>/ and
+use the compile cache; the comparison splits the wall time of each run into build
+(compile, or the cache restore) and test time from the cocotb results:
+
+    module                 sim         status   build_s   test_s   sim_us/s  speedup
+    Hash_Table             icarus      pass        1.2     84.0      120.4     1.00
+    Hash_Table             verilator   pass       21.7      6.1     1658.0    13.77
+
+speedup is the test time of the first simulator over the test time of this one.
+--vip adds the vip/pyuvm flows, listed as <module>/pyuvm. Runs go one at a time
+by default, so the times are not skewed by parallel jobs.
+"""
+
+import argparse
+import glob
+import json
+import os
+
+from .regression import (REPO_ROOT, RegressionJob, cache_make_args, discover_jobs, parse_defines,
+                         run_regression)
+
+DEFAULT_SIMS = ("icarus", "verilator")
+
+
+def discover_vip_jobs(root=REPO_ROOT, modules=None):
+    """Every <module>/vip/pyuvm/Makefile below root, named <module>/pyuvm"""
+    jobs = []
+    for makefile in sorted(glob.glob(os.path.join(root, "*", "vip", "pyuvm", "Makefile"))):
+        vip_dir = os.path.dirname(makefile)
+        module = os.path.basename(os.path.dirname(os.path.dirname(vip_dir)))
+        if modules and module not in modules:
+            continue
+        jobs.append(RegressionJob(os.path.join(module, "pyuvm"), vip_dir))
+    return jobs
+
+
+def speed_row(result, sim):
+    """Timing summary of one run"""
+    test_time = sum(t["time"] for t in result.tests)
+    sim_ns = sum(t["sim_time_ns"] for t in result.tests)
+    return {
+        "name": result.job.name,
+        "sim": sim,
+        "status": result.status,
+        "cache": result.cache,
+        "wall_s": round(result.wall_time, 3),
+        "build_s": round(max(0.0, result.wall_time - test_time), 3),
+        "test_s": round(test_time, 3),
+        "sim_time_ns": sim_ns,
+        "sim_us_per_s": round(sim_ns / 1000 / test_time, 3) if test_time else None,
+    }
+
+
+def compare(rows, sims):
+    """Add the speedup of every row over the first simulator of its job"""
+    base = {row["name"]: row for row in rows if row["sim"] == sims[0]}
+    for row in rows:
+        ref = base.get(row["name"])
+        ok = ref and ref["status"] == "pass" and row["status"] == "pass" and row["test_s"]
+        row["speedup"] = round(ref["test_s"] / row["test_s"], 2) if ok else None
+    return rows
+
+
+def format_table(rows):
+    lines = [f"{'module':<28} {'sim':<11} {'status':<8} {'build_s':>8} {'test_s':>8} {'sim_us/s':>10} {'speedup':>8}"]
+    for row in rows:
+        rate = "-" if row["sim_us_per_s"] is None else f"{row['sim_us_per_s']:.1f}"
+        speedup = "-" if row["speedup"] is None else f"{row['speedup']:.2f}"
+        lines.append(f"{row['name']:<28} {row['sim']:<11} {row['status']:<8} {row['build_s']:>8.1f} "
+                     f"{row['test_s']:>8.1f} {rate:>10} {speedup:>8}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the simulation speed of the testbenches across simulators")
+    parser.add_argument("-m", "--modules", nargs="*", help="module folders to run (default: all)")
+    parser.add_argument("-s", "--sims", nargs="+", default=list(DEFAULT_SIMS),
+                        help="simulators, the first is the speedup baseline (default: icarus verilator)")
+    parser.add_argument("-D", "--define", action="append",
+                        help="extra make variable NAME=VALUE for every run, e.g. a large config or TESTCASE")
+    parser.add_argument("--vip", action="store_true", help="also run the vip/pyuvm flows")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="parallel jobs (default: 1, undisturbed timing)")
+    parser.add_argument("--seed", type=int, help="RANDOM_SEED for every run (default: random per job, same on every sim)")
+    parser.add_argument("--timeout", type=float, help="per-run timeout in seconds")
+    parser.add_argument("--cache-dir", help="compile cache directory (default: ~/.cache/rtlstructlib/sim_cache)")
+    parser.add_argument("--no-cache", action="store_true", help="always recompile, build_s is then the compile time")
+    parser.add_argument("--root", default=REPO_ROOT, help="repository root")
+    parser.add_argument("--out", default="simspeed_out", help="output directory")
+    args = parser.parse_args(argv)
+
+    jobs = discover_jobs(args.root, args.modules)
+    if args.vip:
+        jobs += discover_vip_jobs(args.root, args.modules)
+    if not jobs:
+        print("No testbench found")
+        return 1
+    make_args = cache_make_args(args.no_cache, args.cache_dir)
+    make_args.update(parse_defines(args.define))
+    for job in jobs:
+        job.make_args.update(make_args)
+
+    out_dir = os.path.abspath(args.out)
+    rows = []
+    for sim in args.sims:
+        print(f"Running {len(jobs)} jobs on {sim}, output in {os.path.join(out_dir, sim)}")
+        # the first pass fixes the seeds, every simulator reruns the same ones
+        results = run_regression(jobs, os.path.join(out_dir, sim), workers=args.jobs, sim=sim, seed=args.seed,
+                                 timeout=args.timeout)
+        rows += [speed_row(r, sim) for r in results]
+    rows.sort(key=lambda row: (row["name"], args.sims.index(row["sim"])))
+    compare(rows, args.sims)
+
+    for line in format_table(rows):
+        print(line)
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "simspeed.json"), "w") as f:
+        json.dump({"sims": args.sims, "make_args": make_args, "runs": rows}, f, indent=2)
+    return 1 if any(row["status"] != "pass" for row in rows) else 0
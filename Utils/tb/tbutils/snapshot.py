@@ -0,0 +1,82 @@
+"""
+Signal Snapshot
+Create Date: 18/10/2026
+
+Per-edge sampling for monitors. A monitor declares once which signals it samples
+and which qualifier gates a transfer; the handles are resolved up front and every
+edge returns all values together as one record:
+
+    wr = Snapshot(dut, ("wr_en", "rst", "data_wr", "fifo_full"), dut.wr_clk, qualifier="wr_en")
+    s = await wr.next()        # next rising edge with wr_en high
+    if not s.rst:
+        item.data = s.data_wr
+
+next() does not wake up on idle cycles: while the qualifier is low it waits for
+the qualifier itself to change, then for the clock edge that samples it, so a long
+soak with sparse traffic costs simulator callbacks and value reads only for the
+cycles that carry a transfer. edge() samples at the very next edge regardless of
+the qualifier, e.g. for read data arriving one cycle after the request.
+
+Values are read at the rising edge, i.e. the pre-edge values the DUT registered,
+like a plain "await RisingEdge(clk)" monitor. settle=True samples in the read-only
+phase of the edge instead. With several qualifiers any non-zero one is a transfer.
+"""
+
+from collections import namedtuple
+
+from cocotb.triggers import Edge, First, ReadOnly, RisingEdge
+
+
+def _active(handle):
+    value = handle.value
+    return value.is_resolvable and int(value) != 0
+
+
+class Snapshot:
+    """Fixed signal set of one monitor, sampled together at a clock edge"""
+
+    def __init__(self, dut, signals, clk, qualifier=None, settle=False, name="Snapshot"):
+        self.signals = tuple(signals)
+        self.handles = tuple(getattr(dut, s) for s in self.signals)
+        self.record = namedtuple(name, self.signals)
+        if qualifier is None:
+            qualifier = ()
+        elif isinstance(qualifier, str):
+            qualifier = (qualifier,)
+        self.qualifiers = tuple(getattr(dut, q) for q in qualifier)
+        self._changes = tuple(Edge(q) for q in self.qualifiers)
+        self._edge = RisingEdge(clk)
+        self._settle = ReadOnly() if settle else None
+        self.samples = 0
+
+    def sample(self):
+        """Record of the current values"""
+        self.samples += 1
+        return self.record._make([int(h.value) for h in self.handles])
+
+    def active(self):
+        """Any qualifier non-zero (always True without qualifier)"""
+        return not self.qualifiers or any(_active(q) for q in self.qualifiers)
+
+    async def _sync(self):
+        await self._edge
+        if self._settle is not None:
+            await self._settle
+
+    async def edge(self):
+        """Record of the next rising edge"""
+        await self._sync()
+        return self.sample()
+
+    async def next(self):
+        """Record of the next rising edge with the qualifier set, idle cycles are skipped"""
+        while True:
+            if not self.active():
+                if len(self._changes) == 1:
+                    await self._changes[0]
+                else:
+                    await First(*self._changes)
+                continue
+            await self._sync()
+            if self.active():
+                return self.sample()
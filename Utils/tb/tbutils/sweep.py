@@ -0,0 +1,123 @@
+"""
+Parameter Sweep Engine
+Create Date: 18/10/2026
+
+Expands a declarative DUT parameter grid into one regression job per point.
+The grid of a module lives next to its testbench in tb/cocotb/sweep.json:
+
+    {
+        "grid": {"DEPTH": [4, 12, 64], "ASYNC": [0, 1]},
+        "exclude": [{"DEPTH": 4, "ASYNC": 1}]
+    }
+
+Every point is passed to make as parameter overrides (make DEPTH=4 ASYNC=0)
+and gets its own SIM_BUILD, so points of the same module build and simulate
+concurrently without clobbering each other.
+"""
+
+import argparse
+import itertools
+import json
+import os
+
+from .regression import (REPO_ROOT, RegressionJob, cache_make_args, cache_summary, discover_jobs,
+                         parse_defines, run_regression, write_json, write_junit)
+
+GRID_FILE = "sweep.json"
+
+
+def load_grid(tb_dir):
+    """Load the sweep spec of a testbench directory, None if it has none"""
+    path = os.path.join(tb_dir, GRID_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def expand_grid(grid, exclude=None):
+    """Cartesian product of the grid, minus points matching any exclude rule"""
+    names = list(grid)
+    points = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        point = dict(zip(names, values))
+        if any(all(point.get(k) == v for k, v in rule.items()) for rule in exclude or []):
+            continue
+        points.append(point)
+    return points
+
+
+def point_name(module, point):
+    """Unique, filesystem safe job name of a sweep point e.g. FIFO/DEPTH-12_ASYNC-1"""
+    return os.path.join(module, "_".join(f"{k}-{v}" for k, v in point.items()))
+
+
+def parse_grid_overrides(overrides):
+    """Turn ["DEPTH=4,16", ...] into {"DEPTH": ["4", "16"]}"""
+    grid = {}
+    for override in overrides or []:
+        key, _, values = override.partition("=")
+        grid[key] = [v for v in values.split(",") if v != ""]
+    return grid
+
+
+def sweep_jobs(root=REPO_ROOT, modules=None, grid_overrides=None):
+    """One RegressionJob per grid point of every selected module"""
+    jobs = []
+    for tb_job in discover_jobs(root, modules):
+        spec = load_grid(tb_job.tb_dir) or {"grid": {}}
+        grid = dict(spec.get("grid", {}))
+        grid.update(grid_overrides or {})
+        if not grid:
+            continue
+        for point in expand_grid(grid, spec.get("exclude")):
+            make_args = {k: str(v) for k, v in point.items()}
+            jobs.append(RegressionJob(point_name(tb_job.name, point), tb_job.tb_dir, make_args))
+    return jobs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep DUT parameters of the cocotb testbenches in parallel")
+    parser.add_argument("-m", "--modules", nargs="*", help="module folders to sweep (default: all with a grid)")
+    parser.add_argument("-p", "--param", action="append",
+                        help="override/add a grid axis NAME=v1,v2,... (e.g. -p DEPTH=4,16,256)")
+    parser.add_argument("-D", "--define", action="append", help="extra make variable NAME=VALUE for every point")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="parallel jobs (default: all cores)")
+    parser.add_argument("--sim", default="icarus", help="cocotb SIM (default: icarus)")
+    parser.add_argument("--seed", type=int, help="RANDOM_SEED for every point (default: random per point)")
+    parser.add_argument("--timeout", type=float, help="per-point timeout in seconds")
+    parser.add_argument("--cache-dir", help="compile cache directory (default: ~/.cache/rtlstructlib/sim_cache)")
+    parser.add_argument("--no-cache", action="store_true", help="always recompile")
+    parser.add_argument("--log-summary", action="store_true",
+                        help="per-point logs keep only the ops counters (TB_LOG_SUMMARY=1)")
+    parser.add_argument("--list", action="store_true", help="print the sweep points and exit")
+    parser.add_argument("--root", default=REPO_ROOT, help="repository root")
+    parser.add_argument("--out", default="sweep_out", help="output directory")
+    args = parser.parse_args(argv)
+
+    jobs = sweep_jobs(args.root, args.modules, parse_grid_overrides(args.param))
+    if not jobs:
+        print(f"No sweep point found, add a {GRID_FILE} next to the testbench or use -p")
+        return 1
+    if args.list:
+        for job in jobs:
+            print(job.name)
+        return 0
+    make_args = cache_make_args(args.no_cache, args.cache_dir)
+    if args.log_summary:
+        make_args["TB_LOG_SUMMARY"] = "1"
+    make_args.update(parse_defines(args.define))
+    for job in jobs:
+        job.make_args.update(make_args)
+
+    out_dir = os.path.abspath(args.out)
+    os.makedirs(out_dir, exist_ok=True)
+    print(f"Sweeping {len(jobs)} points on {args.jobs} workers, output in {out_dir}")
+    results = run_regression(jobs, out_dir, workers=args.jobs, sim=args.sim, seed=args.seed, timeout=args.timeout)
+    write_json(results, os.path.join(out_dir, "sweep.json"))
+    write_junit(results, os.path.join(out_dir, "sweep.xml"))
+
+    failed = [r for r in results if r.failed]
+    print(f"{len(results) - len(failed)}/{len(results)} points passed, {cache_summary(results)}")
+    return 1 if failed else 0
+
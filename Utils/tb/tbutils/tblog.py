@@ -0,0 +1,143 @@
+"""
+Testbench Logging
+Create Date: 18/10/2026
+
+Level-gated logging for the per-transaction lines of the cocotb testbenches and
+pyUVM scoreboards. Long random runs spend most of their time formatting and
+writing one line per operation; these helpers keep that cost to a counter
+increment unless the line is actually printed.
+
+Every cocotb testbench and pyUVM scoreboard keeps one OpsLog for its per-transaction
+(per-pass) lines. A line is printed only when its logger is enabled for the level of
+the line and TB_LOG_SUMMARY is off; the op counters are kept either way and report()
+prints them at the end of the test.
+
+Settings come from the environment. make passes command line variables on to the
+simulation, so "make TB_LOG_SUMMARY=1" works as well:
+
+    TB_LOG_LEVEL=WARNING                  level of every testbench component (default: unchanged,
+                                          i.e. COCOTB_LOG_LEVEL)
+    TB_LOG_LEVELS=scoreboard=DEBUG,fifo=WARNING
+                                          per component level, the key matches the component
+                                          name or the last parts of the logger name
+    TB_LOG_SUMMARY=1                      drop per-transaction lines, print counters at the end
+
+    ops = OpsLog(dut._log, "fifo")
+    ops.info("write", "Data written = %d, FIFO entry = %d", data, len(model))   # counted, maybe printed
+    ops.info("check", "Checking: %s", lazy(item.convert2string))                # string built only if printed
+    ops.line("Data read : %d at Index %d", data, i)                             # detail line, not counted
+    ops.report()                                                                # "fifo ops: write=12 read=12"
+"""
+
+import logging
+import os
+
+ENV_LEVEL = "TB_LOG_LEVEL"
+ENV_LEVELS = "TB_LOG_LEVELS"
+ENV_SUMMARY = "TB_LOG_SUMMARY"
+
+
+def parse_level(value, default=logging.INFO):
+    """Level name or number to a logging level"""
+    if value is None or str(value).strip() == "":
+        return default
+    value = str(value).strip()
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value.upper())
+    return level if isinstance(level, int) else default
+
+
+def parse_levels(spec):
+    """"name=LEVEL,name=LEVEL" to a {name: level} dict"""
+    levels = {}
+    for item in (spec or "").split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            levels[name.strip()] = parse_level(level)
+    return levels
+
+
+def summary_mode():
+    return os.environ.get(ENV_SUMMARY, "0").strip().lower() not in ("", "0", "false", "no")
+
+
+def component_level(name, component=None):
+    """Level configured for a logger name / component, TB_LOG_LEVEL if none matches, else None"""
+    levels = parse_levels(os.environ.get(ENV_LEVELS))
+    for key in (component, name):
+        if key in levels:
+            return levels[key]
+    for key, level in levels.items():
+        if name.endswith("." + key):
+            return level
+    return parse_level(os.environ.get(ENV_LEVEL), default=None)
+
+
+def configure(logger, component=None):
+    """Apply the configured level to an existing logger (cocotb dut._log, pyuvm self.logger)"""
+    level = component_level(logger.name, component)
+    if level is not None:
+        logger.setLevel(level)
+    return logger
+
+
+def get_logger(component, parent="cocotb.tb"):
+    """Configured logger for a testbench component, child of the cocotb logger"""
+    return configure(logging.getLogger(f"{parent}.{component}"), component)
+
+
+class Lazy:
+    """Deferred log argument, func(*args) is only called when the line is formatted"""
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self):
+        return str(self.func(*self.args))
+
+
+lazy = Lazy
+
+
+class OpsLog:
+    """Per-transaction log lines with counters; summary mode keeps only the counters"""
+
+    def __init__(self, logger, component=None):
+        self.component = component or logger.name
+        self.log = configure(logger, component)
+        self.summary = summary_mode()
+        self.counts = {}
+
+    def enabled(self, level=logging.INFO):
+        """True when a per-transaction line at level would be printed"""
+        return not self.summary and self.log.isEnabledFor(level)
+
+    def count(self, op, n=1):
+        self.counts[op] = self.counts.get(op, 0) + n
+
+    def info(self, op, msg, *args):
+        self.counts[op] = self.counts.get(op, 0) + 1
+        if not self.summary and self.log.isEnabledFor(logging.INFO):
+            self.log.info(msg, *args)
+
+    def line(self, msg, *args):
+        """Per-transaction detail line, printed like info() but not counted"""
+        if not self.summary and self.log.isEnabledFor(logging.INFO):
+            self.log.info(msg, *args)
+
+    def debug(self, op, msg, *args):
+        self.counts[op] = self.counts.get(op, 0) + 1
+        if not self.summary and self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(msg, *args)
+
+    def reset(self):
+        self.counts = {}
+
+    def report(self):
+        """Log the counters"""
+        if self.counts:
+            self.log.info("%s ops: %s", self.component, " ".join(f"{op}={n}" for op, n in self.counts.items()))
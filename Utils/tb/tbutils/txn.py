@@ -0,0 +1,252 @@
+"""
+Transaction Records
+Create Date: 18/10/2026
+
+Compact monitor transactions for the pyUVM VIPs. A uvm_sequence_item per monitored
+event registers a name and carries an instance dict; in long runs the monitor to
+scoreboard traffic is then mostly allocation and garbage collection. A Txn
+subclass declares the fields of one item as __slots__ with their defaults, and a
+TxnPool hands the same few records out again:
+
+    class FifoVipTxn(Txn):
+        __slots__ = ("op", "data", "read_data", "full", "empty", "success")
+        defaults = (FifoOp.WRITE, 0, 0, False, False, True)
+        item_type = FifoVipSeqItem
+        convert2string = FifoVipSeqItem.convert2string
+
+    pool = TxnPool(FifoVipTxn)
+    item = pool.acquire()           # fields back to the defaults
+    item.data = s.data_wr
+    self.ap.write(item)             # subscribers run synchronously
+    pool.release(item)              # the next acquire() returns it again
+
+A released record is reused, so a subscriber that keeps a transaction beyond its
+write() call stores copy() of it, or to_item() where a full uvm_sequence_item is
+needed (e.g. a sequence that replays observed traffic). Scoreboards that check the
+transaction in write() read the fields like those of the sequence item.
+
+BatchWriter optionally groups the records into blocks of TB_BATCH transactions
+(environment, "make TB_BATCH=64"; default 0 writes every record on its own). A block
+goes through the same analysis port as one TxnBatch, scoreboards hand it to their
+write_batch():
+
+    self.out = BatchWriter(self.ap, self.cfg.batch_size, self.pool)
+    self.out.write(item, flush=item.fault)   # a DUT error goes out at once with its block
+    self.out.flush()                         # extract_phase: end of test
+
+    def write(self, item):                   # scoreboard
+        if type(item) is TxnBatch:
+            return self.write_batch(item)
+
+Checks, error messages and WAVES_TRIGGER then happen when a block is delivered, up
+to TB_BATCH transactions after the DUT saw them; debug with TB_BATCH=0.
+
+Monitors feeding one scoreboard model through several ports (FIFO write and read
+side) fill their blocks independently. The scoreboard pushes them into a TxnMerge
+and attaches the writers to it; each record is then stamped with a shared sequence
+number, and the merge hands runs of records to the handler of their port in
+simulation order once no attached writer holds an older one:
+
+    self.merge = TxnMerge(self.write_wr_batch, self.write_rd_batch)   # scoreboard
+    self.merge.attach(wr_monitor.out, rd_monitor.out)                 # env connect_phase
+    return self.merge.push(0, item)                                   # write_wr(), TxnBatch
+
+A merged block stays with the merge until its last run is out, the merge gives its
+records back to the pool of the writer. A DUT error flushed at once can wait there
+for the older records still queued on the other port.
+"""
+
+import os
+from bisect import bisect_left
+from collections import deque
+
+ENV_BATCH = "TB_BATCH"
+
+
+def batch_size_from_env(default=0):
+    """Block size for BatchWriter from TB_BATCH, 0 or 1: no batching"""
+    value = os.environ.get(ENV_BATCH, "").strip()
+    return int(value) if value else default
+
+
+class Txn:
+    """Slotted transaction record, subclasses set __slots__, defaults and item_type"""
+
+    __slots__ = ()
+    defaults = ()
+    item_type = None
+
+    def __init__(self, *values):
+        for field, value in zip(self.__slots__, values or self.defaults):
+            setattr(self, field, value)
+
+    def reset(self):
+        """All fields back to the defaults"""
+        for field, value in zip(self.__slots__, self.defaults):
+            setattr(self, field, value)
+
+    def astuple(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def copy(self):
+        return type(self)(*self.astuple())
+
+    def to_item(self, name="txn"):
+        """Full uvm_sequence_item with the fields of this record"""
+        item = self.item_type(name)
+        for field in self.__slots__:
+            setattr(item, field, getattr(self, field))
+        return item
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other.astuple() == self.astuple()
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __str__(self):
+        convert = getattr(self, "convert2string", None)
+        return convert() if convert is not None else repr(self)
+
+
+class TxnPool:
+    """Free list of Txn records of one type"""
+
+    __slots__ = ("txn_type", "free", "limit", "allocated")
+
+    def __init__(self, txn_type, size=0, limit=64):
+        self.txn_type = txn_type
+        self.free = [txn_type() for _ in range(size)]
+        self.limit = limit  # free records kept, a burst beyond it is left to the GC
+        self.allocated = size
+
+    def acquire(self):
+        """Record with default fields, reused when one is free"""
+        if self.free:
+            txn = self.free.pop()
+            txn.reset()
+            return txn
+        self.allocated += 1
+        return self.txn_type()
+
+    def release(self, txn):
+        """Give a record back once every subscriber is done with it"""
+        if len(self.free) < self.limit:
+            self.free.append(txn)
+
+
+class TxnBatch(list):
+    """Block of transactions delivered by one analysis port write()"""
+
+    __slots__ = ("seqs",)
+
+    def __init__(self, txns=(), seqs=None):
+        super().__init__(txns)
+        self.seqs = seqs  # simulation order of the records, writers attached to a TxnMerge
+
+
+class BatchWriter:
+    """Fixed-size blocks of transactions on an analysis port, released to a pool once delivered"""
+
+    __slots__ = ("ap", "size", "pool", "block", "blocks", "merge")
+
+    def __init__(self, ap, size=0, pool=None):
+        self.ap = ap
+        self.size = size
+        self.pool = pool
+        self.block = TxnBatch()  # reused, subscribers do not keep it beyond write_batch()
+        self.blocks = 0
+        self.merge = None
+        if pool is not None and pool.limit < size:
+            pool.limit = size  # a whole block comes back at once
+
+    def write(self, txn, flush=False):
+        """Queue txn, the block goes out when full or when flush is set"""
+        if self.size <= 1:
+            self.ap.write(txn)
+            if self.pool is not None:
+                self.pool.release(txn)
+            return
+        block = self.block
+        merge = self.merge
+        if merge is not None:
+            block.seqs.append(merge.next)
+            merge.next += 1
+        block.append(txn)
+        if flush or len(block) >= self.size:
+            self.flush()
+
+    def flush(self):
+        """Deliver the pending transactions"""
+        block = self.block
+        if not block:
+            return
+        if self.merge is not None:
+            # the merge keeps the block until its records are in order, it releases them
+            self.block = TxnBatch(seqs=[])
+            self.ap.write(block)
+            self.blocks += 1
+            return
+        self.ap.write(block)
+        self.blocks += 1
+        if self.pool is not None:
+            for txn in block:
+                self.pool.release(txn)
+        block.clear()
+
+
+class TxnMerge:
+    """Simulation order across the BatchWriters feeding one scoreboard model"""
+
+    __slots__ = ("handlers", "writers", "queues", "offsets", "next")
+
+    def __init__(self, *handlers):
+        self.handlers = handlers  # per port, called with a TxnBatch run in simulation order
+        self.writers = ()
+        self.queues = [deque() for _ in handlers]  # delivered blocks not fully handled yet
+        self.offsets = [0] * len(handlers)         # first unhandled record of each head block
+        self.next = 0                              # sequence number of the next record
+
+    def attach(self, *writers):
+        """Stamp the records of the writers, one per port in handler order"""
+        self.writers = writers
+        for writer in writers:
+            writer.merge = self
+            writer.block.seqs = []
+
+    def push(self, port, block):
+        """Block delivered on port, hands on every run no attached writer can precede"""
+        if not self.writers:
+            return self.handlers[port](block)
+        self.queues[port].append(block)
+        # records still queued in a writer are older than everything it delivers later
+        limit = min((writer.block.seqs[0] for writer in self.writers if writer.block), default=self.next)
+        queues, offsets = self.queues, self.offsets
+        while True:
+            # oldest pending record, its run ends at the next record of another port
+            head, first = -1, limit
+            for i, queue in enumerate(queues):
+                if queue and queue[0].seqs[offsets[i]] < first:
+                    head, first = i, queue[0].seqs[offsets[i]]
+            if head < 0:
+                return
+            stop = limit
+            for i, queue in enumerate(queues):
+                if i != head and queue:
+                    stop = min(stop, queue[0].seqs[offsets[i]])
+            block = queues[head][0]
+            start = offsets[head]
+            end = bisect_left(block.seqs, stop, start)
+            self.handlers[head](block if start == 0 and end == len(block) else TxnBatch(block[start:end]))
+            if end < len(block):
+                offsets[head] = end
+                continue
+            queues[head].popleft()
+            offsets[head] = 0
+            pool = self.writers[head].pool
+            if pool is not None:
+                for txn in block:
+                    pool.release(txn)
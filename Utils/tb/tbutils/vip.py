@@ -0,0 +1,34 @@
+"""
+VIP Package Import
+Create Date: 18/10/2026
+
+Every pyUVM VIP lives in a folder named pyuvm, the name of the library it imports,
+and its modules reach each other through relative imports (from ..common ...). The
+testbench therefore loads the folder as a package under its own name:
+
+    import_vip("fifo_vip", os.path.dirname(os.path.abspath(__file__)))
+    from fifo_vip.tests.fifo_vip_simple_test import SimpleTest
+
+Putting the folder itself on sys.path and importing tests.fifo_vip_simple_test makes
+tests the top-level package, the relative imports inside it then fail.
+"""
+
+import importlib.util
+import os
+import sys
+
+
+def import_vip(name, path):
+    """Import the VIP folder at path (with its __init__.py) as package name"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(path, "__init__.py"),
+                                                  submodule_search_locations=[path])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[name] = package
+    try:
+        spec.loader.exec_module(package)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return package
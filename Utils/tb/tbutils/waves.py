@@ -0,0 +1,85 @@
+"""
+Waveform Control
+Create Date: 18/10/2026
+
+Runtime side of Utils/tb/cocotb/waves.mk. With WAVES=1 the generated iverilog_dump
+module holds a waves_on register; toggling it from Python calls $dumpon/$dumpoff,
+so a testbench can dump only around the interesting part of a long random run:
+
+    waves = WaveControl()
+    ...
+    waves.trigger("data mismatch")   # first call turns dumping on (WAVES_TRIGGER=1)
+
+Every method is a no-op when no dump module is compiled in (WAVES=0, other SIM).
+"""
+
+import logging
+
+import cocotb
+from cocotb.handle import SimHandle
+from cocotb.triggers import Timer
+from cocotb.utils import get_sim_time
+
+DUMP_MODULE = "iverilog_dump"
+
+
+def _find_dump_root(name=DUMP_MODULE):
+    """Handle of the dump module (a second top level), None if not compiled in"""
+    try:
+        from cocotb import simulator
+        handle = simulator.get_root_handle(name)
+    except (AttributeError, KeyError):
+        return None
+    return SimHandle(handle) if handle else None
+
+
+class WaveControl:
+    """Start/stop the waveform dump from the testbench"""
+
+    def __init__(self, post_trigger=None, units="ns", log=None):
+        self.post_trigger = post_trigger  # dump length after trigger(), None = to the end
+        self.units = units
+        self.log = log or logging.getLogger("cocotb.waves")
+        self.triggered_at = None
+        self._dump = None
+        self._looked_up = False
+
+    @property
+    def dump(self):
+        if not self._looked_up:
+            self._dump = _find_dump_root()
+            self._looked_up = True
+        return self._dump
+
+    @property
+    def enabled(self):
+        return self.dump is not None
+
+    def on(self):
+        if self.enabled:
+            self.dump.waves_on.value = 1
+
+    def off(self):
+        if self.enabled:
+            self.dump.waves_on.value = 0
+
+    async def window(self, duration, units=None):
+        """Dump for duration from now"""
+        self.on()
+        await Timer(duration, units or self.units)
+        self.off()
+
+    def trigger(self, reason=""):
+        """Turn dumping on at the first call, e.g. on the first scoreboard error"""
+        if self.triggered_at is not None:
+            return
+        self.triggered_at = get_sim_time(self.units)
+        if not self.enabled:
+            self.log.info("Trigger '%s' at %d %s, rerun with the same RANDOM_SEED and WAVES=1 WAVES_STOP=%d "
+                          "for a trace", reason, self.triggered_at, self.units, self.triggered_at)
+            return
+        self.log.info("Trigger '%s' at %d %s, waveform dump on", reason, self.triggered_at, self.units)
+        if self.post_trigger:
+            cocotb.start_soon(self.window(self.post_trigger))
+        else:
+            self.on()